@@ -12,15 +12,41 @@ from sensor_state_data import (
     Units,
 )
 
-from .parser import INKBIRDBluetoothDeviceData, Model
+from .connection import ConnectionLimiter
+from .fleet import INKBIRDFleet
+from .latency import LatencySnapshot, NotifyStats
+from .parser import (
+    AdaptivePolling,
+    DeltaUpdates,
+    INKBIRDBluetoothDeviceData,
+    Model,
+    NotifyCoalescing,
+    NotifyOverflowPolicy,
+    NotifyQueueing,
+    PersistentPolling,
+    ReconnectPolicy,
+)
+from .scheduler import PollScheduler
 
 __version__ = "1.7.0"
 
 __all__ = [
+    "AdaptivePolling",
+    "ConnectionLimiter",
+    "DeltaUpdates",
     "DeviceClass",
     "DeviceKey",
     "INKBIRDBluetoothDeviceData",
+    "INKBIRDFleet",
+    "LatencySnapshot",
     "Model",
+    "NotifyCoalescing",
+    "NotifyOverflowPolicy",
+    "NotifyQueueing",
+    "NotifyStats",
+    "PersistentPolling",
+    "PollScheduler",
+    "ReconnectPolicy",
     "SensorDescription",
     "SensorDeviceInfo",
     "SensorUpdate",
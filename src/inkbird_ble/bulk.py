@@ -0,0 +1,237 @@
+"""Vectorized decoding of captured INKBIRD advertisement payloads.
+
+For offline analysis and backfill: decode millions of same-model manufacturer
+payloads in one call instead of feeding them one by one through
+``INKBIRDBluetoothDeviceData.update``. The payloads are reinterpreted in place
+with a NumPy record dtype derived from the model's ``adv_struct`` decode plan,
+so the byte layout, scaling, ``BBQ_PROBE_NOT_CONNECTED`` handling and
+plausibility checks are the same as the per-packet decoders.
+
+Requires NumPy (``pip install inkbird-ble[bulk]``).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as err:  # pragma: no cover
+    msg = "inkbird_ble.bulk requires NumPy: pip install inkbird-ble[bulk]"
+    raise ImportError(msg) from err
+
+from .parser import (
+    BBQ_MODELS,
+    BBQ_PROBE_NOT_CONNECTED,
+    EIGHTEEN_BYTE_SENSOR_MODELS,
+    MANUFACTURER_ID_LEN,
+    MAX_PLAUSIBLE_BATTERY_PERCENTAGE,
+    MAX_PLAUSIBLE_HUMIDITY,
+    MODEL_INFO,
+    NINE_BYTE_SENSOR_MODELS,
+    SEVENTEEN_BYTE_SENSOR_MODELS,
+    Model,
+)
+
+if TYPE_CHECKING:
+    import struct
+
+    from numpy.typing import ArrayLike, NDArray
+
+__all__ = ["BulkReadings", "decode_payloads"]
+
+# ``struct`` format codes used by the advertisement decode plans and their
+# NumPy equivalents (byte order is prefixed from the struct format).
+_STRUCT_TO_DTYPE = {"b": "i1", "B": "u1", "h": "i2", "H": "u2"}
+_STRUCT_FIELD = re.compile(r"(\d*)([xbBhH])")
+# Array input is one payload per row.
+PAYLOAD_ROWS_NDIM = 2
+
+
+@dataclass(frozen=True)
+class BulkReadings:
+    """Decoded columns for a batch of payloads, one row per payload.
+
+    ``valid`` is ``False`` for payloads the per-packet decoder would drop as
+    corrupt (implausible humidity or battery); every column of such a row is
+    ``NaN``. Within a valid row ``NaN`` means the value is not reported
+    (e.g. an IBS-TH2 without a humidity sensor, an unplugged BBQ probe).
+    Columns the model never reports are ``None``. ``probes`` has one column
+    per probe.
+    """
+
+    valid: NDArray[np.bool_]
+    temperature: NDArray[np.float64] | None = None
+    humidity: NDArray[np.float64] | None = None
+    battery: NDArray[np.float64] | None = None
+    co2: NDArray[np.float64] | None = None
+    probes: NDArray[np.float64] | None = None
+
+
+def decode_payloads(
+    model: Model | str,
+    payloads: ArrayLike | bytes | bytearray | memoryview,
+    manufacturer_ids: ArrayLike | None = None,
+    payload_length: int | None = None,
+) -> BulkReadings:
+    """Decode a batch of advertisement payloads from one model.
+
+    ``payloads`` is either a 2-D ``uint8`` array with one manufacturer
+    payload (the bytes after the manufacturer id) per row, or a flat bytes
+    buffer of back-to-back payloads of ``payload_length`` bytes each
+    (defaulting to the model's advertised length). Nine-byte models
+    (IBS-TH, IBS-TH2) carry their temperature in the manufacturer id, so
+    they also need ``manufacturer_ids``, one per payload.
+    """
+    model = Model(model)
+    dev_info = MODEL_INFO[model]
+    if not dev_info.parse_adv or dev_info.adv_struct is None:
+        msg = f"{model} does not report readings in its advertisement"
+        raise ValueError(msg)
+    if payload_length is None:
+        payload_length = dev_info.message_length - MANUFACTURER_ID_LEN
+    rows = _as_rows(payloads, payload_length)
+    if rows.shape[1] < dev_info.adv_struct.size:
+        msg = (
+            f"{model} payloads must be at least {dev_info.adv_struct.size} "
+            f"bytes, got {rows.shape[1]}"
+        )
+        raise ValueError(msg)
+    fields = _record_fields(dev_info.adv_struct, rows)
+    if model in BBQ_MODELS:
+        return _decode_bbq(fields)
+    if model in NINE_BYTE_SENSOR_MODELS:
+        if manufacturer_ids is None:
+            msg = f"{model} needs manufacturer_ids: its temperature is the id"
+            raise ValueError(msg)
+        return _decode_nine_byte(model, fields, manufacturer_ids)
+    if model in EIGHTEEN_BYTE_SENSOR_MODELS:
+        return _decode_eighteen_byte(fields)
+    if TYPE_CHECKING:
+        assert model in SEVENTEEN_BYTE_SENSOR_MODELS
+    return _decode_seventeen_byte(fields)
+
+
+def _as_rows(
+    payloads: ArrayLike | bytes | bytearray | memoryview, payload_length: int
+) -> NDArray[np.uint8]:
+    """Return the payloads as a C-contiguous ``(n, payload_length)`` array."""
+    if isinstance(payloads, bytes | bytearray | memoryview):
+        flat = np.frombuffer(payloads, dtype=np.uint8)
+        if flat.size % payload_length:
+            msg = (
+                f"buffer of {flat.size} bytes is not a whole number of "
+                f"{payload_length} byte payloads"
+            )
+            raise ValueError(msg)
+        return flat.reshape(-1, payload_length)
+    rows = np.ascontiguousarray(payloads, dtype=np.uint8)
+    if rows.ndim != PAYLOAD_ROWS_NDIM:
+        msg = f"payloads must be a 2-D array, got {rows.ndim} dimensions"
+        raise ValueError(msg)
+    return rows
+
+
+def _record_fields(
+    adv_struct: struct.Struct, rows: NDArray[np.uint8]
+) -> list[NDArray[np.int64]]:
+    """Lay the decode plan over every row and return its fields as columns.
+
+    The struct format is translated into a record dtype spanning a whole row,
+    so the rows are viewed without copying; each field is then widened once
+    to ``int64`` for the arithmetic.
+    """
+    byte_order, body = adv_struct.format[0], adv_struct.format[1:]
+    formats: list[str] = []
+    offsets: list[int] = []
+    offset = 0
+    for count, code in _STRUCT_FIELD.findall(body):
+        repeat = int(count or 1)
+        if code == "x":
+            offset += repeat
+            continue
+        for _ in range(repeat):
+            dtype = np.dtype(byte_order + _STRUCT_TO_DTYPE[code])
+            formats.append(dtype.str)
+            offsets.append(offset)
+            offset += dtype.itemsize
+    names = [f"f{idx}" for idx in range(len(formats))]
+    records = rows.reshape(-1).view(
+        np.dtype(
+            {
+                "names": names,
+                "formats": formats,
+                "offsets": offsets,
+                "itemsize": rows.shape[1],
+            }
+        )
+    )
+    return [records[name].astype(np.int64) for name in names]
+
+
+def _drop_invalid(valid: NDArray[np.bool_], *columns: NDArray[np.float64]) -> None:
+    """Blank every column of the rows the per-packet decoder would drop."""
+    for column in columns:
+        column[~valid] = np.nan
+
+
+def _decode_bbq(fields: list[NDArray[np.int64]]) -> BulkReadings:
+    raw = np.column_stack(fields)
+    probes = raw / 10.0
+    probes[np.isin(raw, list(BBQ_PROBE_NOT_CONNECTED))] = np.nan
+    return BulkReadings(valid=np.ones(len(raw), dtype=np.bool_), probes=probes)
+
+
+def _decode_nine_byte(
+    model: Model, fields: list[NDArray[np.int64]], manufacturer_ids: ArrayLike
+) -> BulkReadings:
+    hum, bat = fields
+    ids = np.asarray(manufacturer_ids, dtype=np.int64)
+    if ids.shape != hum.shape:
+        msg = f"expected {len(hum)} manufacturer_ids, got {ids.size}"
+        raise ValueError(msg)
+    # The temperature is the manufacturer id read as a signed 16-bit value.
+    temperature = np.where(ids & 0x8000, ids - 0x10000, ids) / 100
+    humidity = hum / 100
+    reports_humidity = (
+        np.ones(len(hum), dtype=np.bool_) if model is Model.IBS_TH else hum != 0
+    )
+    valid = ~(reports_humidity & (humidity > MAX_PLAUSIBLE_HUMIDITY)) & (
+        bat <= MAX_PLAUSIBLE_BATTERY_PERCENTAGE
+    )
+    humidity[~reports_humidity] = np.nan
+    battery = bat.astype(np.float64)
+    _drop_invalid(valid, temperature, humidity, battery)
+    return BulkReadings(
+        valid=valid, temperature=temperature, humidity=humidity, battery=battery
+    )
+
+
+def _decode_eighteen_byte(fields: list[NDArray[np.int64]]) -> BulkReadings:
+    temp, hum, bat = fields
+    humidity = hum / 10
+    valid = (humidity <= MAX_PLAUSIBLE_HUMIDITY) & (
+        bat <= MAX_PLAUSIBLE_BATTERY_PERCENTAGE
+    )
+    humidity[hum == 0] = np.nan
+    temperature = temp / 10
+    battery = bat.astype(np.float64)
+    _drop_invalid(valid, temperature, humidity, battery)
+    return BulkReadings(
+        valid=valid, temperature=temperature, humidity=humidity, battery=battery
+    )
+
+
+def _decode_seventeen_byte(fields: list[NDArray[np.int64]]) -> BulkReadings:
+    status, temp, hum, co2_raw = fields
+    humidity = hum / 10.0
+    valid = humidity <= MAX_PLAUSIBLE_HUMIDITY
+    # Status bit 1 flags a Fahrenheit reading.
+    temperature = np.where(status & 0x02, (temp / 10.0 - 32) * 5 / 9, temp / 10.0)
+    co2 = co2_raw.astype(np.float64)
+    _drop_invalid(valid, temperature, humidity, co2)
+    return BulkReadings(
+        valid=valid, temperature=temperature, humidity=humidity, co2=co2
+    )
@@ -0,0 +1,126 @@
+"""Cap how many connections are open on each Bluetooth adapter at once."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import deque
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from .latency import LatencyHistogram
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from bleak.backends.device import BLEDevice
+
+    from .latency import LatencySnapshot
+
+# Most controllers only hold a handful of simultaneous connections; past
+# that, new attempts fail and can take the established ones down with them.
+DEFAULT_SLOTS_PER_ADAPTER = 3
+# Adapter key for devices whose details do not name one.
+DEFAULT_ADAPTER = "default"
+# BlueZ object paths look like ``/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF``.
+_BLUEZ_PATH_ADAPTER_INDEX = 3
+
+
+def adapter_key(ble_device: BLEDevice) -> str:
+    """Return the adapter or scanner a device is reached through.
+
+    Uses the ``source`` habluetooth puts in ``BLEDevice.details`` (the local
+    adapter or remote proxy), then the adapter in a BlueZ object path.
+    """
+    details = ble_device.details
+    if isinstance(details, dict):
+        if source := details.get("source"):
+            return str(source)
+        if isinstance(path := details.get("path"), str):
+            parts = path.split("/")
+            if len(parts) > _BLUEZ_PATH_ADAPTER_INDEX:
+                return parts[_BLUEZ_PATH_ADAPTER_INDEX]
+    return DEFAULT_ADAPTER
+
+
+class _AdapterSlots:
+    """Slot accounting and FIFO wait queue for one adapter."""
+
+    __slots__ = ("in_use", "wait", "waiters")
+
+    def __init__(self) -> None:
+        self.in_use = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.wait = LatencyHistogram()
+
+
+class ConnectionLimiter:
+    """Share a fixed number of connection slots per adapter.
+
+    Every poll and notify session of the parsers given the same limiter
+    holds a slot on its device's adapter (see ``adapter_key``) for as long
+    as its connection is open. Once all slots are taken, further
+    connections wait in arrival order; how long they waited is recorded
+    per adapter.
+    """
+
+    def __init__(self, slots_per_adapter: int = DEFAULT_SLOTS_PER_ADAPTER) -> None:
+        """Initialize the limiter."""
+        self._slots_per_adapter = slots_per_adapter
+        self._adapters: dict[str, _AdapterSlots] = {}
+
+    @property
+    def adapters(self) -> list[str]:
+        """Return the adapters that have been used so far."""
+        return list(self._adapters)
+
+    def in_use(self, adapter: str) -> int:
+        """Return how many slots of an adapter are held."""
+        slots = self._adapters.get(adapter)
+        return slots.in_use if slots else 0
+
+    def waiting(self, adapter: str) -> int:
+        """Return how many connections are queued for an adapter."""
+        slots = self._adapters.get(adapter)
+        return len(slots.waiters) if slots else 0
+
+    def wait_stats(self, adapter: str) -> LatencySnapshot:
+        """Return how long connections waited for a slot on an adapter."""
+        slots = self._adapters.get(adapter)
+        return (slots.wait if slots else LatencyHistogram()).snapshot()
+
+    @contextlib.asynccontextmanager
+    async def slot(self, ble_device: BLEDevice) -> AsyncIterator[None]:
+        """Hold a connection slot on the device's adapter."""
+        key = adapter_key(ble_device)
+        if (slots := self._adapters.get(key)) is None:
+            slots = self._adapters[key] = _AdapterSlots()
+        start = perf_counter()
+        if slots.in_use < self._slots_per_adapter and not slots.waiters:
+            slots.in_use += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            slots.waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was handed over just as we were cancelled.
+                    self._release(slots)
+                else:
+                    slots.waiters.remove(waiter)
+                raise
+        slots.wait.record(perf_counter() - start)
+        try:
+            yield
+        finally:
+            self._release(slots)
+
+    def _release(self, slots: _AdapterSlots) -> None:
+        """Hand the slot to the longest waiter, or free it."""
+        while slots.waiters:
+            waiter = slots.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        slots.in_use -= 1
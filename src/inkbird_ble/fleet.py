@@ -0,0 +1,168 @@
+"""Route INKBIRD advertisements to one parser per device."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from bluetooth_data_tools import monotonic_time_coarse
+
+from .parser import (
+    INKBIRDBluetoothDeviceData,
+    NegativeDetectionKey,
+    negative_detection_key,
+    remember_negative_detection,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from habluetooth import BluetoothServiceInfoBleak
+    from sensor_state_data import SensorUpdate
+
+# Upper bound on the number of devices a fleet tracks. Once reached, the
+# device heard from least recently (and not holding a connection session) is
+# dropped to make room for a new one.
+DEFAULT_MAX_DEVICES = 1024
+
+
+class INKBIRDFleet:
+    """Own one ``INKBIRDBluetoothDeviceData`` per address and route to it.
+
+    Parsers are created lazily on the first advertisement from an address
+    that is recognised as a supported model; advertisements from unsupported
+    devices never get a parser. A known address is routed with a single dict
+    lookup. Memory is capped by ``max_devices`` and idle devices can be
+    dropped with ``evict_idle``.
+    """
+
+    def __init__(
+        self,
+        max_devices: int = DEFAULT_MAX_DEVICES,
+        parser_factory: Callable[[str], INKBIRDBluetoothDeviceData] | None = None,
+    ) -> None:
+        """Initialize the fleet.
+
+        ``parser_factory`` builds the parser for a newly seen address (e.g. to
+        attach notify callbacks); it defaults to an auto-detecting parser.
+        """
+        self._max_devices = max_devices
+        self._parser_factory = parser_factory
+        self._parsers: dict[str, INKBIRDBluetoothDeviceData] = {}
+        # Last advertisement time per address, kept in least-recently-seen
+        # order so the cap can evict from the front.
+        self._last_seen: dict[str, float] = {}
+        self._negative_detections: dict[NegativeDetectionKey, None] = {}
+
+    def __len__(self) -> int:
+        """Return the number of tracked devices."""
+        return len(self._parsers)
+
+    def __contains__(self, address: object) -> bool:
+        """Return True if a parser exists for the address."""
+        return address in self._parsers
+
+    def get(self, address: str) -> INKBIRDBluetoothDeviceData | None:
+        """Return the parser for an address, if it is tracked."""
+        return self._parsers.get(address)
+
+    def update(self, service_info: BluetoothServiceInfoBleak) -> SensorUpdate | None:
+        """Route an advertisement to its device's parser.
+
+        Return the device's ``SensorUpdate``, or ``None`` when the
+        advertisement is not from a supported model.
+        """
+        address = service_info.address
+        if (parser := self._parsers.get(address)) is None:
+            return self._update_new_device(address, (service_info,))
+        self._touch(address, service_info.time)
+        return parser.update(service_info)
+
+    def update_many(
+        self, service_infos: Iterable[BluetoothServiceInfoBleak]
+    ) -> dict[str, SensorUpdate]:
+        """Route a burst of advertisements for one or many devices.
+
+        Advertisements are grouped by address (keeping their order) and each
+        group is fed to its parser's ``update_many``. Return the resulting
+        update per supported device.
+        """
+        batches: dict[str, list[BluetoothServiceInfoBleak]] = {}
+        for service_info in service_infos:
+            if (batch := batches.get(service_info.address)) is None:
+                batches[service_info.address] = [service_info]
+            else:
+                batch.append(service_info)
+        updates: dict[str, SensorUpdate] = {}
+        for address, batch in batches.items():
+            if (parser := self._parsers.get(address)) is None:
+                if (update := self._update_new_device(address, batch)) is not None:
+                    updates[address] = update
+                continue
+            self._touch(address, batch[-1].time)
+            updates[address] = parser.update_many(batch)
+        return updates
+
+    def evict_idle(
+        self, max_idle: float, now: float | None = None
+    ) -> dict[str, INKBIRDBluetoothDeviceData]:
+        """Drop devices not heard from for more than ``max_idle`` seconds.
+
+        Return the evicted parsers by address; the caller must
+        ``await parser.async_stop()`` on any with an active session.
+        """
+        if now is None:
+            now = monotonic_time_coarse()
+        idle = [
+            address
+            for address, last_seen in self._last_seen.items()
+            if now - last_seen > max_idle
+        ]
+        return {address: self._forget(address) for address in idle}
+
+    def _touch(self, address: str, seen: float) -> None:
+        """Record an advertisement time and move the address to the back."""
+        last_seen = self._last_seen
+        del last_seen[address]
+        last_seen[address] = seen
+
+    def _forget(self, address: str) -> INKBIRDBluetoothDeviceData:
+        del self._last_seen[address]
+        return self._parsers.pop(address)
+
+    def _make_room(self) -> None:
+        """Drop the least recently seen device without an active session.
+
+        A device holding a notify or persistent poll session is never dropped
+        here, since nothing would be left to stop it; if every device has one,
+        the fleet grows past ``max_devices`` by at most the number of open
+        connections.
+        """
+        parsers = self._parsers
+        for address in self._last_seen:
+            if not parsers[address].session_active:
+                self._forget(address)
+                return
+
+    def _update_new_device(
+        self, address: str, batch: Sequence[BluetoothServiceInfoBleak]
+    ) -> SensorUpdate | None:
+        """Create a parser for an unseen address if it is a supported model."""
+        negative_detections = self._negative_detections
+        negative_keys = [negative_detection_key(service_info) for service_info in batch]
+        if all(key in negative_detections for key in negative_keys):
+            return None
+        parser = (
+            self._parser_factory(address)
+            if self._parser_factory
+            else INKBIRDBluetoothDeviceData()
+        )
+        update = parser.update_many(batch)
+        if parser.device_type is None:
+            for key in dict.fromkeys(negative_keys):
+                remember_negative_detection(negative_detections, key)
+            return None
+        if len(self._parsers) >= self._max_devices:
+            self._make_room()
+        self._parsers[address] = parser
+        self._last_seen[address] = batch[-1].time
+        return update
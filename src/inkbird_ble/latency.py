@@ -0,0 +1,103 @@
+"""Fixed-size latency histograms for the notify path."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# Bucket ``i`` counts durations of ``[2 ** (i - 1), 2 ** i)`` microseconds
+# (bucket 0 is under a microsecond); the last bucket is open-ended and takes
+# everything from ~4.2 s up. Recording is a bit_length and a list increment,
+# so it is cheap enough for every notification.
+BUCKET_COUNT = 24
+
+
+@dataclass(frozen=True)
+class LatencySnapshot:
+    """Point-in-time copy of a ``LatencyHistogram`` (durations in seconds)."""
+
+    count: int
+    total: float
+    max: float
+    buckets: tuple[int, ...]
+
+    @property
+    def mean(self) -> float:
+        """Return the mean duration, or 0 when nothing was recorded."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Return an upper bound for the given percentile (0-100).
+
+        The bound is the top of the bucket the percentile falls in, capped at
+        the largest duration recorded.
+        """
+        if not self.count:
+            return 0.0
+        rank = percent / 100 * self.count
+        seen = 0
+        for idx, bucket in enumerate(self.buckets[:-1]):
+            seen += bucket
+            if seen >= rank:
+                return min(2**idx / 1_000_000, self.max)
+        # The open-ended last bucket has no upper edge.
+        return self.max
+
+
+class LatencyHistogram:
+    """Log2-bucketed histogram of durations with a fixed memory footprint."""
+
+    __slots__ = ("_buckets", "_count", "_max", "_total")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._buckets = [0] * BUCKET_COUNT
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one duration."""
+        micros = int(seconds * 1_000_000)
+        self._buckets[min(micros.bit_length(), BUCKET_COUNT - 1)] += 1
+        self._count += 1
+        self._total += seconds
+        self._max = max(self._max, seconds)
+
+    def snapshot(self) -> LatencySnapshot:
+        """Return a copy of the current state."""
+        return LatencySnapshot(
+            self._count, self._total, self._max, tuple(self._buckets)
+        )
+
+
+@dataclass(frozen=True)
+class NotifyStats:
+    """Latency of each notify stage for one device.
+
+    ``queue`` is receipt by the notification callback to the start of
+    decoding (the time spent in the notify queue, near zero when decoding
+    inline), ``decode`` is the model handler excluding ``update_callback``,
+    and ``callback`` is ``update_callback`` itself.
+    """
+
+    queue: LatencySnapshot
+    decode: LatencySnapshot
+    callback: LatencySnapshot
+
+
+class NotifyLatency:
+    """The per-device histograms behind ``NotifyStats``."""
+
+    __slots__ = ("callback", "decode", "queue")
+
+    def __init__(self) -> None:
+        """Initialize empty histograms for every stage."""
+        self.queue = LatencyHistogram()
+        self.decode = LatencyHistogram()
+        self.callback = LatencyHistogram()
+
+    def snapshot(self) -> NotifyStats:
+        """Return a copy of every stage's histogram."""
+        return NotifyStats(
+            self.queue.snapshot(), self.decode.snapshot(), self.callback.snapshot()
+        )
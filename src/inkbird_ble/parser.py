@@ -11,11 +11,14 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import math
+import random
 import struct
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, StrEnum, auto
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any, ClassVar
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 from uuid import UUID
 
 from bleak.exc import BleakCharacteristicNotFoundError, BleakError
@@ -25,13 +28,31 @@ from bluetooth_data_tools import (
     short_address,
 )
 from bluetooth_sensor_state_data import BluetoothData, SensorUpdate
-from sensor_state_data import SensorLibrary, Units
+from sensor_state_data import (
+    DeviceKey,
+    SensorDescription,
+    SensorLibrary,
+    SensorValue,
+    Units,
+)
+
+from .latency import NotifyLatency
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine, Iterable
+    from collections.abc import Callable, Coroutine, Iterable, Mapping
 
     from bleak import BleakGATTCharacteristic, BLEDevice
     from habluetooth import BluetoothServiceInfoBleak
+    from sensor_state_data import BinarySensorValue, DeviceClass
+
+    from .connection import ConnectionLimiter
+    from .latency import NotifyStats
+
+    # A notification waiting for the consumer task: the sender, a copy of the
+    # bytes and when the callback received it.
+    _QueuedNotification = tuple[BleakGATTCharacteristic, bytearray, float]
+
+    _ValueT = TypeVar("_ValueT", SensorValue, BinarySensorValue)
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -62,6 +83,167 @@ class ModelType(Enum):
     SENSOR = auto()
 
 
+@dataclass(frozen=True)
+class ManufacturerDataRule:
+    """Detection rule for a model identified by its manufacturer data.
+
+    The advertisement matches when it carries ``manufacturer_id`` and that
+    entry's payload starts with ``prefix`` and ends with ``suffix``. When set,
+    ``message_length`` (2-byte id + payload) and ``service_uuid`` must match
+    too.
+    """
+
+    manufacturer_id: int
+    prefix: bytes = b""
+    suffix: bytes = b""
+    message_length: int | None = None
+    service_uuid: UUID | None = None
+
+
+@dataclass(frozen=True)
+class ProbeSensor:
+    """Prebuilt identity of one probe temperature sensor.
+
+    Shared by every parser so the probe decoders never format the key/name
+    strings or rebuild the ``DeviceKey``/``SensorDescription`` per packet.
+    """
+
+    key: str
+    name: str
+    device_key: DeviceKey
+    description: SensorDescription
+
+
+@dataclass(frozen=True)
+class NotifyCoalescing:
+    """How notify updates are coalesced before reaching ``update_callback``.
+
+    At most one update is emitted per ``min_interval`` seconds; notifications
+    arriving inside the window are merged and the latest state is flushed when
+    the window closes. A value only counts as changed once it moves by at
+    least the ``deadbands`` entry for its device class (any change for classes
+    without one), and a notification that changes nothing emits nothing.
+    """
+
+    min_interval: float = 0.0
+    deadbands: Mapping[DeviceClass, float] = field(default_factory=dict)
+
+
+class NotifyOverflowPolicy(StrEnum):
+    """What a full notify queue does with a new notification."""
+
+    # Discard the oldest queued notification to make room.
+    DROP_OLDEST = "drop_oldest"
+    # Discard everything queued; only the newest notification is decoded.
+    # Suits models whose every notification is a full snapshot (IAM-T1,
+    # IDT-34c-B), not the IHT-2PB whose frames carry one probe each.
+    LATEST_WINS = "latest_wins"
+
+
+@dataclass(frozen=True)
+class NotifyQueueing:
+    """Decode notifications on a consumer task instead of in the callback.
+
+    The bleak notification callback only copies the bytes into a bounded
+    queue of ``maxsize`` entries, so a slow ``update_callback`` never stalls
+    the BLE stack's event delivery. ``policy`` decides what is dropped when
+    the consumer falls behind; drops are counted in ``notify_overflows``.
+    """
+
+    maxsize: int = 32
+    policy: NotifyOverflowPolicy = NotifyOverflowPolicy.DROP_OLDEST
+
+
+@dataclass(frozen=True)
+class PersistentPolling:
+    """Keep a GATT-poll model connected and re-read it on a schedule.
+
+    ``async_start`` then holds one connection open and reads the data
+    characteristics every ``interval`` seconds, sending each result to
+    ``update_callback`` like a notification; ``poll_needed`` reports
+    ``False`` while the session runs. A lost connection goes through the
+    notify reconnect path (``ReconnectPolicy``). Only applies to the models
+    in ``GATT_POLL_MODELS``.
+    """
+
+    interval: float = 10.0
+
+
+@dataclass(frozen=True)
+class AdaptivePolling:
+    """Derive when a poll is due from the device's own advertisement cadence.
+
+    The gap between advertisements is tracked as an exponentially weighted
+    moving average (``alpha`` is the weight of each new gap). A device whose
+    readings come in its advertisements is then due for a poll once its
+    latest advertisement is older than ``multiplier`` times that average,
+    kept within ``min_interval`` and ``max_interval`` seconds. Until a gap
+    has been seen ``MIN_POLL_INTERVAL`` applies. Poll-only models are not
+    affected.
+    """
+
+    alpha: float = 0.2
+    multiplier: float = 3.0
+    min_interval: float = 60.0
+    max_interval: float = 1800.0
+
+
+@dataclass(frozen=True)
+class DeltaUpdates:
+    """Return only the entities that changed since the last update.
+
+    Each ``SensorUpdate`` then carries just the sensor and binary sensor
+    values whose native value differs from the one last returned, with their
+    descriptions; ``devices`` and ``events`` are passed through unchanged.
+    The first update, and one every ``full_snapshot_interval`` seconds after
+    it, carries the full state instead so a consumer that lost track can
+    resynchronize.
+    """
+
+    full_snapshot_interval: float = 300.0
+
+
+@dataclass(frozen=True)
+class ReconnectPolicy:
+    """When the notify loop reconnects after a session ends or fails.
+
+    After ``n`` consecutive failed connection attempts the loop waits
+    ``initial_delay * multiplier ** n`` seconds, capped at ``max_delay`` and
+    shortened by up to ``jitter`` (a fraction) so devices that dropped out
+    together do not retry in lockstep. A successful connection resets the
+    count. With ``wait_for_advertisement`` the loop then waits (up to
+    ``max_delay``) for the next advertisement from the device and connects
+    right after it, so few attempts are spent on a device that is out of
+    range; this relies on the caller feeding every advertisement to
+    ``update``. Subclass and override ``delay`` for a different schedule.
+    """
+
+    initial_delay: float = 5.0
+    max_delay: float = 300.0
+    multiplier: float = 2.0
+    jitter: float = 0.2
+    wait_for_advertisement: bool = False
+
+    def delay(self, failures: int) -> float:
+        """Return the wait before the next attempt after ``failures`` failures."""
+        delay = min(self.max_delay, self.initial_delay * self.multiplier**failures)
+        return delay * (1 - self.jitter * random.random())  # noqa: S311
+
+
+@dataclass(frozen=True)
+class CharacteristicRead:
+    """One characteristic of a model's poll ``read_set``.
+
+    The first ``length`` bytes of the read go into the poll buffer. A
+    characteristic that is not ``required`` is skipped when the device does
+    not have it.
+    """
+
+    uuid: UUID
+    length: int
+    required: bool = True
+
+
 @dataclass(frozen=True)
 class ModelInfo:
     """Model information."""
@@ -70,7 +252,6 @@ class ModelInfo:
     model_type: ModelType
     local_name: str | None
     message_length: int
-    unpacker: Callable[[bytes], tuple[int, ...]]
     service_uuid: UUID | None
     characteristic_uuid: UUID | None
     notify_uuid: UUID | None
@@ -87,6 +268,25 @@ class ModelInfo:
     # for them. The advertisement already carries every field a poll would read.
     # See https://github.com/Bluetooth-Devices/inkbird-ble/issues/116
     supports_polling: bool = True
+    # Decode plan for the advertisement: a single precompiled struct laid over
+    # the manufacturer payload that yields every field the model's decoder
+    # needs in one ``unpack_from`` call. ``None`` for models whose readings do
+    # not come from the advertisement (notify / GATT-poll only).
+    adv_struct: struct.Struct | None = None
+    # Detection by local-name prefix, for models whose advertised name carries
+    # a per-unit suffix (e.g. ``Ink@IHT-2PB#<suffix>``). Lower-case.
+    local_name_prefix: str | None = None
+    # Detection by manufacturer data, for models that advertise a generic or
+    # shared local name.
+    manufacturer_data_rule: ManufacturerDataRule | None = None
+    # Probe temperature sensors in probe order, for models that report one
+    # temperature per probe (BBQ, IHT-2PB and IDT-34c-B).
+    probe_sensors: tuple[ProbeSensor, ...] = ()
+    # Characteristics a GATT poll reads, for models that spread one reading
+    # over several (``characteristic_uuid`` alone otherwise). They are read
+    # concurrently and concatenated in this order into the buffer the poll
+    # decoder expects.
+    read_set: tuple[CharacteristicRead, ...] = ()
 
 
 INKBIRD_SERVICE_UUID = UUID("0000fff0-0000-1000-8000-00805f9b34fb")
@@ -96,39 +296,74 @@ EIGHTEEN_BYTE_SENSOR_DATA_CHARACTERISTIC_UUID = UUID(
 NINE_BYTE_SENSOR_DATA_CHARACTERISTIC_UUID = UUID("0000fff2-0000-1000-8000-00805f9b34fb")
 IAM_T1_CHARACTERISTIC_UUID = UUID("0000fff4-0000-1000-8000-00805f9b34fb")
 
-INKBIRD_UNPACK = struct.Struct("<hH").unpack
+# Temperature and humidity in a GATT poll read (at offset 5 of the 18-byte
+# models' read, at the start of the 9-byte models').
+POLL_TEMP_HUM_UNPACK = struct.Struct("<hH").unpack_from
 
-# IAM-T1 notify packet identifiers
+# IAM-T1 notify packet identifiers (bytes 1-2 of every notification).
 IAM_T1_NOTIFY_DATA_PREFIX = b"\xaa\x01"
 IAM_T1_NOTIFY_STATE_PREFIX = b"\xaa\x05"
+IAM_T1_NOTIFY_HEADER_LENGTH = 3
 
 # IAM-T1 notification packet lengths (header + payload).
 IAM_T1_STATE_NOTIFY_LENGTH = 12
 IAM_T1_DATA_NOTIFY_LENGTH = 16
 
+# IAM-T1 data notification: 4 header bytes, the temperature sign nibble, then
+# unsigned big-endian temperature, humidity, CO2 and pressure.
+IAM_T1_DATA_UNPACK = struct.Struct(">4xBHHHH").unpack_from
+# Low nibble set when the device displays Fahrenheit.
+IAM_T1_STATE_UNIT_OFFSET = 10
+
 # Advertisement message lengths (2-byte manufacturer id prefix + payload).
 NINE_BYTE_MESSAGE_LENGTH = 9
 SEVENTEEN_BYTE_MESSAGE_LENGTH = 17
 EIGHTEEN_BYTE_MESSAGE_LENGTH = 18
 
+# The decoders read straight from the manufacturer payload (the bytes after the
+# 2-byte manufacturer id) rather than rebuilding the ``id + payload`` message,
+# so every payload offset is the historical message offset minus this prefix.
+MANUFACTURER_ID_LEN = 2
+
+# BBQ payloads carry an 8-byte header followed by one signed little-endian
+# 16-bit temperature per probe.
+BBQ_PROBES_OFFSET = 8
+BBQ_PROBE_SIZE = 2
+
+# Advertisement decode plans (see ``ModelInfo.adv_struct``). Each struct covers
+# the payload up to its last decoded field; trailing bytes are never read, so a
+# longer payload still decodes while a truncated one raises ``struct.error``
+# exactly where the old index/slice decode would have failed.
+#
+# Nine-byte: humidity (unsigned LE), 3 unknown bytes, battery. The temperature
+# is the manufacturer id itself, so it is not part of the payload.
+NINE_BYTE_ADV_STRUCT = struct.Struct("<H3xB")
+# Eighteen-byte: 4 bytes of MAC, temperature (signed LE), humidity (unsigned
+# LE), battery.
+EIGHTEEN_BYTE_ADV_STRUCT = struct.Struct("<4xhHB")
+# IAM-T2 (seventeen-byte): 6 bytes of MAC, 1 unknown byte, status byte, then
+# big-endian temperature (signed), humidity and CO2.
+IAM_T2_ADV_STRUCT = struct.Struct(">7xBhHH")
+
 # Minimum byte counts a connectable GATT poll read must return before it can be
 # decoded. A truncated read (BLE flakiness, a short MTU) would otherwise raise
-# struct.error / IndexError while slicing the payload. The nine-byte path
-# unpacks payload[0:4]; the eighteen-byte path slices payload[5:9] and indexes
+# struct.error / IndexError while decoding the payload. The nine-byte path
+# unpacks bytes 0-3; the eighteen-byte path unpacks bytes 5-8 and indexes
 # payload[9]. See ``async_poll``.
 NINE_BYTE_POLL_MIN_READ_LEN = 4
 EIGHTEEN_BYTE_POLL_MIN_READ_LEN = 10
 
 # Manufacturer-data IDs used to disambiguate models that advertise a generic
 # or shared local name. These are the integer keys of the manufacturer_data
-# dict (Bluetooth SIG company identifiers). Endianness only matters when the
-# key is serialized to its 2-byte wire form, which the code does explicitly
-# with int(...).to_bytes(2, "little").
+# dict (Bluetooth SIG company identifiers). Endianness only matters for the
+# nine-byte models, which encode their temperature in the key's 2-byte wire
+# form.
 GENERIC_18_MANUFACTURER_ID = 9289
 IAM_T1_MANUFACTURER_ID = 12628
 IAM_T2_MANUFACTURER_ID = 12884
 
-# IAM-T2 advertises a payload whose MAC bytes start with 00:62.
+# IAM-T2 advertises a payload whose MAC bytes (the start of the manufacturer
+# payload) start with 00:62.
 IAM_T2_MAC_PREFIX = b"\x00\x62"
 
 # IHT-2PB GATT support. This probe thermometer does not broadcast its readings;
@@ -197,6 +432,7 @@ INT_11I_B_SERVICE_UUID = UUID("0000ff00-0000-1000-8000-00805f9b34fb")
 INT_11I_B_TEMP_CHARACTERISTIC_UUID = UUID("0000ff01-0000-1000-8000-00805f9b34fb")
 INT_11I_B_BATTERY_CHARACTERISTIC_UUID = UUID("00002a19-0000-1000-8000-00805f9b34fb")
 INT_11I_B_TEMP_READ_LEN = 2
+INT_11I_B_BATTERY_READ_LEN = 2
 INT_11I_B_FULL_READ_LEN = 4
 INT_11I_B_STATION_BATTERY_INDEX = 2
 INT_11I_B_PROBE_BATTERY_INDEX = 3
@@ -223,7 +459,47 @@ IDT_34C_B_NOTIFY_UUID = UUID("0000ff01-0000-1000-8000-00805f9b34fb")
 IDT_34C_B_BATTERY_UUID = UUID("00002a19-0000-1000-8000-00805f9b34fb")
 IDT_34C_B_NO_PROBE = 0x7FFE
 IDT_34C_B_PROBE_COUNT = 6
+# The whole ff01 frame in one call: six probes then the status byte. Its
+# meaning is undocumented (0x7F in the capture above), so it is passed through
+# raw as ``notify_status``.
+IDT_34C_B_UNPACK = struct.Struct("<6hB").unpack
 IDT_34C_B_DATA_LENGTH = 13  # 6 probes (12 bytes) + 1 trailing status byte
+# Celsius (rounded to 0.1) for every raw Fahrenheit x 10 reading from -40 F to
+# 600 F, which spans the probes' rated range; anything outside it is still
+# converted arithmetically. Indexed by ``raw - IDT_34C_B_CELSIUS_MIN_RAW``.
+IDT_34C_B_CELSIUS_MIN_RAW = -400
+IDT_34C_B_CELSIUS_MAX_RAW = 6000
+IDT_34C_B_CELSIUS = tuple(
+    round((raw / 10.0 - 32) * 5 / 9, 1)
+    for raw in range(IDT_34C_B_CELSIUS_MIN_RAW, IDT_34C_B_CELSIUS_MAX_RAW + 1)
+)
+
+# The most probes any supported model has (iBBQ-6, IDT-34c-B).
+MAX_PROBES = 6
+# ``SensorData.precision`` when no rounding was requested.
+NO_PRECISION = -1
+
+
+def _probe_sensor(num: int) -> ProbeSensor:
+    """Build the sensor identity ``update_predefined_sensor`` would for a probe."""
+    base = SensorLibrary.TEMPERATURE__CELSIUS
+    device_key = DeviceKey(f"temperature_probe_{num}")
+    return ProbeSensor(
+        key=device_key.key,
+        name=f"Temperature Probe {num}",
+        device_key=device_key,
+        description=SensorDescription(
+            device_key=device_key,
+            device_class=base.device_class,
+            native_unit_of_measurement=base.native_unit_of_measurement,
+        ),
+    )
+
+
+# Probe sensors are built once at import and sliced per model into
+# ``ModelInfo.probe_sensors``; a 6-probe thermometer streaming at 1 Hz would
+# otherwise allocate a dozen strings plus key and description objects a second.
+PROBE_SENSORS = tuple(_probe_sensor(num) for num in range(1, MAX_PROBES + 1))
 
 MODEL_INFO = {
     Model.IBBQ_1: ModelInfo(
@@ -231,95 +507,104 @@ MODEL_INFO = {
         model_type=ModelType.BBQ,
         local_name=None,
         message_length=12,
-        unpacker=struct.Struct("<h").unpack,
         service_uuid=None,
         characteristic_uuid=None,
         notify_uuid=None,
         use_local_name_for_device=True,
         parse_adv=True,
+        adv_struct=struct.Struct("<8xh"),
+        probe_sensors=PROBE_SENSORS[:1],
     ),
     Model.IBBQ_2: ModelInfo(
         name="iBBQ-2",
         model_type=ModelType.BBQ,
         local_name=None,
         message_length=14,
-        # Signed like the other BBQ models: an unsigned ``<HH`` turns a
-        # legitimate sub-zero reading (e.g. -5.0C -> 0xFFCE) into ~6548C, the
-        # same #155 wraparound family. Signed parsing keeps the 0xFFFF "no
-        # probe" sentinel as -1, which BBQ_PROBE_NOT_CONNECTED still drops.
-        unpacker=struct.Struct("<hh").unpack,
         service_uuid=None,
         characteristic_uuid=None,
         notify_uuid=None,
         use_local_name_for_device=True,
         parse_adv=True,
+        # Signed like the other BBQ models: an unsigned ``HH`` turns a
+        # legitimate sub-zero reading (e.g. -5.0C -> 0xFFCE) into ~6548C, the
+        # same #155 wraparound family. Signed parsing keeps the 0xFFFF "no
+        # probe" sentinel as -1, which BBQ_PROBE_NOT_CONNECTED still drops.
+        adv_struct=struct.Struct("<8x2h"),
+        probe_sensors=PROBE_SENSORS[:2],
     ),
     Model.IBBQ_4: ModelInfo(
         name="iBBQ-4",
         model_type=ModelType.BBQ,
         local_name=None,
         message_length=18,
-        unpacker=struct.Struct("<hhhh").unpack,
         service_uuid=None,
         characteristic_uuid=None,
         notify_uuid=None,
         use_local_name_for_device=True,
         parse_adv=True,
+        adv_struct=struct.Struct("<8x4h"),
+        probe_sensors=PROBE_SENSORS[:4],
     ),
     Model.IBBQ_6: ModelInfo(
         name="iBBQ-6",
         model_type=ModelType.BBQ,
         local_name=None,
         message_length=22,
-        unpacker=struct.Struct("<hhhhhh").unpack,
         service_uuid=None,
         characteristic_uuid=None,
         notify_uuid=None,
         use_local_name_for_device=True,
         parse_adv=True,
+        adv_struct=struct.Struct("<8x6h"),
+        probe_sensors=PROBE_SENSORS[:6],
     ),
     Model.IBS_TH: ModelInfo(
         name="IBS-TH",
         model_type=ModelType.SENSOR,
         local_name="sps",
         message_length=9,
-        unpacker=INKBIRD_UNPACK,
         service_uuid=INKBIRD_SERVICE_UUID,
         characteristic_uuid=NINE_BYTE_SENSOR_DATA_CHARACTERISTIC_UUID,
         notify_uuid=None,
         use_local_name_for_device=False,
         parse_adv=True,
+        adv_struct=NINE_BYTE_ADV_STRUCT,
     ),
     Model.IBS_TH2: ModelInfo(
         name="IBS-TH2/P01B",
         model_type=ModelType.SENSOR,
         local_name="tps",
         message_length=9,
-        unpacker=INKBIRD_UNPACK,
         service_uuid=INKBIRD_SERVICE_UUID,
         characteristic_uuid=NINE_BYTE_SENSOR_DATA_CHARACTERISTIC_UUID,
         notify_uuid=None,
         use_local_name_for_device=False,
         parse_adv=True,
+        adv_struct=NINE_BYTE_ADV_STRUCT,
     ),
     Model.GENERIC_18: ModelInfo(
         name="Unknown 18-byte model",
         model_type=ModelType.SENSOR,
         local_name="unknown",
         message_length=18,
-        unpacker=INKBIRD_UNPACK,
         service_uuid=INKBIRD_SERVICE_UUID,
         characteristic_uuid=EIGHTEEN_BYTE_SENSOR_DATA_CHARACTERISTIC_UUID,
         notify_uuid=None,
         use_local_name_for_device=False,
         parse_adv=True,
+        adv_struct=EIGHTEEN_BYTE_ADV_STRUCT,
+        manufacturer_data_rule=ManufacturerDataRule(
+            manufacturer_id=GENERIC_18_MANUFACTURER_ID,
+            suffix=b"\x00\x00\x00",
+            message_length=EIGHTEEN_BYTE_MESSAGE_LENGTH,
+            service_uuid=INKBIRD_SERVICE_UUID,
+        ),
     ),
     Model.IBS_P02B: ModelInfo(
         name="IBS-P02B",
         model_type=ModelType.SENSOR,
         local_name="ibs-p02b",
         message_length=18,
-        unpacker=INKBIRD_UNPACK,
         service_uuid=INKBIRD_SERVICE_UUID,
         characteristic_uuid=EIGHTEEN_BYTE_SENSOR_DATA_CHARACTERISTIC_UUID,
         notify_uuid=None,
@@ -328,66 +613,75 @@ MODEL_INFO = {
         # Advertisement-only: connecting to poll this probe wedges its firmware
         # until a battery reset (#116). Every field is already in the broadcast.
         supports_polling=False,
+        adv_struct=EIGHTEEN_BYTE_ADV_STRUCT,
     ),
     Model.ITH_11_B: ModelInfo(
         name="ITH-11-B",
         model_type=ModelType.SENSOR,
         local_name="ith-11-b",
         message_length=18,
-        unpacker=INKBIRD_UNPACK,
         service_uuid=INKBIRD_SERVICE_UUID,
         characteristic_uuid=EIGHTEEN_BYTE_SENSOR_DATA_CHARACTERISTIC_UUID,
         notify_uuid=None,
         use_local_name_for_device=False,
         parse_adv=True,
+        adv_struct=EIGHTEEN_BYTE_ADV_STRUCT,
     ),
     Model.ITH_13_B: ModelInfo(
         name="ITH-13-B",
         model_type=ModelType.SENSOR,
         local_name="ith-13-b",
         message_length=18,
-        unpacker=INKBIRD_UNPACK,
         service_uuid=INKBIRD_SERVICE_UUID,
         characteristic_uuid=EIGHTEEN_BYTE_SENSOR_DATA_CHARACTERISTIC_UUID,
         notify_uuid=None,
         use_local_name_for_device=False,
         parse_adv=True,
+        adv_struct=EIGHTEEN_BYTE_ADV_STRUCT,
     ),
     Model.ITH_21_B: ModelInfo(
         name="ITH-21-B",
         model_type=ModelType.SENSOR,
         local_name="ith-21-b",
         message_length=18,
-        unpacker=INKBIRD_UNPACK,
         service_uuid=INKBIRD_SERVICE_UUID,
         characteristic_uuid=EIGHTEEN_BYTE_SENSOR_DATA_CHARACTERISTIC_UUID,
         notify_uuid=None,
         use_local_name_for_device=False,
         parse_adv=True,
+        adv_struct=EIGHTEEN_BYTE_ADV_STRUCT,
     ),
     Model.IAM_T1: ModelInfo(
         name="IAM-T1",
         model_type=ModelType.SENSOR,
         local_name="ink@iam-t1",
         message_length=17,
-        unpacker=INKBIRD_UNPACK,
         service_uuid=UUID("0000ffe0-0000-1000-8000-00805f9b34fb"),
         characteristic_uuid=None,
         notify_uuid=UUID("0000ffe4-0000-1000-8000-00805f9b34fb"),
         use_local_name_for_device=False,
         parse_adv=False,
+        # AC-6200
+        manufacturer_data_rule=ManufacturerDataRule(
+            manufacturer_id=IAM_T1_MANUFACTURER_ID, prefix=b"AC-6200"
+        ),
     ),
     Model.IAM_T2: ModelInfo(
         name="IAM-T2",
         model_type=ModelType.SENSOR,
         local_name="ink@iam-t2",
         message_length=17,
-        unpacker=INKBIRD_UNPACK,
         service_uuid=None,
         characteristic_uuid=None,
         notify_uuid=None,
         use_local_name_for_device=False,
         parse_adv=True,
+        adv_struct=IAM_T2_ADV_STRUCT,
+        manufacturer_data_rule=ManufacturerDataRule(
+            manufacturer_id=IAM_T2_MANUFACTURER_ID,
+            prefix=IAM_T2_MAC_PREFIX,  # MAC starts with 00:62
+            message_length=SEVENTEEN_BYTE_MESSAGE_LENGTH,
+        ),
     ),
     Model.IHT_2PB: ModelInfo(
         name="IHT-2PB",
@@ -396,13 +690,17 @@ MODEL_INFO = {
         # No usable advertisement payload — readings arrive over notifications.
         # message_length=0 keeps it out of the adv length / poll dispatch sets.
         message_length=0,
-        unpacker=INKBIRD_UNPACK,
         service_uuid=IHT_2PB_SERVICE_UUID,
         characteristic_uuid=None,
         notify_uuid=IHT_2PB_NOTIFY_UUID,
         use_local_name_for_device=False,
         parse_adv=False,
         notify_init_writes=IHT_2PB_INIT_WRITES,
+        # The IHT-2PB advertises as "Ink@IHT-2PB#<suffix>" and carries no
+        # usable payload; identify it by name prefix and let the notify flow
+        # (async_start) read its probes over GATT.
+        local_name_prefix="ink@iht-2pb",
+        probe_sensors=PROBE_SENSORS[:3],
     ),
     Model.INT_11P_B: ModelInfo(
         name="INT-11P-B",
@@ -412,7 +710,6 @@ MODEL_INFO = {
         # characteristic. message_length=0 keeps it out of the adv length /
         # passive dispatch sets; polling is enabled via GATT_POLL_MODELS.
         message_length=0,
-        unpacker=INKBIRD_UNPACK,
         service_uuid=INKBIRD_SERVICE_UUID,
         characteristic_uuid=INT_11P_B_DATA_CHARACTERISTIC_UUID,
         notify_uuid=None,
@@ -428,12 +725,22 @@ MODEL_INFO = {
         # of the adv length / passive dispatch sets; polling is enabled via
         # GATT_POLL_MODELS.
         message_length=0,
-        unpacker=INKBIRD_UNPACK,
         service_uuid=INT_11I_B_SERVICE_UUID,
         characteristic_uuid=INT_11I_B_TEMP_CHARACTERISTIC_UUID,
         notify_uuid=None,
         use_local_name_for_device=False,
         parse_adv=False,
+        # Temperature (2 bytes), then the station and probe battery levels.
+        read_set=(
+            CharacteristicRead(
+                INT_11I_B_TEMP_CHARACTERISTIC_UUID, INT_11I_B_TEMP_READ_LEN
+            ),
+            CharacteristicRead(
+                INT_11I_B_BATTERY_CHARACTERISTIC_UUID,
+                INT_11I_B_BATTERY_READ_LEN,
+                required=False,
+            ),
+        ),
     ),
     Model.IDT_34C_B: ModelInfo(
         name="IDT-34c-B",
@@ -443,15 +750,14 @@ MODEL_INFO = {
         # over the ff01 notify characteristic. message_length=0 keeps it out of
         # the adv length / poll dispatch sets; it is matched by name via
         # NO_ADV_NOTIFY_NAMES before the manufacturer-data guard in
-        # _start_update. The unpacker is unused (notify-only) but ModelInfo
-        # requires one, so the shared placeholder is reused (cf. IHT-2PB).
+        # _start_update.
         message_length=0,
-        unpacker=INKBIRD_UNPACK,
         service_uuid=IDT_34C_B_SERVICE_UUID,
         characteristic_uuid=None,
         notify_uuid=IDT_34C_B_NOTIFY_UUID,
         use_local_name_for_device=False,
         parse_adv=False,
+        probe_sensors=PROBE_SENSORS[:IDT_34C_B_PROBE_COUNT],
     ),
 }
 
@@ -461,6 +767,44 @@ INKBIRD_NAMES = {
     if dev_info.local_name is not None
 }
 
+# Detection index, built once from the declarative ``ModelInfo`` rules so
+# detection costs the same however many models are added. See
+# ``detect_model`` for the order the tables are consulted in.
+#
+# A model matched by exact local name must also advertise the service of one
+# of the named models (or a sensor message length) to guard against name
+# collisions.
+NAMED_MODEL_SERVICE_UUIDS = frozenset(
+    str(dev_info.service_uuid)
+    for dev_info in MODEL_INFO.values()
+    if dev_info.local_name is not None and dev_info.service_uuid is not None
+)
+# Local-name prefix -> model, bucketed by prefix length so a lookup is one
+# slice and one dict probe per distinct prefix length.
+INKBIRD_NAME_PREFIXES = {
+    prefix_len: {
+        dev_info.local_name_prefix: dev_type
+        for dev_type, dev_info in MODEL_INFO.items()
+        if dev_info.local_name_prefix is not None
+        and len(dev_info.local_name_prefix) == prefix_len
+    }
+    for prefix_len in {
+        len(dev_info.local_name_prefix)
+        for dev_info in MODEL_INFO.values()
+        if dev_info.local_name_prefix is not None
+    }
+}
+# Manufacturer id -> (model, rule, required service UUIDs).
+MANUFACTURER_ID_RULES = {
+    rule.manufacturer_id: (
+        dev_type,
+        rule,
+        frozenset((str(rule.service_uuid),) if rule.service_uuid else ()),
+    )
+    for dev_type, dev_info in MODEL_INFO.items()
+    if (rule := dev_info.manufacturer_data_rule) is not None
+}
+
 BBQ_MODELS = {
     model_type
     for model_type, model_info in MODEL_INFO.items()
@@ -519,6 +863,20 @@ NO_ADV_NOTIFY_NAMES = {
 
 MANUFACTURER_DATA_ID_EXCLUDES = {2}
 
+# Manufacturer ids whose payload *content* takes part in detection (see
+# ``ManufacturerDataRule``). An advertisement carrying one of them can flip
+# from "unknown" to a match without its shape changing, so it is never
+# remembered as a negative detection.
+PAYLOAD_MATCHED_MANUFACTURER_IDS = frozenset(MANUFACTURER_ID_RULES)
+
+# Upper bound on the advertisement shapes a parser remembers as "not an
+# INKBIRD". Most traffic that reaches the parser in a busy RF environment is
+# from unsupported devices, so a miss is remembered and short-circuited on
+# the next identical advertisement; the oldest entry is evicted once full.
+MAX_NEGATIVE_DETECTION_CACHE_SIZE = 256
+# (local name, manufacturer ids, payload lengths, service UUIDs)
+NegativeDetectionKey = tuple[str, tuple[int, ...], tuple[int, ...], tuple[str, ...]]
+
 MIN_POLL_INTERVAL = 330.0
 
 
@@ -527,31 +885,49 @@ async def async_connect_action(
     action: Callable[
         [BleakClientWithServiceCache], Coroutine[None, None, bytes | None]
     ],
+    limiter: ConnectionLimiter | None = None,
 ) -> bytes | None:
-    """Connect to the device and read the data characteristic."""
+    """Connect to the device and read the data characteristic.
+
+    With a ``limiter`` each connection holds a slot on the device's adapter
+    until it is closed.
+    """
     for attempt in range(2):
-        client = await establish_connection(
-            BleakClientWithServiceCache,
-            ble_device,
-            ble_device.name or ble_device.address,
-        )
-        try:
-            return await action(client)
-        except BleakCharacteristicNotFoundError:
-            if attempt == 0:
-                await client.clear_cache()
-                continue
-            raise
-        except BleakError:
-            if attempt == 0:
-                continue
-            raise
-        finally:
-            await client.disconnect()
+        async with limiter.slot(ble_device) if limiter else contextlib.nullcontext():
+            client = await establish_connection(
+                BleakClientWithServiceCache,
+                ble_device,
+                ble_device.name or ble_device.address,
+            )
+            try:
+                return await action(client)
+            except BleakCharacteristicNotFoundError:
+                if attempt == 0:
+                    await client.clear_cache()
+                    continue
+                raise
+            except BleakError:
+                if attempt == 0:
+                    continue
+                raise
+            finally:
+                await client.disconnect()
     msg = "unreachable"  # pragma: no cover
     raise AssertionError(msg)  # pragma: no cover
 
 
+def _disconnect_future(client: BleakClientWithServiceCache) -> asyncio.Future[None]:
+    """Return a future resolved when ``client`` disconnects."""
+    disconnect_future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+    def _resolve_disconnect_callback(_: BleakClientWithServiceCache) -> None:
+        if not disconnect_future.done():
+            disconnect_future.set_result(None)
+
+    client.set_disconnected_callback(_resolve_disconnect_callback)
+    return disconnect_future
+
+
 @lru_cache
 def try_parse_model(value: str | Model | None) -> Model | None:
     """Try to parse the value into a model.
@@ -564,9 +940,9 @@ def try_parse_model(value: str | Model | None) -> Model | None:
 
 
 # A BBQ probe that is not plugged in reports 0xFFFF. All BBQ models now use
-# signed unpackers, so this surfaces as -1; the unsigned 65535 form is kept
-# defensively in case a future model is added with an unsigned unpacker. Either
-# way it means "no probe attached" and must be dropped rather than reported as
+# signed advertisement structs, so this surfaces as -1; the unsigned 65535 form
+# is kept defensively in case a future model is added with an unsigned struct.
+# Either way it means "no probe attached" and must be dropped rather than reported as
 # a bogus 6553.5°C reading.
 BBQ_PROBE_NOT_CONNECTED = frozenset((0xFFFF, -1))
 
@@ -619,6 +995,22 @@ MAX_PLAUSIBLE_CO2_PPM = 40000
 MAX_PLAUSIBLE_PRESSURE_HPA = 1200
 
 
+def _changed_values(
+    values: Mapping[DeviceKey, _ValueT], emitted: dict[DeviceKey, Any]
+) -> dict[DeviceKey, _ValueT]:
+    """Return the values whose native value differs from ``emitted``.
+
+    ``emitted`` is updated to the returned values.
+    """
+    changed: dict[DeviceKey, _ValueT] = {}
+    for key, value in values.items():
+        native_value = value.native_value
+        if key not in emitted or emitted[key] != native_value:
+            emitted[key] = native_value
+            changed[key] = value
+    return changed
+
+
 def convert_temperature(temp: float) -> float:
     """Temperature converter.
 
@@ -635,19 +1027,132 @@ def is_bbq(lower_name: str) -> bool:
     return bool("xbbq" in lower_name or "ibbq" in lower_name)
 
 
+def detect_model(
+    lower_name: str,
+    service_uuids: list[str],
+    manufacturer_data: dict[int, bytes],
+    msg_length: int,
+) -> Model | None:
+    """Identify the model from advertisement data using the detection index.
+
+    Tables are consulted in priority order: exact local name, local-name
+    prefix, BBQ name keyword plus message length, then manufacturer id rules.
+    Return ``None`` when the advertisement matches no supported model.
+    """
+    if (device_type := INKBIRD_NAMES.get(lower_name)) is not None and (
+        msg_length in SENSOR_MSG_LENGTHS
+        or not NAMED_MODEL_SERVICE_UUIDS.isdisjoint(service_uuids)
+    ):
+        return device_type
+    for prefix_len, prefixes in INKBIRD_NAME_PREFIXES.items():
+        if (device_type := prefixes.get(lower_name[:prefix_len])) is not None:
+            return device_type
+    if msg_length in BBQ_LENGTH_TO_TYPE and is_bbq(lower_name):
+        return BBQ_LENGTH_TO_TYPE[msg_length]
+    for manufacturer_id, data in manufacturer_data.items():
+        if (entry := MANUFACTURER_ID_RULES.get(manufacturer_id)) is None:
+            continue
+        device_type, rule, required_uuids = entry
+        if (
+            (
+                rule.message_length is None
+                or len(data) + MANUFACTURER_ID_LEN == rule.message_length
+            )
+            and data.startswith(rule.prefix)
+            and data.endswith(rule.suffix)
+            and (not required_uuids or not required_uuids.isdisjoint(service_uuids))
+        ):
+            return device_type
+    return None
+
+
+def negative_detection_key(
+    service_info: BluetoothServiceInfoBleak,
+) -> NegativeDetectionKey | None:
+    """Return the detection cache key for an advertisement.
+
+    The key holds every input detection looks at — local name, manufacturer
+    ids, payload lengths and service UUIDs — so two advertisements with the
+    same key always detect the same way. Return ``None`` when detection also
+    depends on payload content (see ``PAYLOAD_MATCHED_MANUFACTURER_IDS``), in
+    which case the result must not be cached.
+    """
+    manufacturer_data = service_info.manufacturer_data
+    if not PAYLOAD_MATCHED_MANUFACTURER_IDS.isdisjoint(manufacturer_data):
+        return None
+    return (
+        service_info.name,
+        tuple(manufacturer_data),
+        tuple(map(len, manufacturer_data.values())),
+        tuple(service_info.service_uuids),
+    )
+
+
+def remember_negative_detection(
+    negative_detections: dict[NegativeDetectionKey, None],
+    negative_key: NegativeDetectionKey | None,
+) -> None:
+    """Remember an advertisement shape that matched no supported model.
+
+    ``negative_detections`` is bounded by ``MAX_NEGATIVE_DETECTION_CACHE_SIZE``;
+    the oldest entry is evicted first.
+    """
+    if negative_key is None:
+        return
+    if len(negative_detections) >= MAX_NEGATIVE_DETECTION_CACHE_SIZE:
+        del negative_detections[next(iter(negative_detections))]
+    negative_detections[negative_key] = None
+
+
 class INKBIRDBluetoothDeviceData(BluetoothData):
     """Date update for INKBIRD Bluetooth devices."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         device_type: Model | str | None = None,
         device_data: dict[str, Any] | None = None,
         update_callback: Callable[[SensorUpdate], None] | None = None,
         device_data_changed_callback: Callable[[dict[str, Any]], None] | None = None,
+        *,
+        notify_coalescing: NotifyCoalescing | None = None,
+        notify_queueing: NotifyQueueing | None = None,
+        reconnect_policy: ReconnectPolicy | None = None,
+        notify_stats: bool = False,
+        delta_updates: DeltaUpdates | None = None,
+        persistent_polling: PersistentPolling | None = None,
+        connection_limiter: ConnectionLimiter | None = None,
+        adaptive_polling: AdaptivePolling | None = None,
     ) -> None:
-        """Initialize the class."""
+        """Initialize the class.
+
+        ``notify_coalescing`` rate-limits and deduplicates the updates notify
+        models send to ``update_callback``; by default every notification
+        emits one. ``notify_queueing`` moves decoding off the bleak callback
+        onto a per-device consumer task; by default it runs inline.
+        ``reconnect_policy`` paces notify reconnects (exponential backoff from
+        5 seconds by default). ``notify_stats`` records per-stage notify
+        latency histograms, read back with ``stats()``. ``delta_updates``
+        makes every returned or emitted ``SensorUpdate`` carry only the
+        entities that changed, with a periodic full snapshot.
+        ``persistent_polling`` keeps poll-only models connected between reads
+        once ``async_start`` is called. Share one ``connection_limiter``
+        between parsers to cap the connections open per adapter.
+        ``adaptive_polling`` scales ``poll_needed``'s staleness threshold to
+        the device's advertisement cadence instead of ``MIN_POLL_INTERVAL``.
+        """
         super().__init__()
-        self._device_type = try_parse_model(device_type)
+        self._device_type: Model | None = None
+        self._model_info: ModelInfo | None = None
+        # Advertisement decoder specialised for the current model; bound once
+        # by ``_set_device_type`` so the per-packet path needs no lookups.
+        self._adv_decoder: Callable[[int, bytes], None] | None = None
+        # Advertisement shapes already known not to be a supported model,
+        # keyed by ``negative_detection_key`` (insertion ordered for eviction).
+        self._negative_detections: dict[NegativeDetectionKey, None] = {}
+        # Bytes of an IHT-2PB frame split across notifications, carried over
+        # until the rest arrives. Reset on every new connection.
+        self._iht_2pb_buffer = bytearray()
+        self._set_device_type(try_parse_model(device_type))
         # Last time we got a full update from ADV data
         self._last_full_update = 0.0
         self._notify_task: asyncio.Task[None] | None = None
@@ -655,12 +1160,61 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
         self._device_data = device_data.copy() if device_data else {}
         self._update_callback = update_callback
         self._device_data_changed_callback = device_data_changed_callback
+        self._notify_coalescing = notify_coalescing
+        # Native values as of the last coalesced emit, and when it happened
+        # (event loop time).
+        self._notify_emitted: dict[DeviceKey, Any] = {}
+        self._notify_last_emit = -math.inf
+        self._notify_flush_handle: asyncio.TimerHandle | None = None
+        self._notify_queueing = notify_queueing
+        self._notify_queue: asyncio.Queue[_QueuedNotification] | None = None
+        self._notify_consumer_task: asyncio.Task[None] | None = None
+        self._notify_overflows = 0
+        self._notify_unknown_packets = 0
+        self._notify_status: int | None = None
+        self._notify_latency = NotifyLatency() if notify_stats else None
+        # Time spent in update_callback during the notification being handled,
+        # subtracted from its decode time.
+        self._notify_callback_elapsed = 0.0
+        self._reconnect_policy = reconnect_policy or ReconnectPolicy()
+        self._delta_updates = delta_updates
+        self._persistent_polling = persistent_polling
+        self._connection_limiter = connection_limiter
+        self._adaptive_polling = adaptive_polling
+        # Moving average of the gap between advertisements, in seconds.
+        self._advertisement_interval: float | None = None
+        # GATT handles of the characteristics polled, by UUID (``None`` for
+        # one the device lacks), so repeat polls skip the service lookups.
+        self._char_handles: dict[UUID | None, int | None] = {}
+        # Native values as of the last delta update, and when the last full
+        # snapshot was returned (monotonic time).
+        self._delta_emitted: dict[DeviceKey, Any] = {}
+        self._delta_binary_emitted: dict[DeviceKey, Any] = {}
+        self._delta_last_full = -math.inf
+        # Monotonic time of the last advertisement, and an event every
+        # advertisement sets so the notify loop can reconnect as soon as the
+        # device is heard.
+        self._last_seen: float | None = None
+        self._advertisement_seen = asyncio.Event()
 
     @property
     def uses_notify(self) -> bool:
         """Return True if the device uses notifications."""
         return self._device_type in NOTIFY_MODELS
 
+    @property
+    def uses_persistent_polling(self) -> bool:
+        """Return True if ``async_start`` keeps the device connected to poll."""
+        return (
+            self._persistent_polling is not None
+            and self._device_type in GATT_POLL_MODELS
+        )
+
+    @property
+    def session_active(self) -> bool:
+        """Return True while a notify or persistent poll session is running."""
+        return self._notify_task is not None and not self._notify_task.done()
+
     async def async_start(
         self, service_info: BluetoothServiceInfoBleak, ble_device: BLEDevice
     ) -> None:
@@ -669,46 +1223,92 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
         if TYPE_CHECKING:
             assert self._device_type is not None
         self._running = True
+        if self.uses_persistent_polling:
+            self._notify_task = asyncio.create_task(
+                self._async_start_notify(ble_device, self._async_persistent_poll_action)
+            )
+            return
         if self._device_type not in NOTIFY_MODELS:
             return
-        self._notify_task = asyncio.create_task(self._async_start_notify(ble_device))
+        if (queueing := self._notify_queueing) is not None:
+            self._notify_queue = asyncio.Queue(queueing.maxsize)
+            self._notify_consumer_task = asyncio.create_task(
+                self._async_consume_notifications(self._notify_queue)
+            )
+        self._notify_task = asyncio.create_task(
+            self._async_start_notify(ble_device, self._async_notify_action)
+        )
 
     async def async_stop(self) -> None:
         """Stop the device."""
         self._running = False
+        if self._notify_flush_handle is not None:
+            self._notify_flush_handle.cancel()
+            self._notify_flush_handle = None
         if self._notify_task:
             self._notify_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._notify_task
             self._notify_task = None
+        self._notify_queue = None
+        if self._notify_consumer_task:
+            self._notify_consumer_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._notify_consumer_task
+            self._notify_consumer_task = None
 
-    async def _async_start_notify(self, ble_device: BLEDevice) -> None:
-        """Start the notification loop."""
+    async def _async_start_notify(
+        self,
+        ble_device: BLEDevice,
+        action: Callable[[BleakClientWithServiceCache], Coroutine[None, None, None]],
+    ) -> None:
+        """Run ``action`` on a connection, reconnecting whenever it ends."""
+        policy = self._reconnect_policy
+        advertisement_seen = self._advertisement_seen
+        failures = 0
         while self._running:
             _LOGGER.debug("Starting notification for %s", self.name)
             try:
-                await async_connect_action(ble_device, self._async_notify_action)
+                await async_connect_action(ble_device, action, self._connection_limiter)
             except (BleakError, TimeoutError) as err:
                 _LOGGER.debug("Error starting notification: %s", str(err) or type(err))
-            _LOGGER.debug("Notification loop for %s finished", self.name)
-            # Wait for 5 seconds before trying again
-            # This is needed to avoid a busy loop if the device is not
-            # available
-            await asyncio.sleep(5)
+                delay = policy.delay(failures)
+                failures += 1
+            else:
+                delay = policy.delay(0)
+                failures = 0
+            # Only advertisements heard from now on count, including those
+            # that arrive during the backoff below.
+            advertisement_seen.clear()
+            _LOGGER.debug(
+                "Notification loop for %s finished, reconnecting in %.1fs",
+                self.name,
+                delay,
+            )
+            # Back off before trying again so an unavailable device does not
+            # turn into a busy loop of connection attempts.
+            await asyncio.sleep(delay)
+            if policy.wait_for_advertisement:
+                # Connect right after the device is next heard: an attempt on
+                # a device out of range ties up the controller for the whole
+                # establish_connection timeout only to fail.
+                _LOGGER.debug(
+                    "Waiting for an advertisement from %s (last heard at %s)",
+                    self.name,
+                    self._last_seen,
+                )
+                # Repeated identical advertisements may never reach
+                # ``update``, so give up waiting and try anyway eventually.
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(advertisement_seen.wait(), policy.max_delay)
 
     async def _async_notify_action(self, client: BleakClientWithServiceCache) -> None:
         if TYPE_CHECKING:
             assert self._device_type is not None
         dev_info = MODEL_INFO[self._device_type]
         notify_uuid = dev_info.notify_uuid
-        loop = asyncio.get_running_loop()
-        disconnect_future = loop.create_future()
-
-        def _resolve_disconnect_callback(_: BleakClientWithServiceCache) -> None:
-            if not disconnect_future.done():
-                disconnect_future.set_result(None)
-
-        client.set_disconnected_callback(_resolve_disconnect_callback)
+        disconnect_future = _disconnect_future(client)
+        self._iht_2pb_buffer.clear()
         if self._device_type is Model.IDT_34C_B:
             # Read battery before subscribing so the value is stored and
             # included in the very first temperature SensorUpdate.
@@ -752,6 +1352,27 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
                 await client.write_gatt_char(char_uuid, payload, response=False)
         await disconnect_future  # wait for disconnect
 
+    async def _async_persistent_poll_action(
+        self, client: BleakClientWithServiceCache
+    ) -> None:
+        """Read the device every ``PersistentPolling.interval`` until it drops."""
+        if TYPE_CHECKING:
+            assert self._persistent_polling is not None
+        interval = self._persistent_polling.interval
+        disconnect_future = _disconnect_future(client)
+        while self._running:
+            payload = await self._async_poll_action(client)
+            if TYPE_CHECKING:
+                assert payload is not None
+            self._decode_poll_payload(payload)
+            if self._update_callback is None:
+                _LOGGER.debug("%s: update_callback not set, dropping update", self.name)
+            else:
+                self._emit_notify_update()
+            done, _ = await asyncio.wait((disconnect_future,), timeout=interval)
+            if done:
+                return
+
     def _notify_callback(
         self, sender: BleakGATTCharacteristic, data: bytearray
     ) -> None:
@@ -759,115 +1380,195 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
         _LOGGER.debug("Received notification from %s: %s", sender, data)
         if not self._running:
             return
+        received = perf_counter() if self._notify_latency is not None else 0.0
+        if (queue := self._notify_queue) is not None:
+            self._enqueue_notification(queue, sender, data, received)
+            return
         handler = self._notify_dispatch.get(self._device_type)
         if handler is not None:
-            handler(self, sender, data)
+            self._run_notify_handler(handler, sender, data, received)
 
-    def _notify_iam_t1(self, sender: BleakGATTCharacteristic, data: bytearray) -> None:
-        """Parse an IAM-T1 notification."""
-        if (
-            len(data) == IAM_T1_STATE_NOTIFY_LENGTH
-            and bytes(data[1:3]) == IAM_T1_NOTIFY_STATE_PREFIX
-        ):
-            in_f = data[10] & 0xF
-            unit = Units.TEMP_FAHRENHEIT if in_f else Units.TEMP_CELSIUS
-            _LOGGER.debug("IAM-T1 unit: %s (%s)", unit, self._device_data)
-            if unit != self._device_data.get("temp_unit"):
-                self._device_data["temp_unit"] = unit
-                if TYPE_CHECKING:
-                    assert self._device_data_changed_callback is not None
-                _LOGGER.debug("IAM-T1 unit changed: %s (%s)", unit, self._device_data)
-                self._device_data_changed_callback(self._device_data)
-        elif (
-            len(data) == IAM_T1_DATA_NOTIFY_LENGTH
-            and bytes(data[1:3]) == IAM_T1_NOTIFY_DATA_PREFIX
-        ):
-            sign = data[4] & 0xF
-            temp = data[5] << 8 | data[6]
-            signed_temp = (temp if sign == 0 else -temp) / 10
-            humidity = (data[7] << 8 | data[8]) / 10
-            co2 = data[9] << 8 | data[10]
-            pressure = data[11] << 8 | data[12]
-            if not self._is_humidity_plausible(humidity):
-                # A garbage humidity field marks a corrupt notification; drop
-                # the whole packet rather than publish any of its fields (#141).
-                return
-            _LOGGER.debug("IAM-T1 temperature: %s (%s)", signed_temp, self._device_data)
-            if self._device_data.get("temp_unit") == Units.TEMP_FAHRENHEIT:
-                # Convert to Celsius
-                signed_temp = round((signed_temp - 32) * 5 / 9, 2)
-            if not self._is_temperature_plausible(signed_temp):
-                # Temperature here is unsigned 16-bit + a separate sign
-                # nibble, so a garbage ``0xFFFF`` field decodes to ~6553 °C
-                # (or ~-6553 with the sign bit set) — the same wraparound
-                # shape the signed advertisement parsers now block at the
-                # source. Treat it as a corrupt notification and drop the
-                # whole packet rather than publish any of its fields.
-                return
-            if not self._is_co2_plausible(co2) or not self._is_pressure_plausible(
-                pressure
-            ):
-                # CO2 and pressure are unsigned 16-bit fields, so a garbage
-                # 0xFFFF surfaces as 65535 ppm / 65535 hPa — the same
-                # corrupt-byte shape as the temperature/humidity guards
-                # above. Drop the whole packet rather than publish a bogus
-                # CO2/pressure reading alongside a temperature/humidity that
-                # happens to land in a plausible range by chance.
-                return
-            self.update_predefined_sensor(
-                SensorLibrary.TEMPERATURE__CELSIUS, signed_temp
-            )
-            self.update_predefined_sensor(SensorLibrary.HUMIDITY__PERCENTAGE, humidity)
-            self.update_predefined_sensor(
-                SensorLibrary.CO2__CONCENTRATION_PARTS_PER_MILLION,
-                co2,
-            )
-            self.update_predefined_sensor(SensorLibrary.PRESSURE__HPA, pressure)
-            if TYPE_CHECKING:
-                assert self._update_callback is not None
-            self._update_callback(self._finish_update())
-        else:
-            _LOGGER.debug(
-                "Unexpected notification from %s length: %d header: %s",
-                sender,
-                len(data),
-                bytes(data[:3]),
-            )
-
-    @staticmethod
-    def _iter_iht_2pb_frames(
+    def _run_notify_handler(
+        self,
+        handler: Callable[
+            [INKBIRDBluetoothDeviceData, BleakGATTCharacteristic, bytearray], None
+        ],
+        sender: BleakGATTCharacteristic,
         data: bytearray,
-    ) -> Iterable[tuple[int, bytes]]:
-        """Yield ``(command, payload)`` for each checksum-valid frame in ``data``.
-
-        A single notification may bundle several frames back-to-back (e.g. the
-        startup config burst arriving coalesced), so the buffer is walked by the
-        per-frame ``<length>`` byte and each frame's checksum is verified before
-        it is yielded. Frames that fail the header or checksum check are skipped
-        and the walk resynchronises one byte at a time.
-        """
-        index = 0
-        length = len(data)
-        while index + IHT_2PB_FRAME_MIN_LEN <= length:
-            if data[index : index + IHT_2PB_HEADER_LEN] != IHT_2PB_FRAME_HEADER:
-                index += 1
+        received: float,
+    ) -> None:
+        """Run a model's notify handler, timing it when stats are enabled."""
+        if (latency := self._notify_latency) is None:
+            handler(self, sender, data)
+            return
+        start = perf_counter()
+        latency.queue.record(start - received)
+        self._notify_callback_elapsed = 0.0
+        handler(self, sender, data)
+        latency.decode.record(perf_counter() - start - self._notify_callback_elapsed)
+
+    def _send_notify_update(self) -> None:
+        """Pass the accumulated state to ``update_callback``."""
+        if TYPE_CHECKING:
+            assert self._update_callback is not None
+        update = self._finish_update()
+        if (latency := self._notify_latency) is None:
+            self._update_callback(update)
+            return
+        start = perf_counter()
+        self._update_callback(update)
+        elapsed = perf_counter() - start
+        latency.callback.record(elapsed)
+        self._notify_callback_elapsed += elapsed
+
+    def stats(self) -> NotifyStats | None:
+        """Return notify latency histograms, or None unless ``notify_stats``."""
+        if self._notify_latency is None:
+            return None
+        return self._notify_latency.snapshot()
+
+    def _enqueue_notification(
+        self,
+        queue: asyncio.Queue[_QueuedNotification],
+        sender: BleakGATTCharacteristic,
+        data: bytearray,
+        received: float,
+    ) -> None:
+        """Queue a copy of a notification, dropping per the overflow policy."""
+        if TYPE_CHECKING:
+            assert self._notify_queueing is not None
+        if self._notify_queueing.policy is NotifyOverflowPolicy.LATEST_WINS:
+            while not queue.empty():
+                queue.get_nowait()
+                self._notify_overflows += 1
+        elif queue.full():
+            queue.get_nowait()
+            self._notify_overflows += 1
+        # The backend may reuse its buffer once the callback returns.
+        queue.put_nowait((sender, bytearray(data), received))
+
+    async def _async_consume_notifications(
+        self, queue: asyncio.Queue[_QueuedNotification]
+    ) -> None:
+        """Decode queued notifications until the session stops."""
+        while True:
+            sender, data, received = await queue.get()
+            if not self._running:
+                continue
+            handler = self._notify_dispatch.get(self._device_type)
+            if handler is None:
                 continue
-            payload_len = data[index + IHT_2PB_LEN_OFFSET]
-            checksum_index = index + IHT_2PB_PAYLOAD_OFFSET + payload_len
+            try:
+                self._run_notify_handler(handler, sender, data, received)
+            except Exception:
+                # A failing update_callback must not end the session.
+                _LOGGER.exception("Error handling notification from %s", self.name)
+
+    def _notify_iam_t1(self, _sender: BleakGATTCharacteristic, data: bytearray) -> None:
+        """Route an IAM-T1 notification on its length and packet type."""
+        handler = (
+            self._iam_t1_notify_handlers.get((len(data), data[1], data[2]))
+            if len(data) >= IAM_T1_NOTIFY_HEADER_LENGTH
+            else None
+        )
+        if handler is None:
+            self._notify_unknown_packets += 1
+            return
+        handler(self, data)
+
+    def _notify_iam_t1_state(self, data: bytearray) -> None:
+        """Parse an IAM-T1 state notification (the temperature unit)."""
+        in_f = data[IAM_T1_STATE_UNIT_OFFSET] & 0xF
+        unit = Units.TEMP_FAHRENHEIT if in_f else Units.TEMP_CELSIUS
+        _LOGGER.debug("IAM-T1 unit: %s (%s)", unit, self._device_data)
+        if unit != self._device_data.get("temp_unit"):
+            self._device_data["temp_unit"] = unit
+            if TYPE_CHECKING:
+                assert self._device_data_changed_callback is not None
+            _LOGGER.debug("IAM-T1 unit changed: %s (%s)", unit, self._device_data)
+            self._device_data_changed_callback(self._device_data)
+
+    def _notify_iam_t1_data(self, data: bytearray) -> None:
+        """Parse an IAM-T1 data notification."""
+        sign, temp, raw_humidity, co2, pressure = IAM_T1_DATA_UNPACK(data)
+        signed_temp = (temp if sign & 0xF == 0 else -temp) / 10
+        humidity = raw_humidity / 10
+        if not self._is_humidity_plausible(humidity):
+            # A garbage humidity field marks a corrupt notification; drop
+            # the whole packet rather than publish any of its fields (#141).
+            return
+        _LOGGER.debug("IAM-T1 temperature: %s (%s)", signed_temp, self._device_data)
+        if self._device_data.get("temp_unit") == Units.TEMP_FAHRENHEIT:
+            # Convert to Celsius
+            signed_temp = round((signed_temp - 32) * 5 / 9, 2)
+        if not self._is_temperature_plausible(signed_temp):
+            # Temperature here is unsigned 16-bit + a separate sign
+            # nibble, so a garbage ``0xFFFF`` field decodes to ~6553 °C
+            # (or ~-6553 with the sign bit set) — the same wraparound
+            # shape the signed advertisement parsers now block at the
+            # source. Treat it as a corrupt notification and drop the
+            # whole packet rather than publish any of its fields.
+            return
+        if not self._is_co2_plausible(co2) or not self._is_pressure_plausible(pressure):
+            # CO2 and pressure are unsigned 16-bit fields, so a garbage
+            # 0xFFFF surfaces as 65535 ppm / 65535 hPa — the same
+            # corrupt-byte shape as the temperature/humidity guards
+            # above. Drop the whole packet rather than publish a bogus
+            # CO2/pressure reading alongside a temperature/humidity that
+            # happens to land in a plausible range by chance.
+            return
+        self.update_predefined_sensor(SensorLibrary.TEMPERATURE__CELSIUS, signed_temp)
+        self.update_predefined_sensor(SensorLibrary.HUMIDITY__PERCENTAGE, humidity)
+        self.update_predefined_sensor(
+            SensorLibrary.CO2__CONCENTRATION_PARTS_PER_MILLION,
+            co2,
+        )
+        self.update_predefined_sensor(SensorLibrary.PRESSURE__HPA, pressure)
+        self._emit_notify_update()
+
+    def _iter_iht_2pb_frames(self, data: bytearray) -> Iterable[tuple[int, bytes]]:
+        """Yield ``(command, payload)`` for each checksum-valid frame received.
+
+        ``data`` is appended to the per-connection reassembly buffer, so a
+        frame split across notifications (small MTU) is decoded once its tail
+        arrives, and a notification bundling several frames back-to-back
+        yields them all. Headers are located with ``find`` rather than a
+        byte-by-byte walk; frames failing the checksum are skipped. Consumed
+        bytes are dropped in one step once the walk ends, leaving only an
+        incomplete trailing frame for the next notification.
+        """
+        buffer = self._iht_2pb_buffer
+        buffer += data
+        find = buffer.find
+        length = len(buffer)
+        index = find(IHT_2PB_FRAME_HEADER)
+        while index != -1 and index + IHT_2PB_FRAME_MIN_LEN <= length:
+            checksum_index = (
+                index + IHT_2PB_PAYLOAD_OFFSET + buffer[index + IHT_2PB_LEN_OFFSET]
+            )
             if checksum_index >= length:
-                # Declared length overshoots the buffer. A spurious ``55 aa``
-                # whose length byte runs long should not abort the walk, so
-                # resync one byte (like the bad-header/checksum paths); a
-                # genuinely truncated tail frame just runs out and stops.
-                index += 1
+                # Declared length overshoots what has arrived. If another
+                # header follows, this was a spurious ``55 aa`` with a long
+                # length byte, so resync to it; otherwise it is a genuinely
+                # split frame and the rest arrives with the next notification.
+                if (next_index := find(IHT_2PB_FRAME_HEADER, index + 1)) == -1:
+                    break
+                index = next_index
                 continue
-            if sum(data[index:checksum_index]) & 0xFF != data[checksum_index]:
-                index += 1
+            if sum(buffer[index:checksum_index]) & 0xFF != buffer[checksum_index]:
+                index = find(IHT_2PB_FRAME_HEADER, index + 1)
                 continue
-            command = data[index + IHT_2PB_CMD_OFFSET]
-            payload = bytes(data[index + IHT_2PB_PAYLOAD_OFFSET : checksum_index])
+            command = buffer[index + IHT_2PB_CMD_OFFSET]
+            payload = bytes(buffer[index + IHT_2PB_PAYLOAD_OFFSET : checksum_index])
             yield command, payload
-            index = checksum_index + 1
+            index = find(IHT_2PB_FRAME_HEADER, checksum_index + 1)
+        if index != -1:
+            del buffer[:index]
+        elif buffer.endswith(IHT_2PB_FRAME_HEADER[:1]):
+            # Keep a trailing 0x55 that may start the next frame's header.
+            del buffer[:-1]
+        else:
+            buffer.clear()
 
     def _notify_iht_2pb(
         self, _sender: BleakGATTCharacteristic, data: bytearray
@@ -882,6 +1583,9 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
         socket simply emits no frame, so there is no value-range heuristic to
         guess at occupancy. Verified against hardware in issue #222.
         """
+        if TYPE_CHECKING:
+            assert self._model_info is not None
+        probe_sensors = self._model_info.probe_sensors
         emitted = False
         for command, payload in self._iter_iht_2pb_frames(data):
             probe_num = IHT_2PB_PROBE_SELECTORS.get(command)
@@ -889,18 +1593,10 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
                 continue
             temp = IHT_2PB_TEMP_UNPACK(payload[:IHT_2PB_TEMP_PAYLOAD_LEN])[0] / 10
             _LOGGER.debug("IHT-2PB probe %d temperature: %s", probe_num, temp)
-            self.update_predefined_sensor(
-                SensorLibrary.TEMPERATURE__CELSIUS,
-                temp,
-                key=f"temperature_probe_{probe_num}",
-                name=f"Temperature Probe {probe_num}",
-            )
+            self._update_probe_temperature(probe_sensors[probe_num - 1], temp)
             emitted = True
-        if not emitted:
-            return
-        if TYPE_CHECKING:
-            assert self._update_callback is not None
-        self._update_callback(self._finish_update())
+        if emitted:
+            self._emit_notify_update()
 
     def _notify_idt_34c_b(
         self, _sender: BleakGATTCharacteristic, data: bytearray
@@ -912,7 +1608,8 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
         trailing status byte (13 bytes total). 0x7FFE marks an unplugged probe,
         which is reported as ``None`` so a removed probe clears its sensor
         rather than reporting a bogus 3276 C. A notification of any other length
-        is corrupt and dropped whole (the #141 corrupt-byte guard family).
+        is corrupt and dropped whole (the #141 corrupt-byte guard family). The
+        raw status byte is exposed as ``notify_status``.
         """
         if len(data) != IDT_34C_B_DATA_LENGTH:
             _LOGGER.debug(
@@ -921,26 +1618,88 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
                 IDT_34C_B_DATA_LENGTH,
             )
             return
-        for idx in range(IDT_34C_B_PROBE_COUNT):
-            # A single signed read suffices: 0x7FFE (32766) is positive as
-            # both signed and unsigned int16, so the sentinel check is identical.
-            raw = struct.unpack_from("<h", data, idx * 2)[0]
-            num = idx + 1
-            key = f"temperature_probe_{num}"
-            name = f"Temperature Probe {num}"
+        if TYPE_CHECKING:
+            assert self._model_info is not None
+        *probes, status = IDT_34C_B_UNPACK(data)
+        update_probe_temperature = self._update_probe_temperature
+        for probe, raw in zip(self._model_info.probe_sensors, probes, strict=True):
+            # A signed read suffices: 0x7FFE (32766) is positive as both
+            # signed and unsigned int16, so the sentinel check is identical.
             if raw == IDT_34C_B_NO_PROBE:
-                self.update_predefined_sensor(
-                    SensorLibrary.TEMPERATURE__CELSIUS, None, key=key, name=name
+                update_probe_temperature(probe, None)
+            elif IDT_34C_B_CELSIUS_MIN_RAW <= raw <= IDT_34C_B_CELSIUS_MAX_RAW:
+                update_probe_temperature(
+                    probe, IDT_34C_B_CELSIUS[raw - IDT_34C_B_CELSIUS_MIN_RAW]
                 )
-                continue
-            temp_c = round((raw / 10.0 - 32) * 5 / 9, 1)
-            self.update_predefined_sensor(
-                SensorLibrary.TEMPERATURE__CELSIUS, temp_c, key=key, name=name
-            )
+            else:
+                update_probe_temperature(probe, round((raw / 10.0 - 32) * 5 / 9, 1))
+        if status != self._notify_status:
+            self._notify_status = status
+            _LOGGER.debug("IDT-34c-B status changed: %#04x", status)
         if self._update_callback is None:
             _LOGGER.debug("IDT-34c-B: update_callback not set, dropping update")
             return
-        self._update_callback(self._finish_update())
+        self._emit_notify_update()
+
+    def _emit_notify_update(self) -> None:
+        """Send the accumulated state to ``update_callback`` after a notify.
+
+        Without ``notify_coalescing`` every notification emits. Otherwise an
+        update inside the rate window schedules a single trailing flush that
+        carries whatever state has accumulated by the time it fires.
+        """
+        if (coalescing := self._notify_coalescing) is None:
+            self._send_notify_update()
+            return
+        if self._notify_flush_handle is not None:
+            return
+        loop = asyncio.get_running_loop()
+        next_emit = self._notify_last_emit + coalescing.min_interval
+        if loop.time() < next_emit:
+            self._notify_flush_handle = loop.call_at(
+                next_emit, self._flush_notify_update
+            )
+            return
+        self._emit_coalesced_update(coalescing, loop.time())
+
+    def _flush_notify_update(self) -> None:
+        """Emit the state held back by the rate window (trailing edge)."""
+        self._notify_flush_handle = None
+        if self._running and (coalescing := self._notify_coalescing) is not None:
+            self._emit_coalesced_update(coalescing, asyncio.get_running_loop().time())
+
+    def _emit_coalesced_update(self, coalescing: NotifyCoalescing, now: float) -> None:
+        """Emit unless no value moved past its deadband since the last emit."""
+        values = self._sensor_values_updates
+        if not self._notify_values_changed(coalescing.deadbands):
+            return
+        self._notify_last_emit = now
+        self._notify_emitted = {
+            device_key: value.native_value for device_key, value in values.items()
+        }
+        self._send_notify_update()
+
+    def _notify_values_changed(self, deadbands: Mapping[DeviceClass, float]) -> bool:
+        """Return True if any value differs meaningfully from the last emit."""
+        emitted = self._notify_emitted
+        descriptions = self._sensor_descriptions_updates
+        for device_key, value in self._sensor_values_updates.items():
+            if device_key not in emitted:
+                return True
+            native_value = value.native_value
+            previous = emitted[device_key]
+            if native_value == previous:
+                continue
+            device_class = descriptions[device_key].device_class
+            deadband = None if device_class is None else deadbands.get(device_class)
+            if (
+                deadband is None
+                or not isinstance(native_value, int | float)
+                or not isinstance(previous, int | float)
+                or abs(native_value - previous) >= deadband
+            ):
+                return True
+        return False
 
     _notify_dispatch: ClassVar[
         dict[
@@ -957,6 +1716,26 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
         """Return the device type."""
         return self._device_type
 
+    @property
+    def last_seen(self) -> float | None:
+        """Return the monotonic time of the last advertisement parsed."""
+        return self._last_seen
+
+    @property
+    def notify_overflows(self) -> int:
+        """Return how many notifications a full notify queue has dropped."""
+        return self._notify_overflows
+
+    @property
+    def notify_unknown_packets(self) -> int:
+        """Return how many notifications were of no known packet type."""
+        return self._notify_unknown_packets
+
+    @property
+    def notify_status(self) -> int | None:
+        """Return the raw status byte of the last IDT-34c-B notification."""
+        return self._notify_status
+
     @property
     def name(self) -> str:
         """Return the device name."""
@@ -964,15 +1743,33 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
             return info.name
         return self._device_type.name if self._device_type else "Unknown"
 
+    def _set_device_type(self, device_type: Model | None) -> None:
+        """Set the device type and bind its advertisement decoder.
+
+        Everything the decoder needs from ``MODEL_INFO`` (decode plan, probe
+        keys, scaling) is resolved here, once per model change, rather than on
+        every advertisement.
+        """
+        self._device_type = device_type
+        if device_type is None:
+            self._model_info = None
+            self._adv_decoder = None
+            return
+        self._model_info = dev_info = MODEL_INFO[device_type]
+        self._adv_decoder = (
+            self._adv_decoder_factories[device_type](self, dev_info)
+            if dev_info.parse_adv
+            else None
+        )
+
     def _set_name_and_manufacturer(
         self, service_info: BluetoothServiceInfoBleak
     ) -> None:
-        if self._device_type is None:
+        if (dev_info := self._model_info) is None:
             return
         self.set_device_manufacturer("INKBIRD")
         local_name = service_info.name
         address = service_info.address
-        dev_info = MODEL_INFO[self._device_type]
         dev_type_name = dev_info.name
         if dev_info.use_local_name_for_device:
             self.set_device_name(f"{local_name} {short_address(address)}")
@@ -985,85 +1782,64 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
         self,
         service_info: BluetoothServiceInfoBleak,
         manufacturer_data: dict[int, bytes],
-        data: bytes,
         msg_length: int,
     ) -> bool:
         """Identify the device type from advertisement data.
 
-        Set ``self._device_type`` and return ``True`` when a known model is
+        Set the device type and return ``True`` when a known model is
         recognised, or return ``False`` when the advertisement does not match
-        any supported device. The branchy match chain keeps this above the
-        mccabe threshold; it is a single linear dispatch by design.
+        any supported device.
         """
-        lower_name = service_info.name.lower()
-        if (lower_name in INKBIRD_NAMES) and (
-            msg_length in SENSOR_MSG_LENGTHS
-            or "0000fff0-0000-1000-8000-00805f9b34fb" in service_info.service_uuids
-            or "0000ff00-0000-1000-8000-00805f9b34fb" in service_info.service_uuids
-        ):
-            self._device_type = INKBIRD_NAMES[lower_name]
-        elif lower_name.startswith("ink@iht-2pb"):
-            # The IHT-2PB advertises as "Ink@IHT-2PB#<suffix>" and carries
-            # no usable payload; identify it by name prefix and let the
-            # notify flow (async_start) read its probes over GATT.
-            self._device_type = Model.IHT_2PB
-        elif is_bbq(lower_name) and msg_length in BBQ_LENGTH_TO_TYPE:
-            self._device_type = BBQ_LENGTH_TO_TYPE[msg_length]
-        elif (
-            msg_length == EIGHTEEN_BYTE_MESSAGE_LENGTH
-            and GENERIC_18_MANUFACTURER_ID in manufacturer_data
-            and "0000fff0-0000-1000-8000-00805f9b34fb" in service_info.service_uuids
-            and manufacturer_data[GENERIC_18_MANUFACTURER_ID].endswith(b"\x00\x00\x00")
-        ):
-            self._device_type = Model.GENERIC_18
-        elif IAM_T1_MANUFACTURER_ID in manufacturer_data and manufacturer_data[
-            IAM_T1_MANUFACTURER_ID
-        ].startswith(b"AC-6200"):
-            # AC-6200
-            self._device_type = Model.IAM_T1
-        elif (
-            msg_length == SEVENTEEN_BYTE_MESSAGE_LENGTH
-            and IAM_T2_MANUFACTURER_ID in manufacturer_data
-            and data[2:4] == IAM_T2_MAC_PREFIX  # MAC starts with 00:62
-        ):
-            # IAM-T2
-            self._device_type = Model.IAM_T2
-        else:
+        device_type = detect_model(
+            service_info.name.lower(),
+            service_info.service_uuids,
+            manufacturer_data,
+            msg_length,
+        )
+        if device_type is None:
             return False
+        if device_type is not self._device_type:
+            # GENERIC_18 is re-detected on every advertisement in case a
+            # specific model is recognised; keep the bound decoder otherwise.
+            self._set_device_type(device_type)
         return True
 
     def _start_update(self, service_info: BluetoothServiceInfoBleak) -> None:
         """Update from BLE advertisement data."""
         _LOGGER.debug("Parsing inkbird BLE advertisement data: %s", service_info)
-        if self._device_type is None and (
-            detected := NO_ADV_NOTIFY_NAMES.get(service_info.name.lower())
-        ):
-            # The IDT-34c-B advertises only its name and the ff00 service UUID —
-            # no manufacturer data — so it must be matched here, before the
-            # manufacturer-data guard below. The match is scoped to the exact
-            # local name so guarded detection for every other model is left
-            # untouched; the notify flow (async_start) reads its probes over
-            # GATT.
-            self._device_type = detected
+        self._track_advertisement_interval(service_info.time)
+        self._last_seen = service_info.time
+        self._advertisement_seen.set()
+        negative_key = None
+        if self._device_type is None:
+            negative_key = negative_detection_key(service_info)
+            if negative_key in self._negative_detections:
+                return
+            if detected := NO_ADV_NOTIFY_NAMES.get(service_info.name.lower()):
+                # The IDT-34c-B advertises only its name and the ff00 service
+                # UUID — no manufacturer data — so it must be matched here,
+                # before the manufacturer-data guard below. The match is scoped
+                # to the exact local name so guarded detection for every other
+                # model is left untouched; the notify flow (async_start) reads
+                # its probes over GATT.
+                self._set_device_type(detected)
         if not (manufacturer_data := service_info.manufacturer_data):
+            if self._device_type is None:
+                remember_negative_detection(self._negative_detections, negative_key)
             self._set_name_and_manufacturer(service_info)
             return
-        last_id = list(manufacturer_data)[-1]
-        data = int(last_id).to_bytes(2, byteorder="little") + manufacturer_data[last_id]
-        msg_length = len(data)
+        last_id = next(reversed(manufacturer_data))
+        msg_length = len(manufacturer_data[last_id]) + MANUFACTURER_ID_LEN
         # If we do not know the device type yet, try to determine it from the
         # advertisement data.
         if self._device_type in (
             None,
             Model.GENERIC_18,
-        ) and not self._detect_device_type(
-            service_info, manufacturer_data, data, msg_length
-        ):
+        ) and not self._detect_device_type(service_info, manufacturer_data, msg_length):
+            remember_negative_detection(self._negative_detections, negative_key)
             return
         self._set_name_and_manufacturer(service_info)
-        if TYPE_CHECKING:
-            assert self._device_type is not None
-        if not MODEL_INFO[self._device_type].parse_adv:
+        if (adv_decoder := self._adv_decoder) is None:
             # Device does not support parsing advertisement data
             return
         excludes = MANUFACTURER_DATA_ID_EXCLUDES if len(manufacturer_data) > 1 else None
@@ -1078,16 +1854,84 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
             # next update. When raw is available, changed_manufacturer_data
             # reflects only the current packet, so trust the last entry.
             return
-        last_id = list(changed_manufacturer_data)[-1]
-        data = (
-            int(last_id).to_bytes(2, byteorder="little")
-            + changed_manufacturer_data[last_id]
-        )
+        last_id = next(reversed(changed_manufacturer_data))
+        payload = changed_manufacturer_data[last_id]
 
-        _LOGGER.debug("Parsing INKBIRD BLE advertisement data: %s", data)
-        self._device_type_dispatch[self._device_type](self, data, msg_length)
+        _LOGGER.debug("Parsing INKBIRD BLE advertisement data: %s %s", last_id, payload)
+        adv_decoder(last_id, payload)
         self._last_full_update = service_info.time
 
+    def _finish_update(self) -> SensorUpdate:
+        """Finish the update, keeping only changed entities in delta mode."""
+        update = super()._finish_update()
+        if (delta := self._delta_updates) is None:
+            return update
+        now = monotonic_time_coarse()
+        if now - self._delta_last_full >= delta.full_snapshot_interval:
+            self._delta_last_full = now
+            self._delta_emitted = {
+                key: value.native_value for key, value in update.entity_values.items()
+            }
+            self._delta_binary_emitted = {
+                key: value.native_value
+                for key, value in update.binary_entity_values.items()
+            }
+            return update
+        values = _changed_values(update.entity_values, self._delta_emitted)
+        binary_values = _changed_values(
+            update.binary_entity_values, self._delta_binary_emitted
+        )
+        descriptions = update.entity_descriptions
+        binary_descriptions = update.binary_entity_descriptions
+        return SensorUpdate(
+            title=update.title,
+            devices=update.devices,
+            entity_descriptions={
+                key: descriptions[key] for key in values if key in descriptions
+            },
+            entity_values=values,
+            binary_entity_descriptions={
+                key: binary_descriptions[key]
+                for key in binary_values
+                if key in binary_descriptions
+            },
+            binary_entity_values=binary_values,
+            events=update.events,
+        )
+
+    def _track_advertisement_interval(self, seen: float) -> None:
+        """Fold the gap since the previous advertisement into the average."""
+        if (adaptive := self._adaptive_polling) is None:
+            return
+        # The same advertisement may be fed to supported() and update().
+        if self._last_seen is None or (gap := seen - self._last_seen) <= 0:
+            return
+        if (average := self._advertisement_interval) is None:
+            self._advertisement_interval = gap
+        else:
+            self._advertisement_interval = average + adaptive.alpha * (gap - average)
+
+    def update_many(
+        self, service_infos: Iterable[BluetoothServiceInfoBleak]
+    ) -> SensorUpdate:
+        """Update from a batch of advertisements and return a single update.
+
+        Equivalent to calling ``update`` for each advertisement in order and
+        keeping the last result, but the per-call work that only the final
+        state needs — clearing transient events, refreshing signal strength
+        and assembling the ``SensorUpdate`` — is done once per batch. Every
+        ``update`` result shares the parser's accumulated values, so the last
+        one already reflects the whole batch.
+        """
+        self._events_updates.clear()
+        start_update = self._start_update
+        service_info = None
+        for service_info in service_infos:
+            start_update(service_info)
+        if service_info is not None:
+            self.update_signal_strength(service_info.rssi)
+        return self._finish_update()
+
     def poll_needed(
         self, service_info: BluetoothServiceInfoBleak, last_poll: float | None
     ) -> bool:
@@ -1106,20 +1950,45 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
         since the last successful poll (``last_poll`` is the number of seconds
         since the last poll, or ``None`` if the device has never been polled).
         """
-        if not self._supports_polling:
+        if not self.supports_polling or (
+            self.session_active and self.uses_persistent_polling
+        ):
             poll_needed = False
         elif self._device_type in GATT_POLL_MODELS:
             poll_needed = last_poll is None or last_poll > MIN_POLL_INTERVAL
         else:
             poll_needed = (
                 not self._last_full_update
-                or (monotonic_time_coarse() - service_info.time) > MIN_POLL_INTERVAL
+                or (monotonic_time_coarse() - service_info.time) > self.poll_interval
             )
         _LOGGER.debug("Poll needed for INKBIRD device %s: %s", self.name, poll_needed)
         return poll_needed
 
     @property
-    def _supports_polling(self) -> bool:
+    def advertisement_interval(self) -> float | None:
+        """Return the average gap between advertisements, once measured.
+
+        Only tracked with ``adaptive_polling``.
+        """
+        return self._advertisement_interval
+
+    @property
+    def poll_interval(self) -> float:
+        """Return how stale the last advertisement may get before a poll.
+
+        ``MIN_POLL_INTERVAL`` unless ``adaptive_polling`` has measured the
+        device's advertisement cadence.
+        """
+        adaptive = self._adaptive_polling
+        if adaptive is None or (average := self._advertisement_interval) is None:
+            return MIN_POLL_INTERVAL
+        return min(
+            max(average * adaptive.multiplier, adaptive.min_interval),
+            adaptive.max_interval,
+        )
+
+    @property
+    def supports_polling(self) -> bool:
         """Return True if the device supports polling."""
         return self._device_type is not None and (
             (
@@ -1137,7 +2006,9 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
         # If the first attempt fails, clear the cache and try again.
         # This is needed because the cache may contain old data.
         # If the second attempt fails, raise an error.
-        data = await async_connect_action(ble_device, self._async_poll_action)
+        data = await async_connect_action(
+            ble_device, self._async_poll_action, self._connection_limiter
+        )
         if TYPE_CHECKING:
             assert data is not None
         return data
@@ -1149,35 +2020,91 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
         if TYPE_CHECKING:
             assert self._device_type is not None
         dev_info = MODEL_INFO[self._device_type]
-        service = client.services.get_service(dev_info.service_uuid)
-        if self._device_type is Model.INT_11I_B:
-            return await self._async_read_int_11i_b(client, service)
-        char = service.get_characteristic(dev_info.characteristic_uuid)
-        return await client.read_gatt_char(char)
-
-    async def _async_read_int_11i_b(
-        self, client: BleakClientWithServiceCache, service: Any
+        try:
+            if dev_info.read_set:
+                return await self._async_read_set(client, dev_info)
+            return await client.read_gatt_char(
+                self._required_char_handle(
+                    client, dev_info, dev_info.characteristic_uuid
+                )
+            )
+        except BleakCharacteristicNotFoundError:
+            # The device's GATT table changed: resolve every handle again,
+            # alongside the client cache clear in ``async_connect_action``.
+            self._char_handles.clear()
+            raise
+
+    def _char_handle(
+        self,
+        client: BleakClientWithServiceCache,
+        dev_info: ModelInfo,
+        char_uuid: UUID | None,
+    ) -> int | None:
+        """Return a characteristic's handle, looking it up on first use only.
+
+        ``None`` (cached too) means the device does not have it.
+        """
+        handles = self._char_handles
+        if char_uuid not in handles:
+            service = client.services.get_service(dev_info.service_uuid)
+            char = service.get_characteristic(char_uuid) if service else None
+            handles[char_uuid] = char.handle if char else None
+        return handles[char_uuid]
+
+    def _required_char_handle(
+        self,
+        client: BleakClientWithServiceCache,
+        dev_info: ModelInfo,
+        char_uuid: UUID | None,
+    ) -> int:
+        """Return a characteristic's handle, raising if the device lacks it."""
+        if (handle := self._char_handle(client, dev_info, char_uuid)) is None:
+            raise BleakCharacteristicNotFoundError(str(char_uuid))
+        return handle
+
+    async def _async_read_set(
+        self, client: BleakClientWithServiceCache, dev_info: ModelInfo
     ) -> bytes:
-        """Read the INT-11I-B temperature and battery characteristics.
-
-        Unlike the INT-11P-B (single ``fff1`` read), the INT-11I-B exposes
-        temperature on ``ff01`` and the two battery levels on the standard
-        ``2a19`` characteristic. The two reads are concatenated into a single
-        buffer — temperature first (2 bytes), then battery (2 bytes) — so the
-        existing ``async_poll`` short-read guards still apply. The battery
-        characteristic is optional: if it is absent we return temperature only.
+        """Read every characteristic of the model's read set at once.
+
+        The reads are all issued before any is awaited, so the backend can
+        pipeline them instead of paying one round trip each. Each result is
+        cut to its ``length`` and appended in read set order; a read shorter
+        than its ``length`` ends the buffer there, so it stays short for the
+        decoder's short-read guard rather than being backfilled by the next
+        characteristic (e.g. an INT-11I-B battery read landing in the
+        temperature slot).
         """
-        temp_char = service.get_characteristic(INT_11I_B_TEMP_CHARACTERISTIC_UUID)
-        temperature = await client.read_gatt_char(temp_char)
-        if len(temperature) < INT_11I_B_TEMP_READ_LEN:
-            # A short temperature read must stay short so the decode guard drops
-            # it; appending the battery bytes would backfill the temp slot.
-            return bytes(temperature)
-        battery = b""
-        batt_char = service.get_characteristic(INT_11I_B_BATTERY_CHARACTERISTIC_UUID)
-        if batt_char is not None:
-            battery = await client.read_gatt_char(batt_char)
-        return bytes(temperature[:2]) + bytes(battery[:2])
+        reads = [
+            (
+                read,
+                self._required_char_handle(client, dev_info, read.uuid)
+                if read.required
+                else self._char_handle(client, dev_info, read.uuid),
+            )
+            for read in dev_info.read_set
+        ]
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(client.read_gatt_char(handle))
+                    for _, handle in reads
+                    if handle is not None
+                ]
+        except ExceptionGroup as err:
+            # The other reads are cancelled; surface the failure as the bare
+            # BleakError/TimeoutError ``async_connect_action`` retries on.
+            raise err.exceptions[0] from None
+        results = iter(tasks)
+        buffer = bytearray()
+        for read, handle in reads:
+            if handle is None:
+                continue
+            data = next(results).result()
+            buffer += data[: read.length]
+            if len(data) < read.length:
+                break
+        return bytes(buffer)
 
     def _poll_read_too_short(self, payload: bytes, minimum: int) -> bool:
         """Return ``True`` (and log) when a GATT poll read is undersized.
@@ -1199,49 +2126,85 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
 
     async def async_poll(self, ble_device: BLEDevice) -> SensorUpdate:
         """Poll the device for updates."""
-        payload = await self._async_connect_and_read(ble_device)
+        self._decode_poll_payload(await self._async_connect_and_read(ble_device))
+        return self._finish_update()
+
+    def _decode_poll_payload(self, payload: bytes) -> None:
+        """Decode the bytes read by a GATT poll into the sensor state."""
         if self._device_type in EIGHTEEN_BYTE_SENSOR_MODELS:
             if not self._poll_read_too_short(payload, EIGHTEEN_BYTE_POLL_MIN_READ_LEN):
-                self._update_eighteen_byte_model_from_raw(payload[5:9], payload[9])
+                temp, hum = POLL_TEMP_HUM_UNPACK(payload, 5)
+                self._update_eighteen_byte_model_from_raw(temp, hum, payload[9])
         elif self._device_type in NINE_BYTE_SENSOR_MODELS:
             # Battery doesn't seem to be available for these models
             # but it is in the advertisement data
             if not self._poll_read_too_short(payload, NINE_BYTE_POLL_MIN_READ_LEN):
-                self._update_nine_byte_model_from_raw(payload[0:4], None)
+                temp, hum = POLL_TEMP_HUM_UNPACK(payload, 0)
+                self._update_nine_byte_model_from_raw(temp, hum, None)
         elif self._device_type == Model.INT_11P_B:
             self._update_int_11p_b_from_raw(payload)
         elif self._device_type == Model.INT_11I_B:
             self._update_int_11i_b_from_raw(payload)
-        return self._finish_update()
 
-    def _update_bbq_model(self, data: bytes, _msg_length: int) -> None:
-        """Update a BBQ sensor model."""
+    def _bbq_decoder(self, dev_info: ModelInfo) -> Callable[[int, bytes], None]:
+        """Build the advertisement decoder for a BBQ sensor model."""
         # Some are iBBQ, some are xBBQ
         if TYPE_CHECKING:
-            assert self._device_type is not None
-        xvalue = data[10:]
-        for idx, temp in enumerate(MODEL_INFO[self._device_type].unpacker(xvalue)):
-            if temp in BBQ_PROBE_NOT_CONNECTED:
-                # Probe not plugged in; skip it instead of reporting 6553.5°C.
-                continue
-            num = idx + 1
-            self.update_predefined_sensor(
-                SensorLibrary.TEMPERATURE__CELSIUS,
-                convert_temperature(temp),
-                key=f"temperature_probe_{num}",
-                name=f"Temperature Probe {num}",
+            assert dev_info.adv_struct is not None
+        unpack_from = dev_info.adv_struct.unpack_from
+        update_probe_temperature = self._update_probe_temperature
+        probe_sensors = dev_info.probe_sensors
+
+        def _decode(_manufacturer_id: int, payload: bytes) -> None:
+            for probe, temp in zip(probe_sensors, unpack_from(payload), strict=True):
+                if temp in BBQ_PROBE_NOT_CONNECTED:
+                    # Probe not plugged in; skip it instead of reporting 6553.5°C.
+                    continue
+                update_probe_temperature(probe, convert_temperature(temp))
+
+        return _decode
+
+    def _update_probe_temperature(
+        self, probe: ProbeSensor, temperature: float | None
+    ) -> None:
+        """Update a probe temperature from its prebuilt key and description.
+
+        Equivalent to ``update_predefined_sensor`` with the probe's key and
+        name (including its precision rounding), minus building the key and
+        description on every call.
+        """
+        if temperature is not None and self.precision != NO_PRECISION:
+            temperature = round(temperature, self.precision)
+        device_key = probe.device_key
+        self._sensor_values_updates[device_key] = SensorValue(
+            device_key=device_key, name=probe.name, native_value=temperature
+        )
+        self._sensor_descriptions_updates[device_key] = probe.description
+
+    def _nine_byte_decoder(self, dev_info: ModelInfo) -> Callable[[int, bytes], None]:
+        """Build the advertisement decoder for a 9 byte model."""
+        if TYPE_CHECKING:
+            assert dev_info.adv_struct is not None
+        unpack_from = dev_info.adv_struct.unpack_from
+        update_from_raw = self._update_nine_byte_model_from_raw
+
+        def _decode(manufacturer_id: int, payload: bytes) -> None:
+            # The temperature is the manufacturer id read as a signed
+            # little-endian 16-bit value, so it is sign-extended from the int
+            # key instead of being serialized back to bytes.
+            temp = (
+                manufacturer_id - 0x10000
+                if manufacturer_id & 0x8000
+                else manufacturer_id
             )
+            hum, bat = unpack_from(payload)
+            update_from_raw(temp, hum, bat)
 
-    def _update_nine_byte_model(self, data: bytes, _msg_length: int) -> None:
-        """Update the sensor values for a 9 byte model."""
-        self._update_nine_byte_model_from_raw(data[0:4], data[7])
+        return _decode
 
     def _update_nine_byte_model_from_raw(
-        self, temp_hum_bytes: bytes, bat: int | None
+        self, temp: int, hum: int, bat: int | None
     ) -> None:
-        if TYPE_CHECKING:
-            assert self._device_type is not None
-        temp, hum = MODEL_INFO[self._device_type].unpacker(temp_hum_bytes)
         # Only some models report humidity: IBS-TH always, IBS-TH2 when non-zero.
         reports_humidity = self._device_type == Model.IBS_TH or (
             self._device_type == Model.IBS_TH2 and hum != 0
@@ -1265,9 +2228,19 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
             # for some models
             self.update_predefined_sensor(SensorLibrary.BATTERY__PERCENTAGE, bat)
 
-    def _update_eighteen_byte_model(self, data: bytes, _msg_length: int) -> None:
-        """Update the sensor values for a 18 byte model."""
-        self._update_eighteen_byte_model_from_raw(data[6:10], data[10])
+    def _eighteen_byte_decoder(
+        self, dev_info: ModelInfo
+    ) -> Callable[[int, bytes], None]:
+        """Build the advertisement decoder for a 18 byte model."""
+        if TYPE_CHECKING:
+            assert dev_info.adv_struct is not None
+        unpack_from = dev_info.adv_struct.unpack_from
+        update_from_raw = self._update_eighteen_byte_model_from_raw
+
+        def _decode(_manufacturer_id: int, payload: bytes) -> None:
+            update_from_raw(*unpack_from(payload))
+
+        return _decode
 
     def _is_humidity_plausible(self, humidity: float) -> bool:
         """Return ``False`` for a physically impossible humidity reading.
@@ -1370,12 +2343,9 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
         return True
 
     def _update_eighteen_byte_model_from_raw(
-        self, temp_hum_bytes: bytes, bat: int
+        self, temp: int, hum: int, bat: int
     ) -> None:
         """Update the sensor values for a 18 byte model."""
-        if TYPE_CHECKING:
-            assert self._device_type is not None
-        temp, hum = MODEL_INFO[self._device_type].unpacker(temp_hum_bytes)
         humidity = hum / 10
         if not self._is_humidity_plausible(humidity):
             return
@@ -1388,22 +2358,34 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
         if hum != 0:
             self.update_predefined_sensor(SensorLibrary.HUMIDITY__PERCENTAGE, humidity)
 
-    def _update_seventeen_byte_model(self, data: bytes, _msg_length: int) -> None:
+    def _seventeen_byte_decoder(
+        self, dev_info: ModelInfo
+    ) -> Callable[[int, bytes], None]:
+        """Build the advertisement decoder for 17-byte sensor models (IAM-T2)."""
+        if TYPE_CHECKING:
+            assert dev_info.adv_struct is not None
+        unpack_from = dev_info.adv_struct.unpack_from
+        update_from_raw = self._update_seventeen_byte_model_from_raw
+
+        def _decode(_manufacturer_id: int, payload: bytes) -> None:
+            update_from_raw(*unpack_from(payload))
+
+        return _decode
+
+    def _update_seventeen_byte_model_from_raw(
+        self, status: int, temperature_raw: int, humidity_raw: int, co2: int
+    ) -> None:
         """Update the sensor values for 17-byte sensor models (IAM-T2)."""
         # Data format is 17 bytes total: a 2-byte manufacturer ID followed by
         # a 15-byte payload laid out as 6 bytes of MAC, 1 unknown byte, 1
         # status byte, then 2 bytes each of temperature, humidity and CO2, and
         # finally 1 battery byte.
 
-        # Parse status byte
-        status = data[9]
-
-        # Parse sensor values (all big-endian). Temperature is signed: sub-zero
-        # readings arrive as two's-complement (e.g. -5.0C -> 0xFFCE). Parsing it
+        # The status byte and sensor values (all big-endian) arrive already
+        # unpacked by the decode plan. Temperature is signed: sub-zero readings
+        # arrive as two's-complement (e.g. -5.0C -> 0xFFCE). Parsing it
         # unsigned reports ~6553C for any negative temperature (see #155 family).
-        temperature_raw = int.from_bytes(data[10:12], "big", signed=True)
-        humidity = ((data[12] << 8) | data[13]) / 10.0
-        co2 = (data[14] << 8) | data[15]
+        humidity = humidity_raw / 10.0
 
         # Temperature is in tenths of degrees
         if status & 0x02:  # Fahrenheit mode
@@ -1481,7 +2463,8 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
         """Update the sensor values for an INT-11I-B GATT read.
 
         ``payload`` is the temperature read (``ff01``) followed by the optional
-        battery read (``2a19``), concatenated by ``_async_read_int_11i_b``. The
+        battery read (``2a19``), concatenated by ``_async_read_set`` from the
+        model's ``read_set``. The
         decode follows the working community ESPHome config from issue #238:
         the temperature is a little-endian uint16 of Fahrenheit x 100, and the
         battery characteristic carries the base-station and probe percentages.
@@ -1510,30 +2493,53 @@ class INKBIRDBluetoothDeviceData(BluetoothData):
                     SensorLibrary.BATTERY__PERCENTAGE, battery, key=key, name=name
                 )
 
-    _device_type_dispatch: ClassVar[
-        dict[Model, Callable[[INKBIRDBluetoothDeviceData, bytes, int], None]]
+    _iam_t1_notify_handlers: ClassVar[
+        dict[
+            tuple[int, int, int],
+            Callable[[INKBIRDBluetoothDeviceData, bytearray], None],
+        ]
+    ]
+
+    _adv_decoder_factories: ClassVar[
+        dict[
+            Model,
+            Callable[
+                [INKBIRDBluetoothDeviceData, ModelInfo], Callable[[int, bytes], None]
+            ],
+        ]
     ]
 
 
-INKBIRDBluetoothDeviceData._device_type_dispatch = {  # noqa: SLF001
+INKBIRDBluetoothDeviceData._adv_decoder_factories = {  # noqa: SLF001
     **dict.fromkeys(
         BBQ_MODELS,
-        INKBIRDBluetoothDeviceData._update_bbq_model,  # noqa: SLF001
+        INKBIRDBluetoothDeviceData._bbq_decoder,  # noqa: SLF001
     ),
     **dict.fromkeys(
         NINE_BYTE_SENSOR_MODELS,
-        INKBIRDBluetoothDeviceData._update_nine_byte_model,  # noqa: SLF001
+        INKBIRDBluetoothDeviceData._nine_byte_decoder,  # noqa: SLF001
     ),
     **dict.fromkeys(
         EIGHTEEN_BYTE_SENSOR_MODELS,
-        INKBIRDBluetoothDeviceData._update_eighteen_byte_model,  # noqa: SLF001
+        INKBIRDBluetoothDeviceData._eighteen_byte_decoder,  # noqa: SLF001
     ),
     **dict.fromkeys(
         SEVENTEEN_BYTE_SENSOR_MODELS,
-        INKBIRDBluetoothDeviceData._update_seventeen_byte_model,  # noqa: SLF001
+        INKBIRDBluetoothDeviceData._seventeen_byte_decoder,  # noqa: SLF001
     ),
 }
 
+INKBIRDBluetoothDeviceData._iam_t1_notify_handlers = {  # noqa: SLF001
+    (
+        IAM_T1_STATE_NOTIFY_LENGTH,
+        *IAM_T1_NOTIFY_STATE_PREFIX,
+    ): INKBIRDBluetoothDeviceData._notify_iam_t1_state,  # noqa: SLF001
+    (
+        IAM_T1_DATA_NOTIFY_LENGTH,
+        *IAM_T1_NOTIFY_DATA_PREFIX,
+    ): INKBIRDBluetoothDeviceData._notify_iam_t1_data,  # noqa: SLF001
+}
+
 INKBIRDBluetoothDeviceData._notify_dispatch = {  # noqa: SLF001
     Model.IAM_T1: INKBIRDBluetoothDeviceData._notify_iam_t1,  # noqa: SLF001
     Model.IHT_2PB: INKBIRDBluetoothDeviceData._notify_iht_2pb,  # noqa: SLF001
@@ -0,0 +1,234 @@
+"""Spread connectable polls across a fleet of INKBIRD devices."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import logging
+from typing import TYPE_CHECKING
+
+from bleak.exc import BleakError
+from bluetooth_data_tools import monotonic_time_coarse
+
+from .parser import GATT_POLL_MODELS, MIN_POLL_INTERVAL
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from bleak.backends.device import BLEDevice
+    from sensor_state_data import SensorUpdate
+
+    from .parser import INKBIRDBluetoothDeviceData
+
+_LOGGER = logging.getLogger(__name__)
+
+# Polls in flight at once. Each one holds a connection slot on the adapter for
+# the whole connect/read/disconnect, so keep this well under the slot count.
+DEFAULT_MAX_CONCURRENT_POLLS = 2
+# The fractional part of ``k / golden ratio`` spreads any number of devices
+# almost evenly over the interval without knowing the count up front.
+_PHASE_STEP = 0.6180339887498949
+
+
+class PollScheduler:
+    """Decide when each device is polled and cap how many poll at once.
+
+    Devices are kept in a heap ordered by when their next poll is due. A new
+    device gets a staggered first due time inside one ``interval``, so a
+    restart with many devices turns into a steady trickle of polls instead
+    of all of them at once. After a poll the device is due again
+    ``interval`` seconds later; devices whose readings come in their
+    advertisements are pushed back by every advertisement instead (by their
+    parser's ``poll_interval`` once adaptive polling has measured it), so
+    they are only polled once they go quiet. At most ``max_concurrent`` devices
+    are handed out at a time.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_POLLS,
+        interval: float = MIN_POLL_INTERVAL,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._max_concurrent = max_concurrent
+        self._interval = interval
+        self._parsers: dict[str, INKBIRDBluetoothDeviceData] = {}
+        # (due, address), at or before the device's due time in ``_due``: a
+        # due time that moves later leaves its entry in place, to be moved
+        # along once it reaches the top, so only earlier due times push.
+        self._heap: list[tuple[float, str]] = []
+        self._due: dict[str, float] = {}
+        self._in_flight: set[str] = set()
+        self._added = 0
+        self._wakeup = asyncio.Event()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        """Return the number of scheduled devices."""
+        return len(self._parsers)
+
+    def __contains__(self, address: object) -> bool:
+        """Return True if the address is scheduled."""
+        return address in self._parsers
+
+    @property
+    def next_due(self) -> float | None:
+        """Return the monotonic time the next poll is due, if any."""
+        top = self._peek()
+        return top[0] if top else None
+
+    def add(
+        self,
+        address: str,
+        parser: INKBIRDBluetoothDeviceData,
+        now: float | None = None,
+    ) -> None:
+        """Schedule a device; ignored if it is known or cannot be polled."""
+        if address in self._parsers or not parser.supports_polling:
+            return
+        self._parsers[address] = parser
+        if address in self._in_flight:
+            # Removed and re-added mid-poll: ``poll_finished`` schedules it.
+            return
+        if now is None:
+            now = monotonic_time_coarse()
+        phase = self._added * _PHASE_STEP % 1 * self._interval
+        self._added += 1
+        self._set_due(address, now + phase)
+
+    def remove(self, address: str) -> None:
+        """Stop scheduling a device (e.g. after ``INKBIRDFleet.evict_idle``)."""
+        self._parsers.pop(address, None)
+        self._due.pop(address, None)
+
+    def advertisement_seen(self, address: str, seen: float) -> None:
+        """Push back the next poll of a device that reports in advertisements."""
+        parser = self._parsers.get(address)
+        if (
+            parser is None
+            or parser.device_type in GATT_POLL_MODELS
+            or address in self._in_flight
+        ):
+            return
+        # A parser with adaptive polling knows how stale its device may get.
+        interval = (
+            self._interval
+            if parser.advertisement_interval is None
+            else parser.poll_interval
+        )
+        due = seen + interval
+        if due > self._due[address]:
+            self._set_due(address, due)
+
+    def pop_due(self, now: float | None = None) -> list[str]:
+        """Return the devices due now, up to the free concurrency slots.
+
+        Each returned device counts as in flight until ``poll_finished``.
+        """
+        if now is None:
+            now = monotonic_time_coarse()
+        due: list[str] = []
+        heap = self._heap
+        while (
+            len(self._in_flight) < self._max_concurrent
+            and (top := self._peek()) is not None
+        ):
+            when, address = top
+            if when > now:
+                break
+            heapq.heappop(heap)
+            del self._due[address]
+            self._in_flight.add(address)
+            due.append(address)
+        return due
+
+    def poll_finished(self, address: str, now: float | None = None) -> None:
+        """Release a device's slot and schedule its next poll."""
+        self._in_flight.discard(address)
+        if address in self._parsers:
+            if now is None:
+                now = monotonic_time_coarse()
+            self._set_due(address, now + self._interval)
+        self._wakeup.set()
+
+    async def async_run(
+        self,
+        ble_device_callback: Callable[[str], BLEDevice | None],
+        update_callback: Callable[[str, SensorUpdate], None],
+    ) -> None:
+        """Poll devices as they come due until cancelled.
+
+        ``ble_device_callback`` returns the ``BLEDevice`` to connect to for
+        an address (``None`` skips this round), and every successful poll's
+        update is passed to ``update_callback``. A failed poll is retried
+        after ``interval`` like a successful one.
+        """
+        try:
+            while True:
+                for address in self.pop_due():
+                    task = asyncio.create_task(
+                        self._async_poll(address, ble_device_callback, update_callback)
+                    )
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                timeout = None
+                if (
+                    len(self._in_flight) < self._max_concurrent
+                    and (next_due := self.next_due) is not None
+                ):
+                    timeout = max(next_due - monotonic_time_coarse(), 0)
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+        finally:
+            tasks = list(self._tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _async_poll(
+        self,
+        address: str,
+        ble_device_callback: Callable[[str], BLEDevice | None],
+        update_callback: Callable[[str, SensorUpdate], None],
+    ) -> None:
+        try:
+            parser = self._parsers.get(address)
+            if parser is None or (ble_device := ble_device_callback(address)) is None:
+                return
+            try:
+                update = await parser.async_poll(ble_device)
+            except (BleakError, TimeoutError) as err:
+                _LOGGER.debug("Poll of %s failed: %s", address, str(err) or type(err))
+                return
+            update_callback(address, update)
+        except Exception:
+            # Nothing awaits the poll task, so this is the only report.
+            _LOGGER.exception("Unexpected error polling %s", address)
+        finally:
+            self.poll_finished(address)
+
+    def _set_due(self, address: str, due: float) -> None:
+        """Set a device's due time, waking ``async_run`` if it moved earlier."""
+        previous = self._due.get(address)
+        self._due[address] = due
+        if previous is None or due < previous:
+            heapq.heappush(self._heap, (due, address))
+            self._wakeup.set()
+
+    def _peek(self) -> tuple[float, str] | None:
+        """Return the heap entry of the device due first, dropping stale ones."""
+        heap = self._heap
+        while heap:
+            when, address = heap[0]
+            due = self._due.get(address)
+            if due == when:
+                return heap[0]
+            if due is None or due < when:
+                # Removed or polled, or superseded by an earlier entry.
+                heapq.heappop(heap)
+            else:
+                # Deferred since this entry was pushed.
+                heapq.heapreplace(heap, (due, address))
+        return None
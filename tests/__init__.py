@@ -2,13 +2,21 @@ from __future__ import annotations
 
 import asyncio
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from bleak.backends.device import BLEDevice
+from bluetooth_data_tools import monotonic_time_coarse
+from habluetooth import BluetoothServiceInfoBleak
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+    from sensor_state_data import SensorUpdate
+
 _MONOTONIC_RESOLUTION = 0.0001
 
+IDT_34C_B_ADDRESS = "A4:C1:38:81:F1:4C"
+
 
 def async_fire_time_changed(utc_datetime: datetime) -> None:
     timestamp = utc_datetime.timestamp()
@@ -25,3 +33,58 @@ def async_fire_time_changed(utc_datetime: datetime) -> None:
         if mock_seconds_into_future >= future_seconds:
             task._run()  # noqa: SLF001
             task.cancel()
+
+
+async def spin() -> None:
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def entity_values(update: SensorUpdate) -> dict[str, Any]:
+    return {key.key: value.native_value for key, value in update.entity_values.items()}
+
+
+def make_bluetooth_service_info(  # noqa: PLR0913
+    name: str,
+    manufacturer_data: dict[int, bytes],
+    service_uuids: list[str],
+    address: str,
+    rssi: int,
+    service_data: dict[str, bytes],
+    source: str,
+    tx_power: int = 0,
+    raw: bytes | None = None,
+    time: float | None = None,
+) -> BluetoothServiceInfoBleak:
+    return BluetoothServiceInfoBleak(
+        name=name,
+        manufacturer_data=manufacturer_data,
+        service_uuids=service_uuids,
+        address=address,
+        rssi=rssi,
+        service_data=service_data,
+        source=source,
+        device=BLEDevice(
+            name=name,
+            address=address,
+            details={},
+        ),
+        time=monotonic_time_coarse() if time is None else time,
+        advertisement=None,
+        connectable=True,
+        tx_power=tx_power,
+        raw=raw,
+    )
+
+
+def make_idt_34c_b_service_info() -> BluetoothServiceInfoBleak:
+    """An IDT-34c-B advertisement: only its name and the ff00 service UUID."""
+    return make_bluetooth_service_info(
+        name="IDT-34c-B",
+        manufacturer_data={},
+        service_uuids=["0000ff00-0000-1000-8000-00805f9b34fb"],
+        address=IDT_34C_B_ADDRESS,
+        rssi=-50,
+        service_data={},
+        source="local",
+    )
@@ -0,0 +1,27 @@
+"""Benchmark for the vectorized bulk decoder (see ``test_decode`` for units)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from inkbird_ble import Model
+from inkbird_ble.parser import MANUFACTURER_ID_LEN, MODEL_INFO
+
+from .test_decode import PACKETS
+
+np = pytest.importorskip("numpy")
+
+from inkbird_ble.bulk import decode_payloads  # noqa: E402
+
+if TYPE_CHECKING:
+    from pytest_codspeed import BenchmarkFixture
+
+
+@pytest.mark.parametrize("model", [Model.IBBQ_6, Model.IBS_P02B])
+def test_bulk_decode(benchmark: BenchmarkFixture, model: Model) -> None:
+    """Decode ``PACKETS`` payloads in one vectorized call."""
+    payload_length = MODEL_INFO[model].message_length - MANUFACTURER_ID_LEN
+    payloads = bytes(range(payload_length)) * PACKETS
+    benchmark(decode_payloads, model, payloads)
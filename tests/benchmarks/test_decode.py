@@ -0,0 +1,189 @@
+"""Benchmarks for every advertisement, notify and poll decode path.
+
+Each benchmark feeds ``PACKETS`` real-world payloads through the public entry
+point, so packets/second is ``PACKETS`` divided by the reported time. CI runs
+them under CodSpeed twice: in simulation mode (CPU time) and in memory mode
+(allocations, which divided by ``PACKETS`` gives allocations per packet).
+CodSpeed keeps the result for every commit and flags regressions on pull
+requests. Locally run ``pytest tests/benchmarks --codspeed`` (walltime on a
+non-CodSpeed runner) for a quick table.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bleak.backends.device import BLEDevice
+
+from inkbird_ble import INKBIRDBluetoothDeviceData, Model
+from tests import make_bluetooth_service_info
+
+if TYPE_CHECKING:
+    from habluetooth import BluetoothServiceInfoBleak
+    from pytest_codspeed import BenchmarkFixture
+    from sensor_state_data import SensorUpdate
+
+PACKETS = 1000
+
+# iBBQ header (8 bytes after the manufacturer id) captured from an iBBQ-4.
+IBBQ_HEADER = b"\x00\x000\xe2\x83}\xb5\x02"
+IBBQ_PROBE = b"\x04\x01"  # 26.0 C
+
+ADVERTISEMENTS = {
+    Model.IBBQ_1: ("iBBQ", {0: IBBQ_HEADER + IBBQ_PROBE}, []),
+    Model.IBBQ_2: ("iBBQ", {0: IBBQ_HEADER + IBBQ_PROBE + b"\xff\xff"}, []),
+    Model.IBBQ_4: ("iBBQ", {0: IBBQ_HEADER + IBBQ_PROBE * 2 + b"\xfa\x00" * 2}, []),
+    Model.IBBQ_6: ("iBBQ", {0: IBBQ_HEADER + IBBQ_PROBE * 6}, []),
+    # Nine-byte: the temperature (20.44 C) is the manufacturer id.
+    Model.IBS_TH: (
+        "sps",
+        {2044: b"\xc7\x12\x00\xc8=V\x06"},
+        ["0000fff0-0000-1000-8000-00805f9b34fb"],
+    ),
+    # Seventeen-byte: 28.2 C, 55% humidity, 615 ppm CO2.
+    Model.IAM_T2: (
+        "Ink@IAM-T2",
+        {12884: bytes.fromhex("006200a13e29bed4011a0227026791")},
+        [],
+    ),
+    # Eighteen-byte: 37.4 C, 95% battery.
+    Model.IBS_P02B: (
+        "IBS-P02B",
+        {9289: b"\x11\x18\x00ev\x01\x00\x00_\x00\x00\x01\x00\x00\x00\x00"},
+        ["0000fff0-0000-1000-8000-00805f9b34fb"],
+    ),
+}
+
+NOTIFICATIONS = {
+    Model.IAM_T1: b"U\xaa\x01\x10\x00\x00\xfe\x01\xd6\x02\xd9\x03\xf1\x01\x00\xb5",
+    # Three probe frames coalesced into one notification.
+    Model.IHT_2PB: (
+        b"\x55\xaa\x02\x02\x01\x3d\x41"
+        b"\x55\xaa\x04\x02\x03\xe8\xf0"
+        b"\x55\xaa\x06\x02\xff\xf0\xf6"
+    ),
+    Model.IDT_34C_B: bytes.fromhex("6a03fe7ffe7f8703fe7ffe7f7f"),
+}
+
+POLL_READS = {
+    Model.IBS_TH: b"\x09\x09\x00\x04\xe37\x08",
+    Model.ITH_11_B: b"\x00\x00\x00\x00\x00\xe2\x00\x5c\x02\x5f",
+    Model.INT_11P_B: b"\xaa\x19\x00\x17\x55\xc8\x00",
+    Model.INT_11I_B: b"\x2c\x27\x50\x5a",
+}
+
+
+def _service_info(
+    name: str, manufacturer_data: dict[int, bytes], service_uuids: list[str]
+) -> BluetoothServiceInfoBleak:
+    return make_bluetooth_service_info(
+        name=name,
+        manufacturer_data=manufacturer_data,
+        service_uuids=service_uuids,
+        address="AA:BB:CC:DD:EE:FF",
+        rssi=-60,
+        service_data={},
+        source="local",
+    )
+
+
+@pytest.mark.parametrize("model", list(ADVERTISEMENTS))
+def test_advertisement_decode(benchmark: BenchmarkFixture, model: Model) -> None:
+    """Decode a stream of advertisements from an already detected device."""
+    parser = INKBIRDBluetoothDeviceData()
+    service_info = _service_info(*ADVERTISEMENTS[model])
+    parser.update(service_info)
+    assert parser.device_type is model
+    update = parser.update
+
+    @benchmark
+    def _decode() -> None:
+        for _ in range(PACKETS):
+            update(service_info)
+
+
+def test_advertisement_detect_unsupported(benchmark: BenchmarkFixture) -> None:
+    """Reject a stream of advertisements from an unsupported device."""
+    parser = INKBIRDBluetoothDeviceData()
+    service_info = _service_info(
+        "x",
+        {2044: b"\xc7\x12\x00\xc8=V\x06"},
+        ["0000fff0-0000-1000-8000-00805f9b34fb"],
+    )
+    update = parser.update
+
+    @benchmark
+    def _reject() -> None:
+        for _ in range(PACKETS):
+            update(service_info)
+
+    assert parser.device_type is None
+
+
+@pytest.mark.parametrize("model", list(NOTIFICATIONS))
+def test_notify_decode(benchmark: BenchmarkFixture, model: Model) -> None:
+    """Decode a stream of GATT notifications."""
+    updates: list[SensorUpdate] = []
+    parser = INKBIRDBluetoothDeviceData(model, {}, updates.append, None)
+    data = bytearray(NOTIFICATIONS[model])
+    sender = MagicMock()
+    notify_callback = parser._notify_callback  # noqa: SLF001
+
+    @benchmark
+    def _decode() -> None:
+        for _ in range(PACKETS):
+            notify_callback(sender, data)
+
+    assert updates
+
+
+class _FakeClient:
+    """Minimal stand-in for ``BleakClientWithServiceCache``."""
+
+    def __init__(self, payload: bytes) -> None:
+        self._payload = payload
+        self.services = self
+        # Doubles as the service and the characteristic.
+        self.handle = 1
+
+    def get_service(self, _uuid: Any) -> _FakeClient:
+        return self
+
+    def get_characteristic(self, _uuid: Any) -> _FakeClient:
+        return self
+
+    async def read_gatt_char(self, _char: Any) -> bytes:
+        return self._payload
+
+    async def disconnect(self) -> None:
+        """Pretend to disconnect."""
+
+
+@pytest.mark.parametrize("model", list(POLL_READS))
+def test_async_poll(benchmark: BenchmarkFixture, model: Model) -> None:
+    """Poll a device repeatedly through a fake GATT client."""
+    parser = INKBIRDBluetoothDeviceData(model)
+    ble_device = BLEDevice(name="x", address="AA:BB:CC:DD:EE:FF", details={})
+    client = _FakeClient(POLL_READS[model])
+
+    async def _establish_connection(*_args: Any, **_kwargs: Any) -> _FakeClient:
+        return client
+
+    async def _poll() -> None:
+        for _ in range(PACKETS):
+            await parser.async_poll(ble_device)
+
+    loop = asyncio.new_event_loop()
+    try:
+        with patch("inkbird_ble.parser.establish_connection", _establish_connection):
+
+            @benchmark
+            def _run() -> None:
+                loop.run_until_complete(_poll())
+
+    finally:
+        loop.close()
+    assert parser.descriptions
@@ -0,0 +1,99 @@
+"""Tests for deriving the poll threshold from advertisement cadence."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from bleak.backends.device import BLEDevice
+from habluetooth import BluetoothServiceInfoBleak
+
+from inkbird_ble import (
+    AdaptivePolling,
+    INKBIRDBluetoothDeviceData,
+    Model,
+    PollScheduler,
+)
+from inkbird_ble.parser import MIN_POLL_INTERVAL
+
+ADDRESS = "AA:BB:CC:DD:EE:FF"
+
+
+def _ibs_th(seen: float, temperature: int = 0x12C7) -> BluetoothServiceInfoBleak:
+    """An IBS-TH advertisement heard at monotonic time ``seen``."""
+    return BluetoothServiceInfoBleak(
+        name="sps",
+        manufacturer_data={temperature: b"\x12\x00\xc8=V\x06"},
+        service_uuids=["0000fff0-0000-1000-8000-00805f9b34fb"],
+        address=ADDRESS,
+        rssi=-60,
+        service_data={},
+        source="local",
+        device=BLEDevice(name="sps", address=ADDRESS, details={}),
+        time=seen,
+        advertisement=None,
+        connectable=True,
+        tx_power=0,
+        raw=None,
+    )
+
+
+def _feed(parser: INKBIRDBluetoothDeviceData, *times: float) -> None:
+    for idx, seen in enumerate(times):
+        parser.update(_ibs_th(seen, 0x12C7 + idx))
+
+
+def test_fixed_interval_without_adaptive_polling() -> None:
+    parser = INKBIRDBluetoothDeviceData(Model.IBS_TH)
+    _feed(parser, 0, 10, 20)
+    assert parser.advertisement_interval is None
+    assert parser.poll_interval == MIN_POLL_INTERVAL
+
+
+def test_interval_follows_advertisement_cadence() -> None:
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IBS_TH, adaptive_polling=AdaptivePolling(alpha=0.5, multiplier=3)
+    )
+    assert parser.poll_interval == MIN_POLL_INTERVAL
+    _feed(parser, 0)
+    # The same advertisement seen twice is not a gap.
+    parser.supported(_ibs_th(0))
+    assert parser.advertisement_interval is None
+    _feed(parser, 100, 300)
+    assert parser.advertisement_interval == pytest.approx(150)
+    assert parser.poll_interval == pytest.approx(450)
+
+
+def test_interval_is_bounded() -> None:
+    adaptive = AdaptivePolling(multiplier=3, min_interval=60, max_interval=900)
+    chatty = INKBIRDBluetoothDeviceData(Model.IBS_TH, adaptive_polling=adaptive)
+    _feed(chatty, 0, 2, 4, 6)
+    assert chatty.poll_interval == 60
+    sparse = INKBIRDBluetoothDeviceData(Model.IBS_TH, adaptive_polling=adaptive)
+    _feed(sparse, 0, 600, 1200)
+    assert sparse.poll_interval == 900
+
+
+def test_poll_needed_uses_the_device_cadence() -> None:
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IBS_TH, adaptive_polling=AdaptivePolling(min_interval=10)
+    )
+    _feed(parser, 0, 10, 20, 30)
+    assert parser.poll_interval == 30
+    service_info = _ibs_th(30)
+    with patch("inkbird_ble.parser.monotonic_time_coarse", return_value=55):
+        assert parser.poll_needed(service_info, None) is False
+    # Far sooner than MIN_POLL_INTERVAL: three missed advertisements.
+    with patch("inkbird_ble.parser.monotonic_time_coarse", return_value=61):
+        assert parser.poll_needed(service_info, None) is True
+
+
+def test_scheduler_defers_by_the_device_cadence() -> None:
+    scheduler = PollScheduler(interval=100)
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IBS_TH, adaptive_polling=AdaptivePolling(min_interval=10)
+    )
+    scheduler.add(ADDRESS, parser, now=0)
+    _feed(parser, 0, 10, 20)
+    scheduler.advertisement_seen(ADDRESS, 20)
+    assert scheduler.next_due == 50
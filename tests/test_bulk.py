@@ -0,0 +1,161 @@
+"""Tests for the vectorized bulk decoder."""
+
+from __future__ import annotations
+
+import math
+from typing import cast
+
+import pytest
+from bleak.backends.device import BLEDevice
+from bluetooth_data_tools import monotonic_time_coarse
+from habluetooth import BluetoothServiceInfoBleak
+
+from inkbird_ble import INKBIRDBluetoothDeviceData, Model
+from inkbird_ble.parser import MANUFACTURER_ID_LEN, MODEL_INFO
+
+np = pytest.importorskip("numpy")
+
+from inkbird_ble.bulk import decode_payloads  # noqa: E402
+
+ROWS = 500
+
+
+def _per_packet(
+    model: Model, manufacturer_id: int, payload: bytes
+) -> dict[str, float | None]:
+    """Decode one payload the normal way, through a fresh parser."""
+    parser = INKBIRDBluetoothDeviceData(model)
+    update = parser.update(
+        BluetoothServiceInfoBleak(
+            name="x",
+            manufacturer_data={manufacturer_id: payload},
+            service_uuids=[],
+            address="AA:BB:CC:DD:EE:FF",
+            rssi=-60,
+            service_data={},
+            source="local",
+            device=BLEDevice(name="x", address="AA:BB:CC:DD:EE:FF", details={}),
+            time=monotonic_time_coarse(),
+            advertisement=None,
+            connectable=True,
+            tx_power=0,
+            raw=None,
+        )
+    )
+    return {
+        device_key.key: cast("float | None", value.native_value)
+        for device_key, value in update.entity_values.items()
+        if device_key.key != "signal_strength"
+    }
+
+
+def _assert_column(expected: float | None, actual: float) -> None:
+    if expected is None:
+        assert math.isnan(actual)
+    else:
+        assert actual == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    ("model", "columns"),
+    [
+        (
+            Model.IBS_TH,
+            {
+                "temperature": "temperature",
+                "humidity": "humidity",
+                "battery": "battery",
+            },
+        ),
+        (
+            Model.IBS_TH2,
+            {
+                "temperature": "temperature",
+                "humidity": "humidity",
+                "battery": "battery",
+            },
+        ),
+        (
+            Model.IBS_P02B,
+            {
+                "temperature": "temperature",
+                "humidity": "humidity",
+                "battery": "battery",
+            },
+        ),
+        (
+            Model.IAM_T2,
+            {
+                "temperature": "temperature",
+                "humidity": "humidity",
+                "co2": "carbon_dioxide",
+            },
+        ),
+    ],
+)
+def test_bulk_matches_per_packet_sensor_decoders(
+    model: Model, columns: dict[str, str]
+) -> None:
+    """Random payloads, corrupt ones included, decode as ``update`` would."""
+    rng = np.random.default_rng(1234)
+    payload_length = MODEL_INFO[model].message_length - MANUFACTURER_ID_LEN
+    rows = rng.integers(0, 256, size=(ROWS, payload_length), dtype=np.uint8)
+    # Keep most humidity/battery bytes plausible so both branches are hit.
+    rows[: ROWS // 2] &= 0x0F
+    ids = rng.integers(0, 0x10000, size=ROWS)
+    readings = decode_payloads(model, rows, manufacturer_ids=ids)
+
+    assert readings.valid.any()
+    assert not readings.valid.all()
+    for idx in range(ROWS):
+        expected = _per_packet(model, int(ids[idx]), rows[idx].tobytes())
+        assert bool(readings.valid[idx]) is bool(expected)
+        for column, key in columns.items():
+            _assert_column(expected.get(key), getattr(readings, column)[idx])
+
+
+@pytest.mark.parametrize("model", [Model.IBBQ_1, Model.IBBQ_4, Model.IBBQ_6])
+def test_bulk_bbq_probes(model: Model) -> None:
+    """Probe columns drop unplugged probes and scale like the per-packet path."""
+    payload_length = MODEL_INFO[model].message_length - MANUFACTURER_ID_LEN
+    rng = np.random.default_rng(5678)
+    rows = rng.integers(0, 256, size=(ROWS, payload_length), dtype=np.uint8)
+    rows[::3, 8:10] = 0xFF  # Probe 1 unplugged on every third row.
+    readings = decode_payloads(model, rows.tobytes())
+
+    assert readings.valid.all()
+    assert readings.probes is not None
+    assert readings.temperature is None
+    assert math.isnan(readings.probes[0, 0])
+    for idx in range(ROWS):
+        expected = _per_packet(model, 0, rows[idx].tobytes())
+        for probe in range(readings.probes.shape[1]):
+            _assert_column(
+                expected.get(f"temperature_probe_{probe + 1}"),
+                readings.probes[idx, probe],
+            )
+
+
+def test_bulk_rejects_unusable_input() -> None:
+    """Inputs the per-packet path could not decode raise ``ValueError``."""
+    with pytest.raises(ValueError, match="advertisement"):
+        decode_payloads(Model.IAM_T1, np.zeros((1, 15), dtype=np.uint8))
+    with pytest.raises(ValueError, match="manufacturer_ids"):
+        decode_payloads(Model.IBS_TH, np.zeros((1, 7), dtype=np.uint8))
+    with pytest.raises(ValueError, match="expected 1 manufacturer_ids"):
+        decode_payloads(
+            Model.IBS_TH, np.zeros((1, 7), dtype=np.uint8), manufacturer_ids=[1, 2]
+        )
+    with pytest.raises(ValueError, match="at least"):
+        decode_payloads(Model.IBS_P02B, np.zeros((1, 4), dtype=np.uint8))
+    with pytest.raises(ValueError, match="whole number"):
+        decode_payloads(Model.IBBQ_1, b"\x00" * 11)
+    with pytest.raises(ValueError, match="2-D"):
+        decode_payloads(Model.IBBQ_1, np.zeros(10, dtype=np.uint8))
+
+
+def test_bulk_empty_batch() -> None:
+    readings = decode_payloads("IBS-P02B", b"")
+    assert readings.valid.shape == (0,)
+    assert readings.temperature is not None
+    assert readings.temperature.shape == (0,)
@@ -0,0 +1,125 @@
+"""Tests for the per-adapter connection limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bleak.backends.device import BLEDevice
+
+from inkbird_ble import ConnectionLimiter, INKBIRDBluetoothDeviceData, Model
+from inkbird_ble.connection import DEFAULT_ADAPTER, adapter_key
+
+from . import spin
+
+
+def _device(address: str, details: Any) -> BLEDevice:
+    return BLEDevice(address=address, name="INT-11P-B", details=details)
+
+
+def test_adapter_key() -> None:
+    assert adapter_key(_device("A", {"source": "hci1", "path": "x"})) == "hci1"
+    assert (
+        adapter_key(_device("A", {"path": "/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF"}))
+        == "hci0"
+    )
+    assert adapter_key(_device("A", {"path": "/org"})) == DEFAULT_ADAPTER
+    assert adapter_key(_device("A", None)) == DEFAULT_ADAPTER
+
+
+@pytest.mark.asyncio
+async def test_slots_are_handed_out_in_arrival_order() -> None:
+    limiter = ConnectionLimiter(slots_per_adapter=1)
+    device = _device("A", {"source": "hci0"})
+    release = asyncio.Event()
+    order: list[int] = []
+
+    async def _job(idx: int) -> None:
+        async with limiter.slot(device):
+            order.append(idx)
+            await release.wait()
+
+    tasks = [asyncio.create_task(_job(idx)) for idx in range(3)]
+    await spin()
+    assert order == [0]
+    assert limiter.in_use("hci0") == 1
+    assert limiter.waiting("hci0") == 2
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == [0, 1, 2]
+    assert limiter.in_use("hci0") == 0
+    assert limiter.waiting("hci0") == 0
+    assert limiter.wait_stats("hci0").count == 3
+    assert limiter.adapters == ["hci0"]
+
+
+@pytest.mark.asyncio
+async def test_adapters_are_limited_independently() -> None:
+    limiter = ConnectionLimiter(slots_per_adapter=1)
+    async with (
+        limiter.slot(_device("A", {"source": "hci0"})),
+        limiter.slot(_device("B", {"source": "proxy"})),
+    ):
+        assert limiter.in_use("hci0") == 1
+        assert limiter.in_use("proxy") == 1
+    assert limiter.wait_stats("unknown").count == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_gives_up_its_place() -> None:
+    limiter = ConnectionLimiter(slots_per_adapter=1)
+    device = _device("A", {"source": "hci0"})
+    entered: list[str] = []
+
+    async def _job(name: str) -> None:
+        async with limiter.slot(device):
+            entered.append(name)
+
+    async with limiter.slot(device):
+        cancelled = asyncio.create_task(_job("cancelled"))
+        waiting = asyncio.create_task(_job("waiting"))
+        await spin()
+        cancelled.cancel()
+        await spin()
+        assert limiter.waiting("hci0") == 1
+    await waiting
+    assert cancelled.cancelled()
+    assert entered == ["waiting"]
+    assert limiter.in_use("hci0") == 0
+
+
+@pytest.mark.asyncio
+async def test_polls_sharing_a_limiter_connect_one_at_a_time() -> None:
+    limiter = ConnectionLimiter(slots_per_adapter=1)
+    connected = 0
+    peak = 0
+
+    async def _read(_char: Any) -> bytes:
+        nonlocal connected, peak
+        connected += 1
+        peak = max(peak, connected)
+        await asyncio.sleep(0)
+        return b"\xaa\x20\x80\x1d\xc8\x38\x54"
+
+    async def _disconnect() -> None:
+        nonlocal connected
+        connected -= 1
+
+    client = MagicMock(read_gatt_char=_read, disconnect=_disconnect)
+    parsers = [
+        INKBIRDBluetoothDeviceData(Model.INT_11P_B, connection_limiter=limiter)
+        for _ in range(3)
+    ]
+    with patch(
+        "inkbird_ble.parser.establish_connection", AsyncMock(return_value=client)
+    ):
+        await asyncio.gather(
+            *(
+                parser.async_poll(_device(f"A{idx}", {"source": "hci0"}))
+                for idx, parser in enumerate(parsers)
+            )
+        )
+    assert peak == 1
+    assert limiter.wait_stats("hci0").count == 3
@@ -0,0 +1,86 @@
+"""Tests for delta-only SensorUpdate emission."""
+
+from __future__ import annotations
+
+import struct
+from unittest.mock import patch
+
+from bleak.backends.device import BLEDevice
+from habluetooth import BluetoothServiceInfoBleak
+
+from inkbird_ble import DeltaUpdates, INKBIRDBluetoothDeviceData, Model
+
+from . import entity_values
+
+ADDRESS = "AA:BB:CC:DD:EE:FF"
+
+
+def _ibbq_4(*probes: float, rssi: int = -60) -> BluetoothServiceInfoBleak:
+    """Build an iBBQ-4 advertisement for the given probe temperatures."""
+    payload = bytes(8) + struct.pack("<4h", *(round(probe * 10) for probe in probes))
+    return BluetoothServiceInfoBleak(
+        name="iBBQ",
+        manufacturer_data={0: payload},
+        service_uuids=[],
+        address=ADDRESS,
+        rssi=rssi,
+        service_data={},
+        source="local",
+        device=BLEDevice(name="iBBQ", address=ADDRESS, details={}),
+        time=0,
+        advertisement=None,
+        connectable=True,
+        tx_power=0,
+        raw=None,
+    )
+
+
+def test_without_delta_updates_every_entity_is_returned() -> None:
+    parser = INKBIRDBluetoothDeviceData(Model.IBBQ_4)
+    parser.update(_ibbq_4(20, 21, 22, 23))
+    update = parser.update(_ibbq_4(20, 21, 22, 24))
+    assert len(update.entity_values) == 5
+
+
+def test_delta_updates_return_only_changed_entities() -> None:
+    parser = INKBIRDBluetoothDeviceData(Model.IBBQ_4, delta_updates=DeltaUpdates())
+    with patch("inkbird_ble.parser.monotonic_time_coarse", return_value=1000.0):
+        first = parser.update(_ibbq_4(20, 21, 22, 23))
+        assert entity_values(first) == {
+            "temperature_probe_1": 20,
+            "temperature_probe_2": 21,
+            "temperature_probe_3": 22,
+            "temperature_probe_4": 23,
+            "signal_strength": -60,
+        }
+
+        update = parser.update(_ibbq_4(20, 21, 22, 24))
+        assert entity_values(update) == {"temperature_probe_4": 24}
+        assert set(update.entity_descriptions) == set(update.entity_values)
+        assert update.devices
+
+        update = parser.update(_ibbq_4(20, 21, 22, 24, rssi=-70))
+        assert entity_values(update) == {"signal_strength": -70}
+
+        update = parser.update_many(
+            [_ibbq_4(25, 21, 22, 24, rssi=-70), _ibbq_4(20, 21, 22, 24, rssi=-70)]
+        )
+        assert entity_values(update) == {}
+
+
+def test_delta_updates_send_a_periodic_full_snapshot() -> None:
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IBBQ_4, delta_updates=DeltaUpdates(full_snapshot_interval=60)
+    )
+    with patch("inkbird_ble.parser.monotonic_time_coarse", return_value=1000.0):
+        parser.update(_ibbq_4(20, 21, 22, 23))
+    with patch("inkbird_ble.parser.monotonic_time_coarse", return_value=1059.0):
+        assert entity_values(parser.update(_ibbq_4(20, 21, 22, 24))) == {
+            "temperature_probe_4": 24
+        }
+    with patch("inkbird_ble.parser.monotonic_time_coarse", return_value=1060.0):
+        update = parser.update(_ibbq_4(20, 21, 22, 25))
+    assert len(update.entity_values) == 5
+    assert len(update.entity_descriptions) == 5
+    with patch("inkbird_ble.parser.monotonic_time_coarse", return_value=1061.0):
+        assert entity_values(parser.update(_ibbq_4(20, 21, 22, 25))) == {}
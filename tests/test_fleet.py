@@ -0,0 +1,170 @@
+"""Tests for routing advertisements to per-device parsers."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from inkbird_ble import INKBIRDBluetoothDeviceData, INKBIRDFleet, Model
+
+from . import make_bluetooth_service_info
+
+if TYPE_CHECKING:
+    from habluetooth import BluetoothServiceInfoBleak
+
+IBS_TH_PAYLOAD = b"\x12\x00\xc8=V\x06"
+
+
+def _service_info(
+    address: str,
+    name: str = "sps",
+    manufacturer_data: dict[int, bytes] | None = None,
+    rssi: int = -60,
+    time: float | None = None,
+) -> BluetoothServiceInfoBleak:
+    return make_bluetooth_service_info(
+        name=name,
+        manufacturer_data=(
+            {2044: b"\xc7" + IBS_TH_PAYLOAD}
+            if manufacturer_data is None
+            else manufacturer_data
+        ),
+        service_uuids=["0000fff0-0000-1000-8000-00805f9b34fb"],
+        address=address,
+        rssi=rssi,
+        service_data={},
+        source="local",
+        time=time,
+    )
+
+
+def test_fleet_creates_parser_on_first_matching_advertisement() -> None:
+    fleet = INKBIRDFleet()
+    update = fleet.update(_service_info("AA:BB:CC:DD:EE:01"))
+    assert update is not None
+    assert "AA:BB:CC:DD:EE:01" in fleet
+    parser = fleet.get("AA:BB:CC:DD:EE:01")
+    assert parser is not None
+    assert parser.device_type is Model.IBS_TH
+    values = {
+        key.key: value.native_value for key, value in update.entity_values.items()
+    }
+    assert values["temperature"] == 20.44
+    # Later advertisements are routed to the same parser.
+    fleet.update(_service_info("AA:BB:CC:DD:EE:01", rssi=-70))
+    assert fleet.get("AA:BB:CC:DD:EE:01") is parser
+
+
+def test_fleet_ignores_unsupported_devices() -> None:
+    fleet = INKBIRDFleet()
+    unsupported = _service_info(
+        "AA:BB:CC:DD:EE:02", name="x", manufacturer_data={2044: b"\x00"}
+    )
+    assert fleet.update(unsupported) is None
+    assert fleet.update(unsupported) is None
+    assert len(fleet) == 0
+
+
+def test_fleet_update_many_groups_by_address() -> None:
+    fleet = INKBIRDFleet()
+    updates = fleet.update_many(
+        [
+            _service_info("AA:BB:CC:DD:EE:01", rssi=-60),
+            _service_info("AA:BB:CC:DD:EE:02", rssi=-50),
+            _service_info("AA:BB:CC:DD:EE:03", name="x", manufacturer_data={}),
+            _service_info("AA:BB:CC:DD:EE:01", rssi=-65),
+        ]
+    )
+    assert set(updates) == {"AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02"}
+    rssi = {
+        address: next(
+            value.native_value
+            for key, value in update.entity_values.items()
+            if key.key == "signal_strength"
+        )
+        for address, update in updates.items()
+    }
+    assert rssi == {"AA:BB:CC:DD:EE:01": -65, "AA:BB:CC:DD:EE:02": -50}
+    updates = fleet.update_many([_service_info("AA:BB:CC:DD:EE:02", rssi=-40)])
+    assert set(updates) == {"AA:BB:CC:DD:EE:02"}
+
+
+def test_fleet_caps_devices_by_evicting_least_recently_seen() -> None:
+    fleet = INKBIRDFleet(max_devices=2)
+    fleet.update(_service_info("AA:BB:CC:DD:EE:01"))
+    fleet.update(_service_info("AA:BB:CC:DD:EE:02"))
+    # Hearing from the first device again makes the second the oldest.
+    fleet.update(_service_info("AA:BB:CC:DD:EE:01"))
+    fleet.update(_service_info("AA:BB:CC:DD:EE:03"))
+    assert len(fleet) == 2
+    assert "AA:BB:CC:DD:EE:01" in fleet
+    assert "AA:BB:CC:DD:EE:02" not in fleet
+    assert "AA:BB:CC:DD:EE:03" in fleet
+
+
+async def _hold(release: asyncio.Event) -> None:
+    await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_fleet_cap_skips_devices_with_an_active_session() -> None:
+    fleet = INKBIRDFleet(max_devices=2)
+    fleet.update(_service_info("AA:BB:CC:DD:EE:01"))
+    fleet.update(_service_info("AA:BB:CC:DD:EE:02"))
+    session = fleet.get("AA:BB:CC:DD:EE:01")
+    assert session is not None
+    release = asyncio.Event()
+    session._notify_task = asyncio.create_task(_hold(release))  # noqa: SLF001
+    assert session.session_active
+    fleet.update(_service_info("AA:BB:CC:DD:EE:03"))
+    assert fleet.get("AA:BB:CC:DD:EE:01") is session
+    assert "AA:BB:CC:DD:EE:02" not in fleet
+    # Only devices holding a session are left, so the fleet grows instead.
+    other = fleet.get("AA:BB:CC:DD:EE:03")
+    assert other is not None
+    other._notify_task = asyncio.create_task(_hold(release))  # noqa: SLF001
+    fleet.update(_service_info("AA:BB:CC:DD:EE:04"))
+    assert len(fleet) == 3
+    release.set()
+    await session.async_stop()
+    await other.async_stop()
+    assert not session.session_active
+
+
+def test_fleet_checks_every_advertisement_against_the_negative_cache() -> None:
+    fleet = INKBIRDFleet()
+    unsupported = _service_info(
+        "AA:BB:CC:DD:EE:01", name="x", manufacturer_data={2044: b"\x00"}
+    )
+    assert fleet.update(unsupported) is None
+    # The first advertisement of the burst is a known miss, the second is not.
+    updates = fleet.update_many([unsupported, _service_info("AA:BB:CC:DD:EE:01")])
+    assert set(updates) == {"AA:BB:CC:DD:EE:01"}
+    parser = fleet.get("AA:BB:CC:DD:EE:01")
+    assert parser is not None
+    assert parser.device_type is Model.IBS_TH
+
+
+def test_fleet_evict_idle() -> None:
+    fleet = INKBIRDFleet()
+    fleet.update(_service_info("AA:BB:CC:DD:EE:01", time=100.0))
+    fleet.update(_service_info("AA:BB:CC:DD:EE:02", time=200.0))
+    parser = fleet.get("AA:BB:CC:DD:EE:01")
+    assert fleet.evict_idle(150.0, now=300.0) == {"AA:BB:CC:DD:EE:01": parser}
+    assert len(fleet) == 1
+    assert fleet.evict_idle(150.0, now=300.0) == {}
+
+
+def test_fleet_parser_factory() -> None:
+    created: list[str] = []
+
+    def _factory(address: str) -> INKBIRDBluetoothDeviceData:
+        created.append(address)
+        return INKBIRDBluetoothDeviceData()
+
+    fleet = INKBIRDFleet(parser_factory=_factory)
+    fleet.update(_service_info("AA:BB:CC:DD:EE:01"))
+    fleet.update(_service_info("AA:BB:CC:DD:EE:01"))
+    assert created == ["AA:BB:CC:DD:EE:01"]
@@ -13,7 +13,11 @@ from bluetooth_data_tools import monotonic_time_coarse
 from habluetooth import BluetoothServiceInfoBleak
 
 from inkbird_ble import INKBIRDBluetoothDeviceData, Model
-from inkbird_ble.parser import IDT_34C_B_BATTERY_UUID
+from inkbird_ble.parser import (
+    IDT_34C_B_BATTERY_UUID,
+    IDT_34C_B_CELSIUS,
+    IDT_34C_B_CELSIUS_MIN_RAW,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -295,3 +299,40 @@ async def test_notify_idt_34c_b_without_update_callback() -> None:
         )
         await asyncio.sleep(0)
         await parser.async_stop()
+
+
+def test_idt_34c_b_celsius_table_matches_conversion() -> None:
+    """The lookup table holds exactly the Fahrenheit x 10 -> Celsius result."""
+    for idx, celsius in enumerate(IDT_34C_B_CELSIUS):
+        raw = idx + IDT_34C_B_CELSIUS_MIN_RAW
+        assert celsius == round((raw / 10.0 - 32) * 5 / 9, 1)
+
+
+def test_notify_idt_34c_b_out_of_table_range_and_status() -> None:
+    """Readings beyond the table still convert; the status byte is exposed."""
+    updates: list[SensorUpdate] = []
+    device_data_changed = MagicMock()
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IDT_34C_B, {}, updates.append, device_data_changed
+    )
+    parser.update(_service_info())
+    notify = parser._notify_callback  # noqa: SLF001
+    sender = MagicMock()
+    statuses = [parser.notify_status]
+
+    # probe 1 = 0x1F40 = 800.0 F -> 426.7 C, probe 2 = -50.0 F -> -45.6 C.
+    frame = bytearray.fromhex("401f0cfefe7ffe7ffe7ffe7f7f")
+    notify(sender, frame)
+    statuses.append(parser.notify_status)
+    frame[-1] = 0x3F
+    notify(sender, frame)
+    statuses.append(parser.notify_status)
+    assert statuses == [None, 0x7F, 0x3F]
+
+    values = {
+        key.key: value.native_value for key, value in updates[-1].entity_values.items()
+    }
+    assert values["temperature_probe_1"] == 426.7
+    assert values["temperature_probe_2"] == -45.6
+    # The status is not persisted device configuration.
+    device_data_changed.assert_not_called()
@@ -0,0 +1,103 @@
+"""Tests for notify latency instrumentation."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bleak.backends.device import BLEDevice
+
+from inkbird_ble import INKBIRDBluetoothDeviceData, Model, NotifyQueueing
+from inkbird_ble.latency import BUCKET_COUNT, LatencyHistogram
+
+from . import IDT_34C_B_ADDRESS, make_idt_34c_b_service_info
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+IDT_34C_B_FRAME = bytearray.fromhex("6a03fe7ffe7f8703fe7ffe7f7f")
+# Long enough that a decode never comes close, even on a loaded machine.
+SLOW_CALLBACK = 0.02
+
+
+def test_histogram_buckets_by_power_of_two_microseconds() -> None:
+    histogram = LatencyHistogram()
+    for seconds in (0.0000005, 0.000001, 0.000003, 0.000003, 0.001, 3600.0):
+        histogram.record(seconds)
+    snapshot = histogram.snapshot()
+    assert snapshot.count == 6
+    assert snapshot.max == 3600.0
+    assert snapshot.buckets[0] == 1  # under 1 us
+    assert snapshot.buckets[1] == 1  # [1, 2) us
+    assert snapshot.buckets[2] == 2  # [2, 4) us
+    assert snapshot.buckets[10] == 1  # 1000 us is in [512, 1024)
+    assert snapshot.buckets[BUCKET_COUNT - 1] == 1  # open-ended overflow
+    assert snapshot.percentile(50) == 0.000004
+    assert snapshot.percentile(100) == 3600.0
+    assert snapshot.mean == pytest.approx(3600.0010075 / 6)
+
+
+def test_empty_histogram() -> None:
+    snapshot = LatencyHistogram().snapshot()
+    assert snapshot.mean == 0.0
+    assert snapshot.percentile(99) == 0.0
+
+
+def test_stats_disabled_by_default() -> None:
+    assert INKBIRDBluetoothDeviceData(Model.IDT_34C_B).stats() is None
+
+
+def test_inline_notify_stats_separate_decode_and_callback() -> None:
+    def _slow_callback(_update: object) -> None:
+        time.sleep(SLOW_CALLBACK)
+
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IDT_34C_B, {}, _slow_callback, notify_stats=True
+    )
+    for _ in range(3):
+        parser._notify_callback(MagicMock(), IDT_34C_B_FRAME)  # noqa: SLF001
+
+    stats = parser.stats()
+    assert stats is not None
+    assert stats.queue.count == stats.decode.count == stats.callback.count == 3
+    assert stats.callback.max >= SLOW_CALLBACK
+    # The slow callback is not charged to the decoder.
+    assert stats.decode.max < SLOW_CALLBACK
+
+
+@pytest.mark.asyncio
+async def test_queued_notify_stats_include_queue_wait() -> None:
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IDT_34C_B,
+        {},
+        MagicMock(),
+        notify_queueing=NotifyQueueing(),
+        notify_stats=True,
+    )
+    callbacks: list[Callable[..., None]] = []
+
+    async def start_notify_mock(_uuid: object, callback: Callable[..., None]) -> None:
+        callbacks.append(callback)
+
+    mock_client = MagicMock(
+        start_notify=start_notify_mock,
+        read_gatt_char=AsyncMock(return_value=b"\x55"),
+        disconnect=AsyncMock(),
+    )
+    ble_device = BLEDevice(name="IDT-34c-B", address=IDT_34C_B_ADDRESS, details={})
+    with patch("inkbird_ble.parser.establish_connection", return_value=mock_client):
+        await parser.async_start(make_idt_34c_b_service_info(), ble_device)
+        await asyncio.sleep(0)
+        callbacks[0](MagicMock(), IDT_34C_B_FRAME)
+        # Block the loop so the notification waits in the queue.
+        time.sleep(0.002)  # noqa: ASYNC251
+        await asyncio.sleep(0)
+        await parser.async_stop()
+
+    stats = parser.stats()
+    assert stats is not None
+    assert stats.queue.count == 1
+    assert stats.queue.max >= 0.002
@@ -0,0 +1,108 @@
+"""Tests for coalescing notify updates before they reach update_callback."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from inkbird_ble import (
+    DeviceClass,
+    INKBIRDBluetoothDeviceData,
+    Model,
+    NotifyCoalescing,
+)
+
+from . import async_fire_time_changed, entity_values
+
+if TYPE_CHECKING:
+    from sensor_state_data import SensorUpdate
+
+
+def _iht_2pb_frame(command: int, temperature: float) -> bytearray:
+    """Build an IHT-2PB probe frame (tenths of a degree, big-endian)."""
+    frame = bytearray(b"\x55\xaa")
+    frame += bytes((command, 2))
+    frame += round(temperature * 10).to_bytes(2, "big", signed=True)
+    frame.append(sum(frame) & 0xFF)
+    return frame
+
+
+@pytest.mark.asyncio
+async def test_notify_without_coalescing_emits_every_notification() -> None:
+    updates: list[SensorUpdate] = []
+    parser = INKBIRDBluetoothDeviceData(Model.IHT_2PB, {}, updates.append)
+    notify = parser._notify_callback  # noqa: SLF001
+    for _ in range(3):
+        notify(MagicMock(), _iht_2pb_frame(0x02, 31.7))
+    assert len(updates) == 3
+
+
+@pytest.mark.asyncio
+async def test_notify_burst_collapses_into_one_trailing_update() -> None:
+    """Notifications inside the window are merged and flushed once."""
+    updates: list[SensorUpdate] = []
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IHT_2PB,
+        {},
+        updates.append,
+        notify_coalescing=NotifyCoalescing(min_interval=10),
+    )
+    notify = parser._notify_callback  # noqa: SLF001
+    notify(MagicMock(), _iht_2pb_frame(0x02, 31.7))  # leading edge
+    assert len(updates) == 1
+
+    notify(MagicMock(), _iht_2pb_frame(0x02, 31.9))
+    notify(MagicMock(), _iht_2pb_frame(0x04, 100.0))
+    notify(MagicMock(), _iht_2pb_frame(0x02, 32.1))
+    assert len(updates) == 1
+
+    async_fire_time_changed(datetime.now(UTC) + timedelta(seconds=11))
+    assert len(updates) == 2
+    values = entity_values(updates[-1])
+    assert values["temperature_probe_1"] == 32.1
+    assert values["temperature_probe_2"] == 100.0
+
+
+@pytest.mark.asyncio
+async def test_notify_deadband_suppresses_small_changes() -> None:
+    """Changes below the class deadband and repeats emit nothing."""
+    updates: list[SensorUpdate] = []
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IHT_2PB,
+        {},
+        updates.append,
+        notify_coalescing=NotifyCoalescing(
+            deadbands={DeviceClass.TEMPERATURE: 0.5},
+        ),
+    )
+    notify = parser._notify_callback  # noqa: SLF001
+    notify(MagicMock(), _iht_2pb_frame(0x02, 31.7))
+    notify(MagicMock(), _iht_2pb_frame(0x02, 31.7))  # unchanged
+    notify(MagicMock(), _iht_2pb_frame(0x02, 31.9))  # inside the deadband
+    notify(MagicMock(), _iht_2pb_frame(0x02, 32.1))  # drifted 0.4 since emit
+    assert len(updates) == 1
+    notify(MagicMock(), _iht_2pb_frame(0x02, 32.2))  # 0.5 since emit
+    assert len(updates) == 2
+    # A sensor that appears for the first time always emits.
+    notify(MagicMock(), _iht_2pb_frame(0x04, 20.0))
+    assert len(updates) == 3
+
+
+@pytest.mark.asyncio
+async def test_notify_pending_flush_cancelled_on_stop() -> None:
+    updates: list[SensorUpdate] = []
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IHT_2PB,
+        {},
+        updates.append,
+        notify_coalescing=NotifyCoalescing(min_interval=10),
+    )
+    notify = parser._notify_callback  # noqa: SLF001
+    notify(MagicMock(), _iht_2pb_frame(0x02, 31.7))
+    notify(MagicMock(), _iht_2pb_frame(0x02, 40.0))
+    await parser.async_stop()
+    async_fire_time_changed(datetime.now(UTC) + timedelta(seconds=11))
+    assert len(updates) == 1
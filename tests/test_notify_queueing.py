@@ -0,0 +1,141 @@
+"""Tests for decoding notifications on a queue consumer task."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bleak.backends.device import BLEDevice
+
+from inkbird_ble import (
+    INKBIRDBluetoothDeviceData,
+    Model,
+    NotifyOverflowPolicy,
+    NotifyQueueing,
+)
+
+from . import IDT_34C_B_ADDRESS, entity_values, make_idt_34c_b_service_info
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from uuid import UUID
+
+    from sensor_state_data import SensorUpdate
+
+
+def _frame(probe_1_raw: int) -> bytearray:
+    """Build an IDT-34c-B frame with only probe 1 plugged in (F x 10)."""
+    return bytearray(
+        probe_1_raw.to_bytes(2, "little") + b"\xfe\x7f" * 5 + b"\x7f",
+    )
+
+
+async def _start(
+    parser: INKBIRDBluetoothDeviceData,
+) -> Callable[[Any, bytearray], None]:
+    """Start a notify session and return the registered bleak callback."""
+    callbacks: list[Callable[[Any, bytearray], None]] = []
+
+    async def start_notify_mock(
+        _uuid: UUID, callback: Callable[[Any, bytearray], None]
+    ) -> None:
+        callbacks.append(callback)
+
+    mock_client = MagicMock(
+        start_notify=start_notify_mock,
+        read_gatt_char=AsyncMock(return_value=b"\x55"),
+        disconnect=AsyncMock(),
+    )
+    with patch("inkbird_ble.parser.establish_connection", return_value=mock_client):
+        parser.update(make_idt_34c_b_service_info())
+        await parser.async_start(
+            make_idt_34c_b_service_info(),
+            BLEDevice(name="IDT-34c-B", address=IDT_34C_B_ADDRESS, details={}),
+        )
+        await asyncio.sleep(0)
+    return callbacks[0]
+
+
+def _probe_1(update: SensorUpdate) -> Any:
+    return entity_values(update)["temperature_probe_1"]
+
+
+def _record(probe_1: list[Any]) -> Callable[[SensorUpdate], None]:
+    """Record probe 1 as emitted (updates alias the parser's live state)."""
+    return lambda update: probe_1.append(_probe_1(update))
+
+
+@pytest.mark.asyncio
+async def test_notification_is_decoded_off_the_callback() -> None:
+    probe_1: list[Any] = []
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IDT_34C_B, {}, _record(probe_1), notify_queueing=NotifyQueueing()
+    )
+    callback = await _start(parser)
+
+    frame = _frame(874)
+    callback(MagicMock(), frame)
+    frame[:2] = b"\x00\x00"  # The backend reusing its buffer is harmless.
+    assert probe_1 == []
+    await asyncio.sleep(0)
+    assert probe_1 == [30.8]
+    await parser.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest() -> None:
+    probe_1: list[Any] = []
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IDT_34C_B, {}, _record(probe_1), notify_queueing=NotifyQueueing(2)
+    )
+    callback = await _start(parser)
+
+    for raw in (500, 600, 700, 874):
+        callback(MagicMock(), _frame(raw))
+    assert parser.notify_overflows == 2
+    await asyncio.sleep(0)
+    assert probe_1 == [21.1, 30.8]
+    await parser.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_latest_wins_decodes_only_the_newest() -> None:
+    probe_1: list[Any] = []
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IDT_34C_B,
+        {},
+        _record(probe_1),
+        notify_queueing=NotifyQueueing(policy=NotifyOverflowPolicy.LATEST_WINS),
+    )
+    callback = await _start(parser)
+
+    for raw in (500, 600, 874):
+        callback(MagicMock(), _frame(raw))
+    assert parser.notify_overflows == 2
+    await asyncio.sleep(0)
+    assert probe_1 == [30.8]
+    await parser.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_failing_update_callback_does_not_stop_the_consumer() -> None:
+    probe_1: list[Any] = []
+
+    def _update_callback(update: SensorUpdate) -> None:
+        probe_1.append(_probe_1(update))
+        if len(probe_1) == 1:
+            msg = "consumer bug"
+            raise RuntimeError(msg)
+
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IDT_34C_B, {}, _update_callback, notify_queueing=NotifyQueueing()
+    )
+    callback = await _start(parser)
+
+    callback(MagicMock(), _frame(500))
+    callback(MagicMock(), _frame(874))
+    await asyncio.sleep(0)
+    assert probe_1 == [10.0, 30.8]
+    await parser.async_stop()
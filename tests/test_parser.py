@@ -18,6 +18,7 @@ from sensor_state_data import (
     SensorDescription,
     SensorDeviceClass,
     SensorDeviceInfo,
+    SensorLibrary,
     SensorValue,
     Units,
 )
@@ -27,20 +28,25 @@ from inkbird_ble import INKBIRDBluetoothDeviceData as PublicData
 from inkbird_ble import Model as PublicModel
 from inkbird_ble.parser import (
     BBQ_MODELS,
+    BBQ_PROBE_SIZE,
+    BBQ_PROBES_OFFSET,
     GATT_POLL_MODELS,
     IHT_2PB_NOTIFY_UUID,
     IHT_2PB_WRITE_UUID,
+    MAX_NEGATIVE_DETECTION_CACHE_SIZE,
     MAX_PLAUSIBLE_BATTERY_PERCENTAGE,
     MAX_PLAUSIBLE_HUMIDITY,
     MIN_POLL_INTERVAL,
     MODEL_INFO,
     NOTIFY_MODELS,
+    PROBE_SENSORS,
     SENSOR_MODELS,
     INKBIRDBluetoothDeviceData,
     Model,
+    detect_model,
 )
 
-from . import async_fire_time_changed
+from . import async_fire_time_changed, make_bluetooth_service_info
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -69,38 +75,6 @@ def test_constructor_accepts_publicly_exported_model():
     assert parser.device_type is PublicModel.IBS_TH
 
 
-def make_bluetooth_service_info(  # noqa: PLR0913
-    name: str,
-    manufacturer_data: dict[int, bytes],
-    service_uuids: list[str],
-    address: str,
-    rssi: int,
-    service_data: dict[UUID, bytes],
-    source: str,
-    tx_power: int = 0,
-    raw: bytes | None = None,
-) -> BluetoothServiceInfoBleak:
-    return BluetoothServiceInfoBleak(
-        name=name,
-        manufacturer_data=manufacturer_data,
-        service_uuids=service_uuids,
-        address=address,
-        rssi=rssi,
-        service_data=service_data,
-        source=source,
-        device=BLEDevice(
-            name=name,
-            address=address,
-            details={},
-        ),
-        time=monotonic_time_coarse(),
-        advertisement=None,
-        connectable=True,
-        tx_power=tx_power,
-        raw=raw,
-    )
-
-
 def test_unsupported():
     parser = INKBIRDBluetoothDeviceData()
     service_info = make_bluetooth_service_info(
@@ -131,6 +105,68 @@ def test_unsupported_with_manufacturer_data():
     assert parser.device_type is None
 
 
+def test_unsupported_advertisement_detection_is_cached():
+    """A non-INKBIRD advertisement is only run through detection once."""
+    parser = INKBIRDBluetoothDeviceData()
+    service_info = make_bluetooth_service_info(
+        name="x",
+        manufacturer_data={2044: b"\xc7\x12\x00\xc8=V\x06"},
+        service_uuids=["0000fff0-0000-1000-8000-00805f9b34fb"],
+        address="aa:bb:cc:dd:ee:ff",
+        rssi=-60,
+        service_data={},
+        source="local",
+    )
+    with patch.object(
+        INKBIRDBluetoothDeviceData,
+        "_detect_device_type",
+        autospec=True,
+        return_value=False,
+    ) as detect:
+        assert parser.supported(service_info) is False
+        assert parser.supported(service_info) is False
+    assert detect.call_count == 1
+    assert parser.device_type is None
+
+
+def test_negative_detection_cache_is_bounded():
+    parser = INKBIRDBluetoothDeviceData()
+    for idx in range(MAX_NEGATIVE_DETECTION_CACHE_SIZE + 10):
+        service_info = make_bluetooth_service_info(
+            name=f"x{idx}",
+            manufacturer_data={2044: b"\xc7\x12\x00\xc8=V\x06"},
+            service_uuids=[],
+            address="aa:bb:cc:dd:ee:ff",
+            rssi=-60,
+            service_data={},
+            source="local",
+        )
+        assert parser.supported(service_info) is False
+    negative_detections = parser._negative_detections  # noqa: SLF001
+    assert len(negative_detections) == MAX_NEGATIVE_DETECTION_CACHE_SIZE
+    assert next(iter(negative_detections))[0] == "x10"
+
+
+def test_payload_matched_advertisement_is_not_cached():
+    """Detection that depends on payload content must not be remembered.
+
+    The IAM-T2 is matched on its MAC prefix, so an advertisement that does not
+    match yet may match once the payload changes without its shape changing.
+    """
+    parser = INKBIRDBluetoothDeviceData()
+    service_info = make_bluetooth_service_info(
+        name="",
+        manufacturer_data={12884: b"\x00\x00" + bytes(13)},
+        service_uuids=[],
+        address="aa:bb:cc:dd:ee:ff",
+        rssi=-60,
+        service_data={},
+        source="local",
+    )
+    assert parser.supported(service_info) is False
+    assert parser._negative_detections == {}  # noqa: SLF001
+
+
 def test_raw_manufacturer_data():
     parser = INKBIRDBluetoothDeviceData()
     service_info = make_bluetooth_service_info(
@@ -766,6 +802,59 @@ def test_ibbq_4():
     )
 
 
+def test_known_model_decodes_without_model_info_lookup() -> None:
+    """A model known up front decodes through its pre-bound decoder.
+
+    The advertisement decoder is specialised when the device type is set, so
+    once it is known the per-packet path must not consult ``MODEL_INFO``.
+    """
+    parser = INKBIRDBluetoothDeviceData(Model.IBBQ_4)
+    service_info = make_bluetooth_service_info(
+        name="iBBQ",
+        manufacturer_data={
+            0: b"\x00\x000\xe2\x83}\xb5\x02\x04\x01\xfa\x00\x04\x01\xfa\x00"
+        },
+        service_uuids=["0000fff0-0000-1000-8000-00805f9b34fb"],
+        address="aa:bb:cc:dd:ee:ff",
+        rssi=-60,
+        service_data={},
+        source="local",
+    )
+    with patch.dict("inkbird_ble.parser.MODEL_INFO", clear=True):
+        result = parser.update(service_info)
+    values = {
+        key.key: value.native_value for key, value in result.entity_values.items()
+    }
+    assert values == {
+        "signal_strength": -60,
+        "temperature_probe_1": 26.0,
+        "temperature_probe_2": 25.0,
+        "temperature_probe_3": 26.0,
+        "temperature_probe_4": 25.0,
+    }
+
+
+def test_generic_18_keeps_its_decoder_across_advertisements() -> None:
+    """Re-detecting an unchanged GENERIC_18 does not rebuild its decoder."""
+    parser = INKBIRDBluetoothDeviceData()
+    service_info = make_bluetooth_service_info(
+        name="",
+        manufacturer_data={9289: bytes.fromhex("11180065d00000005a00800000000000")},
+        service_uuids=["0000fff0-0000-1000-8000-00805f9b34fb"],
+        address="aa:bb:cc:dd:ee:ff",
+        rssi=-60,
+        service_data={},
+        source="local",
+    )
+    parser.update(service_info)
+    assert parser.device_type == Model.GENERIC_18
+    decoder = parser._adv_decoder  # noqa: SLF001
+    with patch.object(parser, "_set_device_type") as set_device_type:
+        parser.update(service_info)
+    set_device_type.assert_not_called()
+    assert parser._adv_decoder is decoder  # noqa: SLF001
+
+
 def test_ibbq_4_sub_zero_probe():
     """A signed probe reading below 0°C is preserved, not clamped to 0 (#186).
 
@@ -2285,6 +2374,18 @@ async def test_notify_iam_t1_corrupt_temperature_dropped() -> None:
     assert updates == []
 
 
+def test_notify_iam_t1_unknown_packets_counted() -> None:
+    """Short and unrecognised IAM-T1 packets are counted, not decoded."""
+    parser = INKBIRDBluetoothDeviceData(Model.IAM_T1)
+    notify = parser._notify_iam_t1  # noqa: SLF001
+    notify(MagicMock(), bytearray(b"U"))
+    notify(MagicMock(), bytearray(b"U\xaa\x09\x0c\x00\x00\x00\x00\x00\x00\x00\x10"))
+    # A data packet type at the state packet's length.
+    notify(MagicMock(), bytearray(b"U\xaa\x01\x0c\x00\x00\xe8\x01\xf4\x04K\x03"))
+    assert parser.notify_unknown_packets == 3
+    assert "temp_unit" not in parser._device_data  # noqa: SLF001
+
+
 @pytest.mark.asyncio
 async def test_notify_iam_t1_corrupt_humidity_dropped() -> None:
     """A corrupt IAM-T1 notification (humidity > 100%) is dropped (#141 family)."""
@@ -2522,6 +2623,7 @@ async def test_iam_t1_multiple_updates_with_broken_packet() -> None:
     # This is the key assertion: we got exactly 4 updates,
     # proving the broken packet was ignored
     assert len(updates) == 4
+    assert parser.notify_unknown_packets == 1
 
     # Verify the final update has values from the last valid packet
     # Note: Due to how the parser works, all updates reference the
@@ -3329,6 +3431,43 @@ def test_IBS_P02B_multiple_updates():
     )
 
 
+def test_update_many_matches_sequential_updates() -> None:
+    """A batch yields the same final update as feeding ``update`` one by one."""
+    service_infos = [
+        make_bluetooth_service_info(
+            name="IBS-P02B",
+            manufacturer_data={9289: payload},
+            service_uuids=["0000fff0-0000-1000-8000-00805f9b34fb"],
+            address="49:24:11:18:00:65",
+            rssi=rssi,
+            service_data={},
+            source="B8:D6:1A:8B:C7:C6",
+        )
+        for payload, rssi in (
+            (b"\x11\x18\x00ev\x01\x00\x00_\x00\x00\x01\x00\x00\x00\x00", -83),
+            (b"\x11\x18\x00ew\x01\x00\x00`\x00\x00\x01\x00\x00\x00\x00", -77),
+        )
+    ]
+    sequential = INKBIRDBluetoothDeviceData()
+    for service_info in service_infos:
+        expected = sequential.update(service_info)
+
+    batched = INKBIRDBluetoothDeviceData()
+    assert batched.update_many(service_infos) == expected
+    assert batched.device_type is Model.IBS_P02B
+    values = {
+        key.key: value.native_value for key, value in expected.entity_values.items()
+    }
+    assert values["temperature"] == 37.5
+    assert values["battery"] == 96
+    assert values["signal_strength"] == -77
+
+
+def test_update_many_empty_batch() -> None:
+    parser = INKBIRDBluetoothDeviceData()
+    assert parser.update_many([]) == SensorUpdate(title=None, devices={})
+
+
 def test_IBS_P02B_never_polls_on_first_sighting() -> None:
     """IBS-P02B must never request a connectable poll.
 
@@ -3859,6 +3998,73 @@ async def test_notify_iht_2pb_multiple_frames_in_one_notification() -> None:
     assert values["temperature_probe_1"] == 31.7
 
 
+@pytest.mark.asyncio
+async def test_notify_iht_2pb_frame_split_across_notifications() -> None:
+    """A frame split over several notifications is reassembled, not dropped."""
+    updates: list[SensorUpdate] = []
+
+    def _update_callback(update: SensorUpdate) -> None:
+        updates.append(update)
+
+    parser = INKBIRDBluetoothDeviceData(Model.IHT_2PB, {}, _update_callback, None)
+    service_info = make_bluetooth_service_info(
+        name="Ink@IHT-2PB#c4b",
+        manufacturer_data={18505: b"2PB6200a1359c4b"},
+        service_uuids=[],
+        address="62:00:A1:35:9C:4B",
+        rssi=-33,
+        service_data={},
+        source="local",
+    )
+    parser.update(service_info)
+
+    async def start_notify_mock(
+        uuid: UUID, callback: Callable[[UUID, bytes], None]
+    ) -> None:
+        # Small-MTU link: probe 1 and probe 2 frames cut at arbitrary points,
+        # with line noise before the first header.
+        callback(uuid, b"\x00\x55\xaa\x02")
+        callback(uuid, b"\x02\x01\x3d\x41\x55")  # probe 1 -> 31.7C
+        callback(uuid, b"\xaa\x04\x02\x03")
+        callback(uuid, b"\xe8\xf0")  # probe 2 -> 100.0C
+
+    mock_client = MagicMock(
+        start_notify=start_notify_mock,
+        write_gatt_char=AsyncMock(),
+        disconnect=AsyncMock(),
+    )
+    with patch("inkbird_ble.parser.establish_connection", return_value=mock_client):
+        await parser.async_start(
+            service_info,
+            BLEDevice(
+                address="62:00:A1:35:9C:4B",
+                name="Ink@IHT-2PB#c4b",
+                details={},
+            ),
+        )
+        await asyncio.sleep(0)
+        await parser.async_stop()
+
+    assert len(updates) == 2
+    values = {
+        key.key: value.native_value for key, value in updates[-1].entity_values.items()
+    }
+    assert values["temperature_probe_1"] == 31.7
+    assert values["temperature_probe_2"] == 100.0
+    # Everything was consumed; nothing is carried into the next notification.
+    assert parser._iht_2pb_buffer == b""  # noqa: SLF001
+
+
+def test_iht_2pb_reassembly_buffer_discards_noise() -> None:
+    """Bytes that cannot start a frame are not kept between notifications."""
+    parser = INKBIRDBluetoothDeviceData(Model.IHT_2PB)
+    assert list(parser._iter_iht_2pb_frames(bytearray(64))) == []  # noqa: SLF001
+    assert parser._iht_2pb_buffer == b""  # noqa: SLF001
+    # A trailing 0x55 may be the first half of a header, so it is kept.
+    assert list(parser._iter_iht_2pb_frames(bytearray(b"\x00\x55"))) == []  # noqa: SLF001
+    assert parser._iht_2pb_buffer == b"\x55"  # noqa: SLF001
+
+
 @pytest.mark.asyncio
 async def test_notify_iht_2pb_skips_invalid_packets() -> None:
     """Fahrenheit mirrors, bad checksums and short packets are ignored."""
@@ -4209,6 +4415,123 @@ async def test_int_11i_b_poll_temperature_only_without_battery_char() -> None:
     assert "probe_battery" not in keys
 
 
+def _int_11i_b_client(*reads: bytes | Exception) -> MagicMock:
+    """A client whose ff01/2a19 characteristics have handles 0x10/0x20."""
+    mock_service = MagicMock()
+    mock_service.get_characteristic.side_effect = lambda uuid: MagicMock(
+        handle=0x20 if str(uuid).startswith("00002a19") else 0x10
+    )
+    mock_client = MagicMock(
+        disconnect=AsyncMock(),
+        clear_cache=AsyncMock(),
+        read_gatt_char=AsyncMock(side_effect=reads),
+    )
+    mock_client.services.get_service.return_value = mock_service
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_int_11i_b_poll_reuses_characteristic_handles() -> None:
+    """Characteristics are looked up on the first poll and read by handle."""
+    parser = INKBIRDBluetoothDeviceData(Model.INT_11I_B)
+    parser.update(_int_11i_b_service_info())
+    mock_client = _int_11i_b_client(b"\x60\x1d", b"\x50\x4b", b"\x60\x1d", b"\x50\x4b")
+    ble_device = BLEDevice(address="A4:C1:38:C9:88:65", name="INT-11I-B", details={})
+    with patch("inkbird_ble.parser.establish_connection", return_value=mock_client):
+        await parser.async_poll(ble_device)
+        await parser.async_poll(ble_device)
+    assert mock_client.services.get_service.call_count == 2
+    assert [call.args[0] for call in mock_client.read_gatt_char.await_args_list] == [
+        0x10,
+        0x20,
+        0x10,
+        0x20,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_int_11i_b_poll_reads_concurrently() -> None:
+    """The ff01 and 2a19 reads are both in flight before either returns."""
+    parser = INKBIRDBluetoothDeviceData(Model.INT_11I_B)
+    parser.update(_int_11i_b_service_info())
+    in_flight: list[int] = []
+    both_issued = asyncio.Event()
+
+    async def _read(handle: int) -> bytes:
+        in_flight.append(handle)
+        if len(in_flight) == 2:
+            both_issued.set()
+        await both_issued.wait()
+        return b"\x60\x1d" if handle == 0x10 else b"\x50\x4b"
+
+    mock_client = _int_11i_b_client()
+    mock_client.read_gatt_char = _read
+    with patch("inkbird_ble.parser.establish_connection", return_value=mock_client):
+        update = await asyncio.wait_for(
+            parser.async_poll(
+                BLEDevice(address="A4:C1:38:C9:88:65", name="INT-11I-B", details={})
+            ),
+            1,
+        )
+    assert in_flight == [0x10, 0x20]
+    values = {
+        key.key: value.native_value for key, value in update.entity_values.items()
+    }
+    assert values["temperature"] == 24.0
+    assert values["probe_battery"] == 75
+
+
+@pytest.mark.asyncio
+async def test_int_11i_b_failed_read_cancels_the_other() -> None:
+    """A failing read cancels its sibling and surfaces as the bare error."""
+    parser = INKBIRDBluetoothDeviceData(Model.INT_11I_B)
+    parser.update(_int_11i_b_service_info())
+    cancelled: list[int] = []
+
+    async def _read(handle: int) -> bytes:
+        if handle == 0x10:
+            await asyncio.sleep(0)
+            msg = "read failed"
+            raise BleakError(msg)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(handle)
+            raise
+        return b"\x50\x4b"
+
+    mock_client = _int_11i_b_client()
+    mock_client.read_gatt_char = _read
+    with pytest.raises(BleakError, match="read failed"):
+        await parser._async_read_set(  # noqa: SLF001
+            mock_client, MODEL_INFO[Model.INT_11I_B]
+        )
+    assert cancelled == [0x20]
+
+
+@pytest.mark.asyncio
+async def test_int_11i_b_poll_stale_handle_resolved_again() -> None:
+    """A characteristic-not-found read drops the cached handles and retries."""
+    parser = INKBIRDBluetoothDeviceData(Model.INT_11I_B)
+    parser.update(_int_11i_b_service_info())
+    mock_client = _int_11i_b_client(
+        b"\x60\x1d",
+        b"\x50\x4b",
+        # ff01 fails while the concurrent 2a19 read succeeds.
+        BleakCharacteristicNotFoundError("0x10"),
+        b"\x50\x4b",
+        b"\x60\x1d",
+        b"\x50\x4b",
+    )
+    ble_device = BLEDevice(address="A4:C1:38:C9:88:65", name="INT-11I-B", details={})
+    with patch("inkbird_ble.parser.establish_connection", return_value=mock_client):
+        await parser.async_poll(ble_device)
+        update = await parser.async_poll(ble_device)
+    mock_client.clear_cache.assert_awaited_once()
+    assert mock_client.services.get_service.call_count == 4
+    assert update.entity_values[DeviceKey(key="temperature")].native_value == 24.0
+
+
 @pytest.mark.asyncio
 async def test_int_11i_b_poll_short_temp_read_ignored() -> None:
     """A truncated ff01 read emits no temperature or battery values."""
@@ -4765,7 +5088,7 @@ def test_every_model_has_a_dispatch_category() -> None:
 
     The parser reaches a model via one of four routes:
 
-    * ``BBQ_MODELS`` — advertisement parsed by ``_update_bbq_model``;
+    * ``BBQ_MODELS`` — advertisement parsed by the ``_bbq_decoder`` closure;
     * ``SENSOR_MODELS`` — advertisement parsed by the length-keyed dispatch
       (9 / 17 / 18 byte handlers);
     * ``NOTIFY_MODELS`` — GATT notifications dispatched through
@@ -4781,6 +5104,88 @@ def test_every_model_has_a_dispatch_category() -> None:
     assert set(Model) == (BBQ_MODELS | SENSOR_MODELS | NOTIFY_MODELS | GATT_POLL_MODELS)
 
 
+def test_adv_struct_declared_for_every_adv_model() -> None:
+    """Every advertisement-parsed model must carry a fitting decode plan.
+
+    The advertisement decoders unpack the whole manufacturer payload with the
+    model's ``adv_struct`` in a single call. A parsed model without one would
+    crash on its first packet, and a plan wider than the payload (the message
+    length minus the 2-byte manufacturer id) would raise ``struct.error`` on
+    every well-formed advertisement.
+    """
+    for model, info in MODEL_INFO.items():
+        if not info.parse_adv:
+            assert info.adv_struct is None, f"{model} is not advertisement-parsed"
+            continue
+        assert info.adv_struct is not None, f"{model} has no adv_struct"
+        assert info.adv_struct.size <= info.message_length - 2, (
+            f"{model} adv_struct is wider than its advertisement payload"
+        )
+
+
+def test_manufacturer_data_rules_have_unique_ids() -> None:
+    """Each manufacturer id may identify at most one model.
+
+    The detection index maps a manufacturer id straight to its rule; two
+    models declaring the same id would silently shadow one another.
+    """
+    rule_ids = [
+        info.manufacturer_data_rule.manufacturer_id
+        for info in MODEL_INFO.values()
+        if info.manufacturer_data_rule is not None
+    ]
+    assert len(rule_ids) == len(set(rule_ids))
+
+
+@pytest.mark.parametrize(
+    ("lower_name", "service_uuids", "manufacturer_data", "expected"),
+    [
+        ("sps", [], {1: bytes(7)}, Model.IBS_TH),
+        ("sps", [], {1: bytes(3)}, None),
+        ("int-11i-b", [], {1: bytes(3)}, None),
+        (
+            "int-11i-b",
+            ["0000ff00-0000-1000-8000-00805f9b34fb"],
+            {1: bytes(3)},
+            Model.INT_11I_B,
+        ),
+        ("ink@iht-2pb#1a2b", [], {1: bytes(3)}, Model.IHT_2PB),
+        (
+            "ink@iam-t1",
+            ["0000ffe0-0000-1000-8000-00805f9b34fb"],
+            {1: bytes(3)},
+            Model.IAM_T1,
+        ),
+        ("ink@iam-t1", [], {1: bytes(3)}, None),
+        ("xbbq", [], {0: bytes(10)}, Model.IBBQ_1),
+        ("ibbq", [], {0: bytes(11)}, None),
+        (
+            "",
+            ["0000fff0-0000-1000-8000-00805f9b34fb"],
+            {9289: bytes(16)},
+            Model.GENERIC_18,
+        ),
+        ("", [], {9289: bytes(16)}, None),
+        ("", [], {12628: b"AC-6200xyz"}, Model.IAM_T1),
+        ("", [], {12884: b"\x00\x62" + bytes(13)}, Model.IAM_T2),
+        ("", [], {12884: b"\x00\x63" + bytes(13)}, None),
+    ],
+)
+def test_detect_model(
+    lower_name: str,
+    service_uuids: list[str],
+    manufacturer_data: dict[int, bytes],
+    expected: Model | None,
+) -> None:
+    last_payload = manufacturer_data[next(reversed(manufacturer_data))]
+    assert (
+        detect_model(
+            lower_name, service_uuids, manufacturer_data, len(last_payload) + 2
+        )
+        is expected
+    )
+
+
 def test_notify_init_writes_only_on_notify_models() -> None:
     """``notify_init_writes`` must only be set on models that use notify.
 
@@ -4820,3 +5225,45 @@ def test_supported_devices_doc_mentions_every_model() -> None:
     doc_text = doc_path.read_text(encoding="utf-8")
     missing = [m.value for m in Model if m.value not in doc_text]
     assert missing == [], f"Models missing from supported_devices.md: {missing}"
+
+
+def test_bbq_probe_sensors_match_adv_struct() -> None:
+    """A BBQ model declares one prebuilt probe sensor per decoded probe."""
+    for model in BBQ_MODELS:
+        info = MODEL_INFO[model]
+        assert info.adv_struct is not None
+        probe_count = (info.adv_struct.size - BBQ_PROBES_OFFSET) // BBQ_PROBE_SIZE
+        assert info.probe_sensors == PROBE_SENSORS[:probe_count], model
+
+
+def test_prebuilt_probe_sensors_match_update_predefined_sensor() -> None:
+    """The prebuilt probe entries are exactly what the generic path emits."""
+    generic = INKBIRDBluetoothDeviceData()
+    prebuilt = INKBIRDBluetoothDeviceData()
+    for num, probe in enumerate(PROBE_SENSORS, 1):
+        generic.update_predefined_sensor(
+            SensorLibrary.TEMPERATURE__CELSIUS,
+            21.5,
+            key=f"temperature_probe_{num}",
+            name=f"Temperature Probe {num}",
+        )
+        prebuilt._update_probe_temperature(probe, 21.5)  # noqa: SLF001
+    assert prebuilt._finish_update() == generic._finish_update()  # noqa: SLF001
+
+
+def test_probe_temperature_honours_precision() -> None:
+    """Probe readings are rounded like every other sensor."""
+    generic = INKBIRDBluetoothDeviceData()
+    prebuilt = INKBIRDBluetoothDeviceData()
+    for parser in (generic, prebuilt):
+        parser.set_precision(0)
+    generic.update_predefined_sensor(
+        SensorLibrary.TEMPERATURE__CELSIUS,
+        21.46,
+        key="temperature_probe_1",
+        name="Temperature Probe 1",
+    )
+    prebuilt._update_probe_temperature(PROBE_SENSORS[0], 21.46)  # noqa: SLF001
+    update = prebuilt._finish_update()  # noqa: SLF001
+    assert update == generic._finish_update()  # noqa: SLF001
+    assert update.entity_values[DeviceKey("temperature_probe_1")].native_value == 21
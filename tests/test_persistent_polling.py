@@ -0,0 +1,155 @@
+"""Tests for keeping GATT-poll models connected between reads."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from inkbird_ble import (
+    INKBIRDBluetoothDeviceData,
+    Model,
+    PersistentPolling,
+    ReconnectPolicy,
+)
+
+from . import async_fire_time_changed, make_bluetooth_service_info, spin
+
+if TYPE_CHECKING:
+    from habluetooth import BluetoothServiceInfoBleak
+    from sensor_state_data import SensorUpdate
+
+ADDRESS = "90:7B:C6:0A:06:28"
+# probe=32C ambient=29C, then probe=33C.
+READ_1 = b"\xaa\x20\x80\x1d\xc8\x38\x54"
+READ_2 = b"\xaa\x21\x80\x1d\xc8\x38\x54"
+
+
+def _service_info() -> BluetoothServiceInfoBleak:
+    return make_bluetooth_service_info(
+        name="INT-11P-B",
+        manufacturer_data={1576: b"\x0a\xc6\x7b\x90"},
+        service_uuids=["0000fff0-0000-1000-8000-00805f9b34fb"],
+        address=ADDRESS,
+        rssi=-55,
+        service_data={},
+        source="local",
+    )
+
+
+def _client(*reads: bytes) -> MagicMock:
+    return MagicMock(
+        read_gatt_char=AsyncMock(side_effect=reads),
+        disconnect=AsyncMock(),
+        set_disconnected_callback=MagicMock(),
+    )
+
+
+def test_persistent_polling_only_applies_to_gatt_poll_models() -> None:
+    polling = PersistentPolling()
+    assert INKBIRDBluetoothDeviceData(
+        Model.INT_11P_B, persistent_polling=polling
+    ).uses_persistent_polling
+    assert not INKBIRDBluetoothDeviceData(Model.INT_11P_B).uses_persistent_polling
+    assert not INKBIRDBluetoothDeviceData(
+        Model.IBS_TH, persistent_polling=polling
+    ).uses_persistent_polling
+
+
+def test_poll_needed_until_the_session_starts() -> None:
+    parser = INKBIRDBluetoothDeviceData(
+        Model.INT_11P_B, persistent_polling=PersistentPolling()
+    )
+    service_info = _service_info()
+    parser.update(service_info)
+    assert parser.poll_needed(service_info, None) is True
+
+
+@pytest.mark.asyncio
+async def test_persistent_polling_without_update_callback() -> None:
+    parser = INKBIRDBluetoothDeviceData(
+        Model.INT_11P_B, persistent_polling=PersistentPolling(interval=10)
+    )
+    service_info = _service_info()
+    parser.update(service_info)
+    client = _client(READ_1, READ_2)
+
+    with patch(
+        "inkbird_ble.parser.establish_connection", AsyncMock(return_value=client)
+    ):
+        await parser.async_start(service_info, service_info.device)
+        await spin()
+        async_fire_time_changed(datetime.now(UTC) + timedelta(seconds=11))
+        await spin()
+        # Both reads ran on the one connection with nothing to deliver to.
+        assert client.read_gatt_char.await_count == 2
+        assert parser.session_active
+        await parser.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_persistent_polling_reads_on_one_connection() -> None:
+    probes: list[Any] = []
+
+    def _update_callback(update: SensorUpdate) -> None:
+        probes.extend(
+            value.native_value
+            for key, value in update.entity_values.items()
+            if key.key == "temperature_probe"
+        )
+
+    parser = INKBIRDBluetoothDeviceData(
+        Model.INT_11P_B,
+        {},
+        _update_callback,
+        persistent_polling=PersistentPolling(interval=10),
+    )
+    service_info = _service_info()
+    parser.update(service_info)
+    client = _client(READ_1, READ_2)
+    establish_mock = AsyncMock(return_value=client)
+
+    with patch("inkbird_ble.parser.establish_connection", establish_mock):
+        await parser.async_start(service_info, service_info.device)
+        await spin()
+        assert probes == [32]
+        assert parser.poll_needed(service_info, None) is False
+        async_fire_time_changed(datetime.now(UTC) + timedelta(seconds=11))
+        await spin()
+        assert probes == [32, 33]
+        assert establish_mock.await_count == 1
+        client.disconnect.assert_not_awaited()
+        await parser.async_stop()
+
+    assert parser.poll_needed(service_info, None) is True
+
+
+@pytest.mark.asyncio
+async def test_persistent_polling_reconnects_after_disconnect() -> None:
+    updates: list[SensorUpdate] = []
+    parser = INKBIRDBluetoothDeviceData(
+        Model.INT_11P_B,
+        {},
+        updates.append,
+        persistent_polling=PersistentPolling(interval=10),
+        reconnect_policy=ReconnectPolicy(
+            initial_delay=0, jitter=0, wait_for_advertisement=False
+        ),
+    )
+    service_info = _service_info()
+    parser.update(service_info)
+    first, second = _client(READ_1), _client(READ_2)
+    establish_mock = AsyncMock(side_effect=[first, second])
+
+    with patch("inkbird_ble.parser.establish_connection", establish_mock):
+        await parser.async_start(service_info, service_info.device)
+        await spin()
+        assert len(updates) == 1
+        first.set_disconnected_callback.call_args[0][0](first)
+        await spin()
+        first.disconnect.assert_awaited_once()
+        assert establish_mock.await_count == 2
+        assert len(updates) == 2
+        await parser.async_stop()
@@ -0,0 +1,165 @@
+"""Tests for pacing notify reconnects."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
+
+from inkbird_ble import INKBIRDBluetoothDeviceData, Model, ReconnectPolicy
+
+from . import IDT_34C_B_ADDRESS, make_idt_34c_b_service_info, spin
+
+
+@dataclass(frozen=True)
+class _RecordingPolicy(ReconnectPolicy):
+    """Reconnect immediately, recording the failure count of every wait."""
+
+    calls: list[int] = field(default_factory=list)
+
+    def delay(self, failures: int) -> float:
+        self.calls.append(failures)
+        return 0
+
+
+def test_reconnect_policy_backs_off_exponentially_to_the_cap() -> None:
+    policy = ReconnectPolicy(initial_delay=5, max_delay=60, multiplier=2, jitter=0)
+    assert [policy.delay(failures) for failures in range(6)] == [
+        5,
+        10,
+        20,
+        40,
+        60,
+        60,
+    ]
+
+
+def test_reconnect_policy_jitter_only_shortens_the_delay() -> None:
+    policy = ReconnectPolicy(initial_delay=10, jitter=0.5)
+    with patch("inkbird_ble.parser.random.random", return_value=1.0):
+        assert policy.delay(0) == 5
+    with patch("inkbird_ble.parser.random.random", return_value=0.0):
+        assert policy.delay(0) == 10
+
+
+@pytest.mark.asyncio
+async def test_failures_back_off_and_success_resets() -> None:
+    policy = _RecordingPolicy(wait_for_advertisement=False)
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IDT_34C_B, {}, MagicMock(), reconnect_policy=policy
+    )
+    mock_client = MagicMock(
+        start_notify=AsyncMock(),
+        read_gatt_char=AsyncMock(return_value=b"\x55"),
+        disconnect=AsyncMock(),
+        set_disconnected_callback=MagicMock(),
+    )
+    connect_calls = 0
+
+    async def establish_mock(*_args: Any, **_kwargs: Any) -> MagicMock:
+        nonlocal connect_calls
+        connect_calls += 1
+        if connect_calls <= 3:
+            msg = "device is out of range"
+            raise BleakError(msg)
+        return mock_client
+
+    with patch("inkbird_ble.parser.establish_connection", establish_mock):
+        await parser.async_start(
+            make_idt_34c_b_service_info(),
+            BLEDevice(name="IDT-34c-B", address=IDT_34C_B_ADDRESS, details={}),
+        )
+        await spin()
+        assert connect_calls == 4
+        assert policy.calls == [0, 1, 2]
+        # The connected session ends with a disconnect: the count resets.
+        mock_client.set_disconnected_callback.call_args[0][0](mock_client)
+        await spin()
+        assert policy.calls == [0, 1, 2, 0]
+        await parser.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_deferred_until_advertisement() -> None:
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IDT_34C_B,
+        {},
+        MagicMock(),
+        reconnect_policy=_RecordingPolicy(wait_for_advertisement=True),
+    )
+    establish_mock = AsyncMock(side_effect=BleakError("device is out of range"))
+
+    with patch("inkbird_ble.parser.establish_connection", establish_mock):
+        await parser.async_start(
+            make_idt_34c_b_service_info(),
+            BLEDevice(name="IDT-34c-B", address=IDT_34C_B_ADDRESS, details={}),
+        )
+        await spin()
+        assert establish_mock.await_count == 1
+        await spin()
+        assert establish_mock.await_count == 1
+        service_info = make_idt_34c_b_service_info()
+        parser.update(service_info)
+        assert parser.last_seen == service_info.time
+        await spin()
+        assert establish_mock.await_count == 2
+        await parser.async_stop()
+
+
+@dataclass(frozen=True)
+class _FixedDelayPolicy(ReconnectPolicy):
+    """Back off for a short, fixed time after every session."""
+
+    def delay(self, failures: int) -> float:
+        return 0.02
+
+
+@pytest.mark.asyncio
+async def test_advertisement_during_backoff_counts() -> None:
+    """A device heard while backing off is retried as soon as the backoff ends."""
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IDT_34C_B,
+        {},
+        MagicMock(),
+        reconnect_policy=_FixedDelayPolicy(wait_for_advertisement=True),
+    )
+    establish_mock = AsyncMock(side_effect=BleakError("device is out of range"))
+
+    with patch("inkbird_ble.parser.establish_connection", establish_mock):
+        await parser.async_start(
+            make_idt_34c_b_service_info(),
+            BLEDevice(name="IDT-34c-B", address=IDT_34C_B_ADDRESS, details={}),
+        )
+        await spin()
+        assert establish_mock.await_count == 1
+        # Heard during the backoff, and never again.
+        parser.update(make_idt_34c_b_service_info())
+        await asyncio.sleep(0.1)
+        assert establish_mock.await_count == 2
+        await parser.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_advertisement_wait_gives_up_after_max_delay() -> None:
+    """A device whose advertisements never reach ``update`` is still retried."""
+    parser = INKBIRDBluetoothDeviceData(
+        Model.IDT_34C_B,
+        {},
+        MagicMock(),
+        reconnect_policy=_RecordingPolicy(wait_for_advertisement=True, max_delay=0.01),
+    )
+    establish_mock = AsyncMock(side_effect=BleakError("device is out of range"))
+
+    with patch("inkbird_ble.parser.establish_connection", establish_mock):
+        await parser.async_start(
+            make_idt_34c_b_service_info(),
+            BLEDevice(name="IDT-34c-B", address=IDT_34C_B_ADDRESS, details={}),
+        )
+        await asyncio.sleep(0.05)
+        assert establish_mock.await_count >= 2
+        await parser.async_stop()
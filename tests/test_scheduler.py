@@ -0,0 +1,192 @@
+"""Tests for the fleet-wide poll scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bleak.exc import BleakError
+
+from inkbird_ble import INKBIRDBluetoothDeviceData, Model, PollScheduler
+from inkbird_ble.parser import MIN_POLL_INTERVAL
+
+if TYPE_CHECKING:
+    from sensor_state_data import SensorUpdate
+
+
+def _addresses(count: int) -> list[str]:
+    return [f"AA:BB:CC:DD:{idx // 256:02X}:{idx % 256:02X}" for idx in range(count)]
+
+
+def test_new_devices_are_staggered_over_the_interval() -> None:
+    scheduler = PollScheduler(max_concurrent=100, interval=100)
+    for address in _addresses(50):
+        scheduler.add(address, INKBIRDBluetoothDeviceData(Model.IBS_TH), now=0)
+    assert len(scheduler) == 50
+    # Every tenth of the interval hands out roughly a tenth of the devices.
+    counts = [len(scheduler.pop_due(now=(step + 1) * 10 - 0.001)) for step in range(10)]
+    assert sum(counts) == 50
+    assert max(counts) - min(counts) <= 2
+
+
+def test_unpollable_devices_are_ignored() -> None:
+    scheduler = PollScheduler()
+    scheduler.add("AA:BB:CC:DD:EE:FF", INKBIRDBluetoothDeviceData(Model.IBBQ_4))
+    scheduler.add("AA:BB:CC:DD:EE:00", INKBIRDBluetoothDeviceData())
+    assert len(scheduler) == 0
+    assert scheduler.next_due is None
+
+
+def test_concurrency_cap_and_rescheduling() -> None:
+    scheduler = PollScheduler(max_concurrent=2, interval=100)
+    for address in _addresses(5):
+        scheduler.add(address, INKBIRDBluetoothDeviceData(Model.INT_11P_B), now=0)
+    first = scheduler.pop_due(now=100)
+    assert len(first) == 2
+    assert scheduler.pop_due(now=100) == []
+    scheduler.poll_finished(first[0], now=100)
+    second = scheduler.pop_due(now=100)
+    assert len(second) == 1
+    assert first[0] not in second
+    # The finished device is due again one interval after its poll.
+    scheduler.poll_finished(first[1], now=100)
+    scheduler.poll_finished(second[0], now=100)
+    assert len(scheduler.pop_due(now=199)) == 2
+    assert scheduler.pop_due(now=200) == []
+
+
+def test_advertisements_defer_polls_of_advertising_models() -> None:
+    scheduler = PollScheduler(interval=100)
+    scheduler.add("sensor", INKBIRDBluetoothDeviceData(Model.IBS_TH), now=0)
+    scheduler.add("probe", INKBIRDBluetoothDeviceData(Model.INT_11P_B), now=0)
+    scheduler.advertisement_seen("sensor", 150)
+    scheduler.advertisement_seen("probe", 150)
+    assert scheduler.pop_due(now=200) == ["probe"]
+    assert scheduler.next_due == 250
+    scheduler.remove("sensor")
+    assert scheduler.next_due is None
+
+
+def test_deferring_advertisements_do_not_grow_the_heap() -> None:
+    scheduler = PollScheduler(interval=100)
+    scheduler.add("sensor", INKBIRDBluetoothDeviceData(Model.IBS_TH), now=0)
+    scheduler._wakeup.clear()  # noqa: SLF001
+    for seen in range(1, 1001):
+        scheduler.advertisement_seen("sensor", seen)
+    # Only moving a poll earlier needs a new entry or a wakeup.
+    assert len(scheduler._heap) == 1  # noqa: SLF001
+    assert not scheduler._wakeup.is_set()  # noqa: SLF001
+    assert scheduler.pop_due(now=1099) == []
+    assert scheduler.next_due == 1100
+    assert scheduler.pop_due(now=1100) == ["sensor"]
+    scheduler.poll_finished("sensor", now=1100)
+    assert scheduler._wakeup.is_set()  # noqa: SLF001
+    assert scheduler.next_due == 1200
+
+
+def test_readding_a_device_mid_poll_waits_for_the_poll() -> None:
+    scheduler = PollScheduler(max_concurrent=2, interval=100)
+    parser = INKBIRDBluetoothDeviceData(Model.INT_11P_B)
+    scheduler.add("probe", parser, now=0)
+    assert scheduler.pop_due(now=100) == ["probe"]
+    scheduler.remove("probe")
+    scheduler.add("probe", parser, now=100)
+    # No second, concurrent poll of the same device.
+    assert scheduler.pop_due(now=1000) == []
+    scheduler.poll_finished("probe", now=1000)
+    assert scheduler.next_due == 1100
+    assert scheduler.pop_due(now=1100) == ["probe"]
+
+
+@pytest.mark.asyncio
+async def test_async_run_polls_with_bounded_concurrency() -> None:
+    scheduler = PollScheduler(max_concurrent=2, interval=MIN_POLL_INTERVAL)
+    release = asyncio.Event()
+    running = 0
+    peak = 0
+    updates: list[tuple[str, SensorUpdate]] = []
+
+    async def _poll(_ble_device: object) -> MagicMock:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+        return MagicMock()
+
+    addresses = _addresses(4)
+    for address in addresses:
+        parser = INKBIRDBluetoothDeviceData(Model.INT_11P_B)
+        parser.async_poll = _poll  # type: ignore[method-assign, assignment]
+        scheduler.add(address, parser, now=-MIN_POLL_INTERVAL)
+    failing = INKBIRDBluetoothDeviceData(Model.INT_11P_B)
+    failing.async_poll = AsyncMock(  # type: ignore[method-assign]
+        side_effect=BleakError("out of range")
+    )
+    scheduler.add("failing", failing, now=-MIN_POLL_INTERVAL)
+
+    task = asyncio.create_task(
+        scheduler.async_run(MagicMock(), lambda a, u: updates.append((a, u)))
+    )
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert peak == 2
+    release.set()
+    for _ in range(50):
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert peak == 2
+    assert sorted(address for address, _ in updates) == addresses
+    failing.async_poll.assert_awaited_once()
+    assert scheduler.pop_due(now=0) == []
+
+
+@pytest.mark.asyncio
+async def test_async_run_waits_for_cancelled_polls() -> None:
+    scheduler = PollScheduler(interval=MIN_POLL_INTERVAL)
+    started = asyncio.Event()
+    finished: list[str] = []
+
+    async def _poll(_ble_device: object) -> MagicMock:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            finished.append("poll")
+        return MagicMock()
+
+    parser = INKBIRDBluetoothDeviceData(Model.INT_11P_B)
+    parser.async_poll = _poll  # type: ignore[method-assign, assignment]
+    scheduler.add("probe", parser, now=-MIN_POLL_INTERVAL)
+    task = asyncio.create_task(scheduler.async_run(MagicMock(), MagicMock()))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert finished == ["poll"]
+
+
+@pytest.mark.asyncio
+async def test_async_run_logs_unexpected_poll_errors(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    scheduler = PollScheduler(interval=MIN_POLL_INTERVAL)
+    parser = INKBIRDBluetoothDeviceData(Model.INT_11P_B)
+    parser.async_poll = AsyncMock(  # type: ignore[method-assign]
+        side_effect=ValueError("bad payload")
+    )
+    scheduler.add("probe", parser, now=-MIN_POLL_INTERVAL)
+    task = asyncio.create_task(scheduler.async_run(MagicMock(), MagicMock()))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert "Unexpected error polling probe" in caplog.text
+    assert "bad payload" in caplog.text
+    # The failed poll is still rescheduled.
+    assert scheduler.next_due is not None